@@ -0,0 +1,90 @@
+# Copyright (c) 2018 Cloudify Platform Ltd. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+    Measures the cold import time and peak RSS of every operation module
+    referenced by plugin.yaml, each in a fresh interpreter, as an agent
+    does when it starts an operation.
+
+    python benchmarks/bench_import.py [--yaml plugin.yaml] [--repeat N]
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPLEMENTATION = re.compile(r'\baws\.(cloudify_aws(?:\.\w+)+)\.\w+')
+MEASURE = """
+import json, resource, time
+from importlib import import_module
+start = time.perf_counter()
+if {module!r}:
+    import_module({module!r})
+print(json.dumps({{
+    'seconds': time.perf_counter() - start,
+    'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}}))
+"""
+
+
+def entry_point_modules(path):
+    with open(path) as plugin_yaml:
+        return sorted(set(IMPLEMENTATION.findall(plugin_yaml.read())))
+
+
+def measure(module, repeat):
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE='1')
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', MEASURE.format(module=module)], env=env)
+        samples.append(json.loads(output.decode('utf-8').splitlines()[-1]))
+    samples.sort(key=lambda sample: sample['seconds'])
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--yaml', default=os.path.join(ROOT, 'plugin.yaml'))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help='Also write the results to a file')
+    args = parser.parse_args()
+
+    baseline = measure('', args.repeat)
+    results = {}
+    for module in entry_point_modules(args.yaml):
+        results[module] = measure(module, args.repeat)
+
+    print('{0:55} {1:>9} {2:>12}'.format('module', 'ms', 'peak RSS MB'))
+    for module, result in sorted(
+            results.items(), key=lambda item: -item[1]['seconds']):
+        print('{0:55} {1:9.1f} {2:12.1f}'.format(
+            module, result['seconds'] * 1000, result['maxrss_kb'] / 1024.0))
+    seconds = sorted(r['seconds'] for r in results.values())
+    rss = sorted(r['maxrss_kb'] for r in results.values())
+    print('\n{0} modules, median {1:.1f} ms / {2:.1f} MB, '
+          'max {3:.1f} ms / {4:.1f} MB, bare interpreter {5:.1f} MB'.format(
+              len(results),
+              seconds[len(seconds) // 2] * 1000, rss[len(rss) // 2] / 1024.0,
+              seconds[-1] * 1000, rss[-1] / 1024.0,
+              baseline['maxrss_kb'] / 1024.0))
+    if args.json:
+        with open(args.json, 'w') as outfile:
+            json.dump({'baseline': baseline, 'modules': results}, outfile,
+                      indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# Copyright (c) 2018 Cloudify Platform Ltd. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+    Measures the per-call overhead of AWSResourceBase.make_client_call with
+    DEBUG disabled, against the previous eager formatting of the request
+    parameters and of the response.
+
+    python benchmarks/bench_make_client_call.py [--number N]
+"""
+import logging
+import argparse
+import timeit
+
+from mock import MagicMock
+
+from cloudify_aws.common import AWSResourceBase
+
+ZIP_FILE = b'\x00' * (8 * 1024 * 1024)
+RESPONSE = {
+    'Reservations': [
+        {'Instances': [{'InstanceId': 'i-{0:017x}'.format(i),
+                        'State': {'Name': 'running'},
+                        'Tags': [{'Key': 'Name', 'Value': 'vm'}] * 10}]}
+        for i in range(1000)
+    ]
+}
+
+
+def eager_call(iface, name, args):
+    """The formatting make_client_call did before it was made lazy."""
+    iface.logger.debug(
+        'Calling {0} method {1} with parameters: {2}'.format(
+            iface.type_name, name, args))
+    res = getattr(iface.client, name)(**args)
+    iface.logger.debug('Response: {0}'.format(res))
+    return res
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=20)
+    number = parser.parse_args().number
+
+    logger = logging.getLogger('bench_make_client_call')
+    logger.setLevel(logging.INFO)
+    client = MagicMock()
+    client.create_function.return_value = RESPONSE
+    iface = AWSResourceBase(client, logger=logger)
+    iface.type_name = 'Benchmark'
+    args = {'FunctionName': 'bench', 'Code': {'ZipFile': ZIP_FILE}}
+
+    for label, func in [
+            ('eager (before)', lambda: eager_call(
+                iface, 'create_function', args)),
+            ('lazy (after)', lambda: iface.make_client_call(
+                'create_function', args))]:
+        seconds = timeit.timeit(func, number=number) / number
+        print('{0:>16}: {1:10.3f} ms per call'.format(label, seconds * 1000))
+
+
+if __name__ == '__main__':
+    main()
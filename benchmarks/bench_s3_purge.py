@@ -0,0 +1,114 @@
+# Copyright (c) 2018 Cloudify Platform Ltd. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+    Measures how long S3Bucket.delete_objects takes to empty a versioned
+    bucket against an in-memory S3 stand-in which adds a fixed latency to
+    every request, compared with the previous one delete_object per key.
+
+    python benchmarks/bench_s3_purge.py [--objects N] [--latency S]
+"""
+import time
+import logging
+import argparse
+import threading
+
+from cloudify_aws.s3.resources.bucket import S3Bucket
+
+PAGE_SIZE = 1000
+
+
+class FakeS3(object):
+    """Keeps object versions in memory and sleeps on every request."""
+
+    def __init__(self, objects, latency):
+        self.latency = latency
+        self.requests = 0
+        self.versions = dict(
+            (('key{0:08d}'.format(i), 'v1'), True) for i in range(objects))
+        self._lock = threading.Lock()
+
+    def _request(self):
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+
+    def can_paginate(self, name):
+        return name == 'list_object_versions'
+
+    def get_paginator(self, name):
+        return self
+
+    def paginate(self, Bucket):
+        marker = None
+        while True:
+            self._request()
+            with self._lock:
+                page = sorted(v for v in self.versions
+                              if marker is None or v > marker)[:PAGE_SIZE]
+            if not page:
+                return
+            marker = page[-1]
+            yield {'Versions': [{'Key': key, 'VersionId': version}
+                                for key, version in page]}
+
+    def list_objects(self, Bucket):
+        self._request()
+        with self._lock:
+            keys = sorted(set(key for key, _ in self.versions))[:PAGE_SIZE]
+        return {'Contents': [{'Key': key} for key in keys]}
+
+    def delete_object(self, Bucket, Key):
+        self._request()
+        with self._lock:
+            self.versions.pop((Key, 'v1'), None)
+
+    def delete_objects(self, Bucket, Delete):
+        self._request()
+        with self._lock:
+            for obj in Delete['Objects']:
+                self.versions.pop((obj['Key'], obj['VersionId']), None)
+        return {}
+
+
+def serial_purge(client, bucket):
+    """What delete_objects did before: one request per key, first page."""
+    for content in client.list_objects(Bucket=bucket).get('Contents', []):
+        client.delete_object(Bucket=bucket, Key=content['Key'])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--objects', type=int, default=2000)
+    parser.add_argument('--latency', type=float, default=0.01)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    logger = logging.getLogger('bench_s3_purge')
+    logger.setLevel(logging.WARNING)
+
+    for label, purge in [
+            ('serial (before)', serial_purge),
+            ('batched (after)', lambda client, bucket: S3Bucket(
+                None, client=client, logger=logger).delete_objects(
+                    bucket, max_workers=args.workers))]:
+        client = FakeS3(args.objects, args.latency)
+        start = time.time()
+        purge(client, 'bench')
+        print('{0:>16}: {1:8.2f} s, {2:6d} requests, {3:6d} versions '
+              'left'.format(label, time.time() - start, client.requests,
+                            len(client.versions)))
+
+
+if __name__ == '__main__':
+    main()
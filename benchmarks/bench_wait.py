@@ -0,0 +1,100 @@
+# Copyright (c) 2018 Cloudify Platform Ltd. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+    Measures the wall-clock time until wait_for_status sees a resource
+    which becomes ready after a while, when every pending status is an
+    OperationRetry rescheduled by the manager, compared with polling in
+    the operation first. Times are scaled down, e.g. --scale 10 turns a
+    40 seconds creation and 30 seconds retry interval into 4 and 3.
+
+    python benchmarks/bench_wait.py [--ready S] [--retry-interval S]
+"""
+import time
+import argparse
+
+from cloudify.mocks import MockCloudifyContext
+from cloudify.state import current_ctx
+
+from cloudify_aws.common import decorators
+from cloudify_aws.common.constants import WAIT_POLICY
+
+
+class FakeResource(object):
+    """Pending until ready_at, counting the status requests."""
+
+    resource_id = 'fake'
+    status_waiters = {}
+
+    def __init__(self, ready_at):
+        self.ready_at = ready_at
+        self.requests = 0
+
+    @property
+    def status(self):
+        self.requests += 1
+        return 'available' if time.time() >= self.ready_at else 'pending'
+
+    def invalidate_properties(self):
+        pass
+
+    def report_progress(self):
+        pass
+
+
+def wait(resource, policy, retry_interval, setup):
+    """Runs operation attempts until the resource is available."""
+    attempts = 0
+    while True:
+        attempts += 1
+        # Loading the plugin, the decorators and the client.
+        time.sleep(setup)
+        status = resource.status
+        if status == 'pending' and policy['budget'] > 0:
+            status = decorators._wait_in_process(
+                resource, status, ['pending'], ['available'], policy)
+        if status == 'available':
+            return attempts
+        time.sleep(retry_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ready', type=float, default=40)
+    parser.add_argument('--retry-interval', type=float, default=30)
+    parser.add_argument('--setup', type=float, default=2)
+    parser.add_argument('--scale', type=float, default=10)
+    parser.add_argument('--budgets', type=float, nargs='+',
+                        default=[WAIT_POLICY['budget'], 120],
+                        help='The budgets of the hybrid waits to compare')
+    args = parser.parse_args()
+    current_ctx.set(MockCloudifyContext())
+
+    policy = dict((key, value / args.scale if key != 'multiplier' else
+                   value) for key, value in WAIT_POLICY.items())
+    for label, budget in [('retry (before)', 0)] + [
+            ('hybrid {0:g} s'.format(budget), budget / args.scale)
+            for budget in args.budgets]:
+        start = time.time()
+        resource = FakeResource(start + args.ready / args.scale)
+        attempts = wait(resource, dict(policy, budget=budget),
+                        args.retry_interval / args.scale,
+                        args.setup / args.scale)
+        elapsed = (time.time() - start) * args.scale
+        print('{0:>15}: ready after {1:6.1f} s (scaled back), {2} '
+              'attempts, {3} status requests'.format(
+                  label, elapsed, attempts, resource.requests))
+
+
+if __name__ == '__main__':
+    main()
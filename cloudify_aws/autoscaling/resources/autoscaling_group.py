@@ -22,6 +22,7 @@
 from cloudify.exceptions import OperationRetry, NonRecoverableError
 
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.autoscaling import AutoscalingBase
 
 # Boto
@@ -52,6 +53,7 @@ class AutoscalingGroup(AutoscalingBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -79,6 +81,7 @@ class AutoscalingGroup(AutoscalingBase):
         """
         return self.make_client_call('create_auto_scaling_group', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS Autoscaling Group.
@@ -89,6 +92,7 @@ class AutoscalingGroup(AutoscalingBase):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def update(self, params=None):
         """
             Updates an existing AWS Autoscaling Group.
@@ -99,6 +103,7 @@ class AutoscalingGroup(AutoscalingBase):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def remove_instances(self, params=None):
         """
             Deletes an existing AWS Autoscaling Group.
@@ -25,6 +25,7 @@ from cloudify.exceptions import NonRecoverableError
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.autoscaling import AutoscalingBase
 
 RESOURCE_TYPE = 'Autoscaling Launch Configuration'
@@ -52,6 +53,7 @@ class AutoscalingLaunchConfiguration(AutoscalingBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -76,6 +78,7 @@ class AutoscalingLaunchConfiguration(AutoscalingBase):
         """
         return self.make_client_call('create_launch_configuration', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS Autoscaling Autoscaling
@@ -18,6 +18,7 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.autoscaling import AutoscalingBase
 # Boto
 from botocore.exceptions import ClientError, ParamValidationError
@@ -40,6 +41,7 @@ class AutoscalingNotification(AutoscalingBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -64,6 +66,7 @@ class AutoscalingNotification(AutoscalingBase):
         """
         return self.make_client_call('put_notification_configuration', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing Autoscaling Group Notification Configuration.
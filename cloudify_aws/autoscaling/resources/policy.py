@@ -21,6 +21,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Local imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.autoscaling import AutoscalingBase
 
 RESOURCE_TYPE = 'Autoscaling Policy'
@@ -42,6 +43,7 @@ class AutoscalingPolicy(AutoscalingBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -66,6 +68,7 @@ class AutoscalingPolicy(AutoscalingBase):
         """
         return self.make_client_call('put_scaling_policy', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS Autoscaling Policy.
@@ -23,7 +23,11 @@ from cloudify_aws.common._compat import text_type
 from cloudify.exceptions import OperationRetry
 
 # Local imports
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 from cloudify_aws.autoscaling.resources import autoscaling_group
 
@@ -144,7 +148,7 @@ class TestAutoscalingGroup(TestBase):
             iface=None,
             params=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
 
         self.fake_client.create_auto_scaling_group.assert_called_with(
             AutoScalingGroupName='test-autoscaling1',
@@ -187,7 +191,7 @@ class TestAutoscalingGroup(TestBase):
 
         autoscaling_group.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
 
         self.fake_client.delete_auto_scaling_group.assert_called_with(
             AutoScalingGroupName='test-autoscaling1'
@@ -234,7 +238,7 @@ class TestAutoscalingGroup(TestBase):
         autoscaling_group.stop(ctx=_ctx, resource_config=None,
                                iface=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
         self.fake_client.update_auto_scaling_group.assert_not_called()
         self.fake_client.describe_auto_scaling_groups.assert_called_with(
             AutoScalingGroupNames=['test-autoscaling1'])
@@ -256,7 +260,7 @@ class TestAutoscalingGroup(TestBase):
             'instances.'
         )
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
         self.fake_client.update_auto_scaling_group.assert_not_called()
         self.fake_client.describe_auto_scaling_groups.assert_called_with(
             AutoScalingGroupNames=['test-autoscaling1'])
@@ -278,7 +282,7 @@ class TestAutoscalingGroup(TestBase):
             'before deletion.'
         )
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
         self.fake_client.update_auto_scaling_group.assert_called_with(
             AutoScalingGroupName='test-autoscaling1', DesiredCapacity=0,
             MaxSize=0, MinSize=0)
@@ -21,7 +21,11 @@ from mock import patch, MagicMock
 from cloudify.state import current_ctx
 
 # Local imports
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 from cloudify_aws.autoscaling.resources import launch_configuration
 
@@ -136,7 +140,7 @@ class TestAutoscalingLaunchConfiguration(TestBase):
         launch_configuration.create(ctx=_ctx, resource_config=None,
                                     iface=None, params=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
 
         self.fake_client.create_launch_configuration.assert_called_with(
             InstanceId='aws_id',
@@ -170,7 +174,7 @@ class TestAutoscalingLaunchConfiguration(TestBase):
         launch_configuration.delete(ctx=_ctx, resource_config={},
                                     iface=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
 
         self.fake_client.delete_launch_configuration.assert_called_with(
             LaunchConfigurationName='test-lauchconfig3'
@@ -22,7 +22,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.autoscaling.resources import lifecycle_hook
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 
@@ -114,7 +118,7 @@ class TestAutoscalingLifecycleHook(TestBase):
         lifecycle_hook.create(ctx=_ctx, resource_config=None, iface=None,
                               params=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
 
         self.fake_client.put_lifecycle_hook.assert_called_with(
             AutoScalingGroupName='aws_id',
@@ -135,7 +139,7 @@ class TestAutoscalingLifecycleHook(TestBase):
 
         lifecycle_hook.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
 
         self.fake_client.delete_lifecycle_hook.assert_called_with(
             AutoScalingGroupName='aws_id',
@@ -22,7 +22,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.autoscaling.resources import policy
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 
@@ -112,7 +116,7 @@ class TestAutoscalingPolicy(TestBase):
 
         policy.create(ctx=_ctx, resource_config=None, iface=None, params=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
 
         self.fake_client.put_scaling_policy.assert_called_with(
             AdjustmentType='ExactCapacity',
@@ -134,7 +138,7 @@ class TestAutoscalingPolicy(TestBase):
 
         policy.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('autoscaling', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('autoscaling', **CLIENT_KWARGS)
 
         self.fake_client.delete_policy.assert_called_with(
             AutoScalingGroupName='group_id', PolicyName='test-autoscaling2'
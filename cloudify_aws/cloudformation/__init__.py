@@ -17,8 +17,8 @@
     AWS CloudFormation base interface
 """
 # Cloudify AWS
-from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import AWSResourceBase, memoized_properties
+from cloudify_aws.common.connection import ClientFactory
 
 # pylint: disable=R0903
 
@@ -30,11 +30,12 @@ class AWSCloudFormationBase(AWSResourceBase):
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         AWSResourceBase.__init__(
             self,
-            client or Boto3Connection(ctx_node).client('cloudformation'),
+            client or ClientFactory(ctx_node, 'cloudformation'),
             resource_id=resource_id,
             logger=logger)
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         raise NotImplementedError()
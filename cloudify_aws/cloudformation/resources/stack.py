@@ -19,15 +19,20 @@
 # Standard imports
 import time
 import json
+import math
 from datetime import datetime
+from functools import wraps
 
 # Third party imports
 from botocore.exceptions import ClientError
-from cloudify.exceptions import NonRecoverableError
+from cloudify import ctx as _ctx
+from cloudify.exceptions import NonRecoverableError, OperationRetry
 
 # Local imports
+from cloudify_common_sdk.utils import get_ctx_instance
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.cloudformation import AWSCloudFormationBase
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -48,6 +53,29 @@ IS_DRIFTED = 'is_drifted'
 DRIFTED_STATUS = 'DRIFTED'
 DRIFT_INFO = 'DriftInformation'
 STACK_DRIFT_STATUS = 'StackDriftStatus'
+DETECTION_IN_PROGRESS = 'DETECTION_IN_PROGRESS'
+DETECTION_COMPLETE = 'DETECTION_COMPLETE'
+# Runtime property with the StackDriftDetectionId of a detection which
+# is in progress and the execution which started it, and the seconds
+# before checking it again.
+DRIFT_DETECTION = 'drift_detection_id'
+DRIFT_DETECTION_INTERVAL = 10
+STACK_EVENTS = 'StackEvents'
+EVENT_ID = 'EventId'
+RESOURCE_STATUS = 'ResourceStatus'
+FAILED_SUFFIX = '_FAILED'
+# The EventId of the newest stack event already reported, '' to report
+# every event of a stack which is being created.
+EVENTS_CURSOR = 'events_cursor'
+# The time before which an operation cannot end and the execution which
+# set it, by operation name.
+MINIMUM_WAIT_DEADLINES = 'minimum_wait_deadlines'
+# The statuses of a stack which failed to be created or deleted.
+CREATE_FAILED_STATUSES = ['CREATE_FAILED',
+                          'ROLLBACK_IN_PROGRESS',
+                          'ROLLBACK_FAILED',
+                          'ROLLBACK_COMPLETE']
+DELETE_FAILED_STATUSES = ['DELETE_FAILED']
 
 
 class CloudFormationStack(AWSCloudFormationBase):
@@ -63,6 +91,7 @@ class CloudFormationStack(AWSCloudFormationBase):
         self._describe_call = 'describe_stacks'
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -93,6 +122,7 @@ class CloudFormationStack(AWSCloudFormationBase):
         """
         return self.make_client_call('create_stack', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS CloudFormation Stack.
@@ -109,36 +139,132 @@ class CloudFormationStack(AWSCloudFormationBase):
         """
         params = {RESOURCE_NAME: self.resource_id}
         try:
-            resources = \
-                self.client.list_stack_resources(**params)
-        except ClientError:
+            return list(self.iter_client_call(
+                'list_stack_resources', params, STACK_RESOURCES))
+        except NonRecoverableError:
             return []
-        else:
-            return resources.get(STACK_RESOURCES, [])
 
-    def detect_stack_drifts(self):
+    @invalidates_properties
+    def start_drift_detection(self):
         """
-            Invoke Drifts detection of AWS CloudFormation Stack.
+            Starts a drift detection of AWS CloudFormation Stack.
+
+        :returns: The StackDriftDetectionId, or None if the stack cannot
+            be checked for drift.
         """
-        params = {RESOURCE_NAME: self.resource_id}
         try:
-            stack_drift_detection_id = \
-                self.client.detect_stack_drift(**params).get(
+            return self.client.detect_stack_drift(
+                **{RESOURCE_NAME: self.resource_id}).get(
                     STACK_DRIFT_DETECTION_ID)
-            detection_status_response = \
-                self.client.describe_stack_drift_detection_status(
-                    StackDriftDetectionId=stack_drift_detection_id)
-            # Wait for drift detections to end.
-            while detection_status_response[STACK_DETECTION_STATUS] == \
-                    'DETECTION_IN_PROGRESS':
-                time.sleep(1)
-                detection_status_response = \
-                    self.client.describe_stack_drift_detection_status(
-                        StackDriftDetectionId=stack_drift_detection_id)
-        except ClientError:
-            pass
-        else:
-            return detection_status_response[STACK_DETECTION_STATUS]
+        except ClientError as error:
+            self.logger.debug('Drift detection not started: {0}'.format(
+                error))
+
+    def drift_detection_status(self, detection_id):
+        """
+            Gets the DetectionStatus of a drift detection, or None if it
+            is unknown.
+        """
+        try:
+            return self.client.describe_stack_drift_detection_status(
+                StackDriftDetectionId=detection_id)[STACK_DETECTION_STATUS]
+        except ClientError as error:
+            self.logger.debug('Drift detection {0} not found: {1}'.format(
+                detection_id, error))
+
+    def new_events(self, cursor=None):
+        """
+            Lists the events of AWS CloudFormation Stack which are newer
+            than the cursor, oldest first. The events are listed newest
+            first, so the pages after the cursor are never requested.
+
+        :param cursor: The EventId of the newest event already seen,
+            None to list every event.
+        """
+        params = {RESOURCE_NAME: self.resource_id}
+        events = []
+        try:
+            for event in self.iter_client_call(
+                    'describe_stack_events', params, STACK_EVENTS):
+                if event[EVENT_ID] == cursor:
+                    break
+                events.append(event)
+        except NonRecoverableError as error:
+            self.logger.debug('Stack events not listed: {0}'.format(error))
+        events.reverse()
+        return events
+
+    def latest_event_id(self):
+        """
+            Gets the EventId of the newest event of AWS CloudFormation
+            Stack, or '' if there is none.
+        """
+        params = {RESOURCE_NAME: self.resource_id}
+        try:
+            for event in self.iter_client_call(
+                    'describe_stack_events', params, STACK_EVENTS,
+                    max_items=1):
+                return event[EVENT_ID]
+        except NonRecoverableError as error:
+            self.logger.debug('Stack events not listed: {0}'.format(error))
+        return ''
+
+    def report_progress(self):
+        """
+            Logs the stack events since the last call, and fails on the
+            first event of a resource which failed, instead of waiting
+            for the stack to roll back.
+        """
+        if not self.resource_id:
+            return
+        instance = get_ctx_instance()
+        cursor = instance.runtime_properties.get(EVENTS_CURSOR)
+        if cursor is None:
+            # Only the events from now on are relevant.
+            instance.runtime_properties[EVENTS_CURSOR] = \
+                self.latest_event_id()
+            return
+        events = self.new_events(cursor)
+        if not events:
+            return
+        instance.runtime_properties[EVENTS_CURSOR] = events[-1][EVENT_ID]
+        for event in events:
+            self.logger.info('{0} {1} ({2}): {3} {4}'.format(
+                self.type_name,
+                event.get('LogicalResourceId'),
+                event.get('ResourceType'),
+                event.get(RESOURCE_STATUS),
+                event.get('ResourceStatusReason') or '').strip())
+        for event in events:
+            if (event.get(RESOURCE_STATUS) or '').endswith(FAILED_SUFFIX):
+                raise NonRecoverableError(
+                    '{0} {1} failed: {2} {3} {4}, reason: {5}'.format(
+                        self.type_name,
+                        self.resource_id,
+                        event.get('LogicalResourceId'),
+                        event.get('ResourceType'),
+                        event.get(RESOURCE_STATUS),
+                        event.get('ResourceStatusReason')))
+
+    def raise_on_status(self, statuses):
+        """
+            Fails the operation if the stack is in one of statuses.
+        """
+        status = self.status
+        if status in statuses:
+            raise NonRecoverableError(
+                'Stack {0} failed in status {1}, reason: {2}'.format(
+                    self.resource_id, status,
+                    self.properties.get('StackStatusReason')))
+
+    def wait_for_status(self):
+        """
+            Fails a stack which was not created, and keeps it pending
+            until the minimum wait time of the operation has elapsed.
+        """
+        self.raise_on_status(CREATE_FAILED_STATUSES)
+        arrived_at_min_wait_time(_ctx)
+        return False
 
     def resources_drifts(self):
         """
@@ -150,12 +276,49 @@ class CloudFormationStack(AWSCloudFormationBase):
                   DRIFT_STATUS_FILTERS: ['DELETED', 'MODIFIED']
                   }
         try:
-            resources = \
-                self.client.describe_stack_resource_drifts(**params)
-        except ClientError:
+            return list(self.iter_client_call(
+                'describe_stack_resource_drifts', params,
+                STACK_RESOURCES_DRIFTS))
+        except NonRecoverableError:
             return []
-        else:
-            return resources.get(STACK_RESOURCES_DRIFTS, [])
+
+
+def _minimum_wait_deadline(ctx):
+    """
+        Gets the minimum wait deadline of the operation, None if this
+        execution has not set one.
+    """
+    deadlines = ctx.instance.runtime_properties.get(
+        MINIMUM_WAIT_DEADLINES) or {}
+    deadline = deadlines.get(ctx.operation.name)
+    if isinstance(deadline, dict) and \
+            deadline.get('execution_id') == ctx.execution_id:
+        return deadline['deadline']
+
+
+def clear_minimum_wait(ctx):
+    """Drops the minimum wait deadline of the operation."""
+    deadlines = dict(ctx.instance.runtime_properties.get(
+        MINIMUM_WAIT_DEADLINES) or {})
+    if deadlines.pop(ctx.operation.name, None) is not None:
+        ctx.instance.runtime_properties[MINIMUM_WAIT_DEADLINES] = deadlines
+
+
+def clears_minimum_wait(function):
+    """
+        Drops the minimum wait deadline of an operation which fails, so
+        that running it again starts over.
+    """
+    @wraps(function)
+    def wrapper(**kwargs):
+        try:
+            return function(**kwargs)
+        except OperationRetry:
+            raise
+        except Exception:
+            clear_minimum_wait(kwargs['ctx'])
+            raise
+    return wrapper
 
 
 @decorators.aws_resource(CloudFormationStack, RESOURCE_TYPE)
@@ -166,6 +329,7 @@ def prepare(ctx, resource_config, **_):
 
 
 @decorators.aws_resource(CloudFormationStack, RESOURCE_TYPE)
+@clears_minimum_wait
 @decorators.wait_for_status(
     status_good=['CREATE_COMPLETE', 'UPDATE_COMPLETE'],
     status_pending=['CREATE_IN_PROGRESS',
@@ -193,7 +357,9 @@ def create(ctx, iface, resource_config, minimum_wait_time=None, **_):
     # so this is handled here.
     if not iface.exists:
         # Actually create the resource
+        ctx.instance.runtime_properties[EVENTS_CURSOR] = ''
         iface.create(resource_config)
+        arrived_at_min_wait_time(ctx, minimum_wait_time)
     elif iface.exists and iface.status in ['CREATE_COMPLETE',
                                            'UPDATE_COMPLETE',
                                            'CREATE_IN_PROGRESS',
@@ -206,9 +372,6 @@ def create(ctx, iface, resource_config, minimum_wait_time=None, **_):
                 iface.resource_id, iface.status, iface.properties.get(
                     'StackStatusReason')))
 
-    if minimum_wait_time is not None and minimum_wait_time > 0:
-        arrived_at_min_wait_time(ctx, minimum_wait_time)
-
 
 def test(_value):
     if isinstance(_value, datetime):
@@ -240,6 +403,7 @@ def start(ctx, iface, **_):
 
 @decorators.aws_resource(CloudFormationStack, RESOURCE_TYPE,
                          ignore_properties=True)
+@clears_minimum_wait
 @decorators.wait_for_delete(
     status_deleted=['DELETE_COMPLETE'],
     status_pending=['DELETE_IN_PROGRESS'],
@@ -252,10 +416,14 @@ def delete(ctx, iface, resource_config, minimum_wait_time=None, **_):
     name = resource_config.get(RESOURCE_NAME)
     if not name:
         name = iface.resource_id
-    iface.delete({RESOURCE_NAME: name})
-
-    if minimum_wait_time is not None and minimum_wait_time > 0:
-        arrived_at_min_wait_time(ctx, minimum_wait_time)
+    # The operation runs again on every retry, until it returns.
+    if _minimum_wait_deadline(ctx) is None:
+        ctx.instance.runtime_properties[EVENTS_CURSOR] = \
+            iface.latest_event_id()
+        iface.delete({RESOURCE_NAME: name})
+    else:
+        iface.raise_on_status(DELETE_FAILED_STATUSES)
+    arrived_at_min_wait_time(ctx, minimum_wait_time)
 
 
 @decorators.aws_resource(CloudFormationStack, RESOURCE_TYPE)
@@ -270,10 +438,33 @@ def _pull(ctx, iface):
         # If the stack was deleted so it drifted.
         ctx.instance.runtime_properties[IS_DRIFTED] = True
         return
-    ctx.logger.debug(
-        "Detecting stack {stack_id} drifts.".format(
-            stack_id=iface.resource_id))
-    iface.detect_stack_drifts()
+    # The detection runs while the operation is retried, so that stacks
+    # are checked concurrently without holding a worker each. A detection
+    # left by a failed or cancelled execution is never reused.
+    detection = ctx.instance.runtime_properties.pop(DRIFT_DETECTION, None)
+    detection_id = None
+    if isinstance(detection, dict) and \
+            detection.get('execution_id') == ctx.execution_id:
+        detection_id = detection.get('id')
+    if not detection_id:
+        ctx.logger.debug(
+            "Detecting stack {stack_id} drifts.".format(
+                stack_id=iface.resource_id))
+        detection_id = iface.start_drift_detection()
+    status = detection_id and iface.drift_detection_status(detection_id)
+    if status == DETECTION_IN_PROGRESS:
+        ctx.instance.runtime_properties[DRIFT_DETECTION] = {
+            'id': detection_id, 'execution_id': ctx.execution_id}
+        raise OperationRetry(
+            'Detecting stack {0} drifts ({1}).'.format(
+                iface.resource_id, detection_id),
+            retry_after=DRIFT_DETECTION_INTERVAL)
+    if detection_id and status != DETECTION_COMPLETE:
+        ctx.logger.warning(
+            'Drift detection {0} of stack {1} ended with {2}.'.format(
+                detection_id, iface.resource_id, status))
+    # The drift status of the stack changed with the detection.
+    iface.invalidate_properties()
     update_runtime_properties_with_stack_info(ctx, iface)
     resources = iface.list_resources()
     ctx.logger.debug("Updating stack resources state.")
@@ -333,13 +524,33 @@ def set_is_drifted_runtime_property(ctx, props):
 
 
 # min_wait_time should be in seconds.
-def arrived_at_min_wait_time(ctx, minimum_wait_time):
-    ctx.logger.info('Minimum wait time provided: {}'.format(minimum_wait_time))
-    count = 0
-    ten_sec_to_sleep = 10
-    while count < minimum_wait_time:
-        time.sleep(ten_sec_to_sleep)
-        count += ten_sec_to_sleep
-        ctx.logger.info('The time elapsed is: {}'.format(count))
+def arrived_at_min_wait_time(ctx, minimum_wait_time=None):
+    """
+        Raises OperationRetry until minimum_wait_time seconds have passed
+        since the first call of the operation, instead of sleeping. The
+        deadline is kept in the runtime properties between the retries
+        of an execution.
 
+    :param minimum_wait_time: Starts the wait of the operation, if there
+        is none yet.
+    """
+    deadline = _minimum_wait_deadline(ctx)
+    if deadline is None:
+        if not minimum_wait_time or minimum_wait_time <= 0:
+            return
+        ctx.logger.info(
+            'Minimum wait time provided: {}'.format(minimum_wait_time))
+        deadline = time.time() + minimum_wait_time
+        deadlines = dict(ctx.instance.runtime_properties.get(
+            MINIMUM_WAIT_DEADLINES) or {})
+        deadlines[ctx.operation.name] = {
+            'deadline': deadline, 'execution_id': ctx.execution_id}
+        ctx.instance.runtime_properties[MINIMUM_WAIT_DEADLINES] = deadlines
+    remaining = deadline - time.time()
+    if remaining > 0:
+        raise OperationRetry(
+            'Waiting {} more seconds of the minimum wait time.'.format(
+                int(math.ceil(remaining))),
+            retry_after=int(math.ceil(remaining)))
+    clear_minimum_wait(ctx)
     ctx.logger.info('Minimum wait time elapsed.')
@@ -20,11 +20,13 @@ import copy
 from mock import patch, MagicMock
 
 from cloudify.state import current_ctx
+from cloudify.exceptions import OperationRetry, NonRecoverableError
 
 # Local imports
 from cloudify_aws.cloudformation.resources import stack
 from cloudify_aws.common.tests.test_base import (TestBase,
                                                  CLIENT_CONFIG,
+                                                 CLIENT_KWARGS,
                                                  DELETE_RESPONSE)
 
 # Constants
@@ -118,7 +120,7 @@ class TestCloudFormationStack(TestBase):
         })
         stack.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('cloudformation', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cloudformation', **CLIENT_KWARGS)
 
         try:
             self.fake_client.create_stack.assert_called_with(
@@ -135,6 +137,7 @@ class TestCloudFormationStack(TestBase):
                 raise e
 
         updated_runtime_prop = copy.deepcopy(RUNTIMEPROP_AFTER_CREATE)
+        updated_runtime_prop[stack.EVENTS_CURSOR] = ''
         updated_runtime_prop['create_response'] = {
             'StackName': 'test-cloudformation1',
             'StackStatus': 'CREATE_COMPLETE'
@@ -176,7 +179,7 @@ class TestCloudFormationStack(TestBase):
 
         stack.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('cloudformation', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cloudformation', **CLIENT_KWARGS)
 
         self.fake_client.delete_stack. \
             assert_called_with(StackName='test-cloudformation1')
@@ -184,6 +187,165 @@ class TestCloudFormationStack(TestBase):
         self.assertEqual(_ctx.instance.runtime_properties,
                          {'__deleted': True})
 
+    def test_delete_minimum_wait_time(self):
+        _ctx = \
+            self.get_mock_ctx(
+                'test_delete',
+                test_properties=NODE_PROPERTIES,
+                test_runtime_properties=RUNTIMEPROP_AFTER_CREATE,
+                type_hierarchy=STACK_TH,
+                ctx_operation_name='cloudify.interfaces.lifecycle.delete')
+
+        current_ctx.set(_ctx)
+        self.fake_client.describe_stacks = MagicMock(return_value={
+            'Stacks': [{'StackName': 'test-cloudformation1',
+                        'StackStatus': 'DELETE_COMPLETE'}]})
+        self.fake_client.delete_stack = MagicMock(return_value=DELETE_RESPONSE)
+
+        with patch('cloudify_aws.cloudformation.resources.stack.time') \
+                as fake_time:
+            fake_time.time.return_value = 1000
+            with self.assertRaises(OperationRetry) as error:
+                stack.delete(ctx=_ctx, resource_config={}, iface=None,
+                             minimum_wait_time=60)
+            self.assertEqual(error.exception.retry_after, 60)
+
+            # A retry within the minimum wait time, without deleting again.
+            fake_time.time.return_value = 1045
+            with self.assertRaises(OperationRetry) as error:
+                stack.delete(ctx=_ctx, resource_config={}, iface=None,
+                             minimum_wait_time=60)
+            self.assertEqual(error.exception.retry_after, 15)
+            self.assertEqual(self.fake_client.delete_stack.call_count, 1)
+
+            fake_time.time.return_value = 1060
+            stack.delete(ctx=_ctx, resource_config={}, iface=None,
+                         minimum_wait_time=60)
+
+        self.assertEqual(self.fake_client.delete_stack.call_count, 1)
+        self.assertEqual(_ctx.instance.runtime_properties,
+                         {'__deleted': True})
+
+    def test_delete_minimum_wait_time_rerun(self):
+        runtime_properties = copy.deepcopy(RUNTIMEPROP_AFTER_CREATE)
+        runtime_properties[stack.MINIMUM_WAIT_DEADLINES] = {
+            'cloudify.interfaces.lifecycle.delete': {
+                'deadline': 2000, 'execution_id': 'cancelled'}}
+        _ctx = \
+            self.get_mock_ctx(
+                'test_delete',
+                test_properties=NODE_PROPERTIES,
+                test_runtime_properties=runtime_properties,
+                type_hierarchy=STACK_TH,
+                ctx_operation_name='cloudify.interfaces.lifecycle.delete')
+        _ctx._execution_id = 'current'
+        current_ctx.set(_ctx)
+        self.fake_client.describe_stacks = MagicMock(return_value={
+            'Stacks': [{'StackName': 'test-cloudformation1',
+                        'StackStatus': 'DELETE_IN_PROGRESS'}]})
+        self.fake_client.delete_stack = MagicMock(return_value=DELETE_RESPONSE)
+
+        with patch('cloudify_aws.cloudformation.resources.stack.time') \
+                as fake_time:
+            fake_time.time.return_value = 1000
+            with self.assertRaises(OperationRetry):
+                stack.delete(ctx=_ctx, resource_config={}, iface=None,
+                             minimum_wait_time=60)
+            # The deadline of another execution is not waited for.
+            self.fake_client.delete_stack.assert_called_once_with(
+                StackName='test-cloudformation1')
+            self.assertEqual(
+                _ctx.instance.runtime_properties[
+                    stack.MINIMUM_WAIT_DEADLINES][
+                    'cloudify.interfaces.lifecycle.delete'],
+                {'deadline': 1060, 'execution_id': 'current'})
+
+            # A stack which fails to delete fails before the deadline.
+            self.fake_client.describe_stacks = MagicMock(return_value={
+                'Stacks': [{'StackName': 'test-cloudformation1',
+                            'StackStatus': 'DELETE_FAILED',
+                            'StackStatusReason': 'Bucket not empty'}]})
+            fake_time.time.return_value = 1010
+            with self.assertRaises(NonRecoverableError) as error:
+                stack.delete(ctx=_ctx, resource_config={}, iface=None,
+                             minimum_wait_time=60)
+        self.assertIn('Bucket not empty', str(error.exception))
+        self.assertEqual(
+            _ctx.instance.runtime_properties[stack.MINIMUM_WAIT_DEADLINES],
+            {})
+        self.assertEqual(self.fake_client.delete_stack.call_count, 1)
+
+    def test_create_minimum_wait_time_failed(self):
+        _ctx = self.get_mock_ctx(
+            'test_create', test_properties=NODE_PROPERTIES,
+            test_runtime_properties=RUNTIMEPROP_AFTER_CREATE,
+            type_hierarchy=STACK_TH,
+            ctx_operation_name='cloudify.interfaces.lifecycle.create')
+        _ctx.operation._operation_context['retry_number'] = 1
+        _ctx.instance.runtime_properties[stack.MINIMUM_WAIT_DEADLINES] = {
+            'cloudify.interfaces.lifecycle.create': {
+                'deadline': 2000, 'execution_id': None}}
+        current_ctx.set(_ctx)
+        self.fake_client.describe_stacks = MagicMock(return_value={
+            'Stacks': [{'StackName': 'test-cloudformation1',
+                        'StackStatus': 'ROLLBACK_COMPLETE'}]})
+
+        with patch('cloudify_aws.cloudformation.resources.stack.time') \
+                as fake_time:
+            fake_time.time.return_value = 1000
+            with self.assertRaises(NonRecoverableError):
+                stack.create(ctx=_ctx, resource_config=None, iface=None,
+                             minimum_wait_time=30)
+        self.assertEqual(
+            _ctx.instance.runtime_properties[stack.MINIMUM_WAIT_DEADLINES],
+            {})
+
+    def test_create_minimum_wait_time(self):
+        _ctx = self.get_mock_ctx(
+            'test_create', test_properties=NODE_PROPERTIES,
+            test_runtime_properties=RUNTIME_PROPERTIES,
+            type_hierarchy=STACK_TH,
+            ctx_operation_name='cloudify.interfaces.lifecycle.create')
+        current_ctx.set(_ctx)
+        self.fake_client.describe_stacks = MagicMock(side_effect=[
+            {},
+            {'Stacks': [{'StackName': 'test-cloudformation1',
+                         'StackStatus': 'CREATE_COMPLETE'}]},
+            {'Stacks': [{'StackName': 'test-cloudformation1',
+                         'StackStatus': 'CREATE_COMPLETE'}]},
+        ])
+        self.fake_client.create_stack = MagicMock(return_value={
+            'StackId': 'test-cloudformation1'
+        })
+
+        with patch('cloudify_aws.cloudformation.resources.stack.time') \
+                as fake_time:
+            fake_time.time.return_value = 1000
+            with self.assertRaises(OperationRetry) as error:
+                stack.create(ctx=_ctx, resource_config=None, iface=None,
+                             minimum_wait_time=30)
+            self.assertEqual(error.exception.retry_after, 30)
+
+            # The retries wait for the status, without creating again.
+            _ctx.operation._operation_context['retry_number'] = 1
+            fake_time.time.return_value = 1020
+            with self.assertRaises(OperationRetry) as error:
+                stack.create(ctx=_ctx, resource_config=None, iface=None,
+                             minimum_wait_time=30)
+            self.assertEqual(error.exception.retry_after, 10)
+
+            fake_time.time.return_value = 1030
+            stack.create(ctx=_ctx, resource_config=None, iface=None,
+                         minimum_wait_time=30)
+
+        self.assertEqual(self.fake_client.create_stack.call_count, 1)
+        self.assertEqual(
+            _ctx.instance.runtime_properties[stack.MINIMUM_WAIT_DEADLINES],
+            {})
+        self.assertEqual(
+            _ctx.instance.runtime_properties['create_response'][
+                'StackStatus'], 'CREATE_COMPLETE')
+
     def test_pull(self):
         _ctx = \
             self.get_mock_ctx('test_pull',
@@ -232,6 +394,80 @@ class TestCloudFormationStack(TestBase):
         self.assertSetEqual(set(actual_saved_properties),
                             set(expected_saved_properties))
 
+    def test_pull_detection_in_progress(self):
+        _ctx = \
+            self.get_mock_ctx('test_pull',
+                              test_properties=NODE_PROPERTIES,
+                              test_runtime_properties=copy.deepcopy(
+                                  RUNTIMEPROP_AFTER_START),
+                              type_hierarchy=STACK_TH,
+                              ctx_operation_name='cloudify.interfaces.'
+                                                 'lifecycle.pull')
+        current_ctx.set(_ctx)
+        self.fake_client.describe_stacks = MagicMock(return_value={
+            'Stacks': [{'StackId': '2', 'StackName': 'test-cloudformation1'}]
+        })
+        self.fake_client.detect_stack_drift = MagicMock(
+            return_value={'StackDriftDetectionId': 'fake-detection-id'})
+        self.fake_client.describe_stack_drift_detection_status = MagicMock(
+            return_value={'DetectionStatus': 'DETECTION_IN_PROGRESS'})
+
+        with self.assertRaises(OperationRetry):
+            stack.pull(ctx=_ctx)
+        self.assertEqual(
+            _ctx.instance.runtime_properties[stack.DRIFT_DETECTION],
+            {'id': 'fake-detection-id', 'execution_id': None})
+        self.assertFalse(self.fake_client.list_stack_resources.called)
+
+        # The retry polls the same detection and collects the results.
+        self.fake_client.describe_stack_drift_detection_status = MagicMock(
+            return_value={'DetectionStatus': 'DETECTION_COMPLETE'})
+        self.fake_client.list_stack_resources = MagicMock(return_value={
+            'StackResourceSummaries': [{'LogicalResourceId': 'vpc'}]})
+        self.fake_client.describe_stack_resource_drifts = MagicMock(
+            return_value={})
+        stack.pull(ctx=_ctx)
+        self.assertEqual(self.fake_client.detect_stack_drift.call_count, 1)
+        self.assertNotIn(stack.DRIFT_DETECTION,
+                         _ctx.instance.runtime_properties)
+        self.assertEqual(
+            _ctx.instance.runtime_properties[
+                stack.STACK_RESOURCES_RUNTIME_PROP],
+            [{'LogicalResourceId': 'vpc'}])
+
+    def test_pull_stale_detection(self):
+        runtime_properties = copy.deepcopy(RUNTIMEPROP_AFTER_START)
+        runtime_properties[stack.DRIFT_DETECTION] = {
+            'id': 'old-detection-id', 'execution_id': 'cancelled'}
+        _ctx = \
+            self.get_mock_ctx('test_pull',
+                              test_properties=NODE_PROPERTIES,
+                              test_runtime_properties=runtime_properties,
+                              type_hierarchy=STACK_TH,
+                              ctx_operation_name='cloudify.interfaces.'
+                                                 'lifecycle.pull')
+        _ctx._execution_id = 'current'
+        current_ctx.set(_ctx)
+        self.fake_client.describe_stacks = MagicMock(return_value={
+            'Stacks': [{'StackId': '2', 'StackName': 'test-cloudformation1'}]
+        })
+        self.fake_client.detect_stack_drift = MagicMock(
+            return_value={'StackDriftDetectionId': 'new-detection-id'})
+        self.fake_client.describe_stack_drift_detection_status = MagicMock(
+            return_value={'DetectionStatus': 'DETECTION_FAILED'})
+        self.fake_client.list_stack_resources = MagicMock(return_value={
+            'StackResourceSummaries': []})
+        self.fake_client.describe_stack_resource_drifts = MagicMock(
+            return_value={})
+
+        # The detection of another execution is not reused, and a failed
+        # detection is not kept for the next pull.
+        stack.pull(ctx=_ctx)
+        self.fake_client.describe_stack_drift_detection_status \
+            .assert_called_once_with(StackDriftDetectionId='new-detection-id')
+        self.assertNotIn(stack.DRIFT_DETECTION,
+                         _ctx.instance.runtime_properties)
+
     def test_CloudFormationStackClass_properties(self):
         self.fake_client.describe_stacks = MagicMock(return_value={
             'Stacks': [{'StackName': 'Stack'}]
@@ -322,7 +558,7 @@ class TestCloudFormationStack(TestBase):
 
         self.assertEqual(test_instance.list_resources(), [])
 
-    def test_CloudFormationStackClass_detect_stack_drifts(self):
+    def test_CloudFormationStackClass_drift_detection(self):
 
         self.fake_client.detect_stack_drift = MagicMock(
             return_value={'StackDriftDetectionId': 'fake-detection-id'})
@@ -332,16 +568,96 @@ class TestCloudFormationStack(TestBase):
         test_instance = stack.CloudFormationStack("ctx_node",
                                                   resource_id='Stack',
                                                   client=self.fake_client,
-                                                  logger=None)
+                                                  logger=MagicMock())
 
-        self.assertEqual(test_instance.detect_stack_drifts(),
-                         'DETECTION_COMPLETE')
+        self.assertEqual(test_instance.start_drift_detection(),
+                         'fake-detection-id')
+        self.assertEqual(
+            test_instance.drift_detection_status('fake-detection-id'),
+            'DETECTION_COMPLETE')
 
         self.fake_client.detect_stack_drift.assert_called_with(
             StackName='Stack')
         self.fake_client.describe_stack_drift_detection_status \
             .assert_called_with(StackDriftDetectionId='fake-detection-id')
 
+    def test_CloudFormationStackClass_new_events(self):
+        self.fake_client.describe_stack_events = MagicMock(side_effect=[
+            {'StackEvents': [{'EventId': '4'}, {'EventId': '3'}],
+             'NextToken': 'page2'},
+            {'StackEvents': [{'EventId': '2'}, {'EventId': '1'}],
+             'NextToken': 'page3'},
+        ])
+        test_instance = stack.CloudFormationStack('ctx_node',
+                                                  resource_id='Stack',
+                                                  client=self.fake_client,
+                                                  logger=MagicMock())
+
+        self.assertEqual(test_instance.new_events('2'),
+                         [{'EventId': '3'}, {'EventId': '4'}])
+        # The pages after the cursor are not requested.
+        self.assertEqual(
+            self.fake_client.describe_stack_events.call_count, 2)
+        self.fake_client.describe_stack_events.assert_called_with(
+            StackName='Stack', NextToken='page2')
+
+    def test_CloudFormationStackClass_report_progress(self):
+        _ctx = self.get_mock_ctx(
+            'test_report_progress', test_properties=NODE_PROPERTIES,
+            test_runtime_properties={stack.EVENTS_CURSOR: '1'},
+            type_hierarchy=STACK_TH)
+        current_ctx.set(_ctx)
+        self.fake_client.describe_stack_events = MagicMock(side_effect=[
+            {'StackEvents': [
+                {'EventId': '2', 'LogicalResourceId': 'VPC',
+                 'ResourceType': 'AWS::EC2::VPC',
+                 'ResourceStatus': 'CREATE_IN_PROGRESS'},
+                {'EventId': '1'}]},
+            {'StackEvents': [
+                {'EventId': '4', 'LogicalResourceId': 'Stack',
+                 'ResourceType': 'AWS::CloudFormation::Stack',
+                 'ResourceStatus': 'ROLLBACK_IN_PROGRESS'},
+                {'EventId': '3', 'LogicalResourceId': 'VPC',
+                 'ResourceType': 'AWS::EC2::VPC',
+                 'ResourceStatus': 'CREATE_FAILED',
+                 'ResourceStatusReason': 'Limit exceeded'},
+                {'EventId': '2'}]},
+        ])
+        test_instance = stack.CloudFormationStack('ctx_node',
+                                                  resource_id='Stack',
+                                                  client=self.fake_client,
+                                                  logger=MagicMock())
+
+        test_instance.report_progress()
+        self.assertEqual(
+            _ctx.instance.runtime_properties[stack.EVENTS_CURSOR], '2')
+
+        with self.assertRaises(NonRecoverableError) as error:
+            test_instance.report_progress()
+        self.assertIn('Limit exceeded', str(error.exception))
+        self.assertEqual(
+            _ctx.instance.runtime_properties[stack.EVENTS_CURSOR], '4')
+
+    def test_CloudFormationStackClass_report_progress_no_cursor(self):
+        _ctx = self.get_mock_ctx(
+            'test_report_progress', test_properties=NODE_PROPERTIES,
+            test_runtime_properties={},
+            type_hierarchy=STACK_TH)
+        current_ctx.set(_ctx)
+        self.fake_client.describe_stack_events = MagicMock(return_value={
+            'StackEvents': [
+                {'EventId': '2', 'ResourceStatus': 'UPDATE_COMPLETE'},
+                {'EventId': '1', 'ResourceStatus': 'CREATE_FAILED'}]})
+        test_instance = stack.CloudFormationStack('ctx_node',
+                                                  resource_id='Stack',
+                                                  client=self.fake_client,
+                                                  logger=MagicMock())
+
+        # Only the events from now on are reported.
+        test_instance.report_progress()
+        self.assertEqual(
+            _ctx.instance.runtime_properties[stack.EVENTS_CURSOR], '2')
+
     def test_CloudFormationStackClass_resources_drifts(self):
         fake_return_value = {'StackResourceDrifts': [
             {
@@ -21,6 +21,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Local imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.cloudwatch import AWSCloudwatchBase
 
 RESOURCE_TYPE = 'Cloudwatch Alarm'
@@ -38,6 +39,7 @@ class CloudwatchAlarm(AWSCloudwatchBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -62,6 +64,7 @@ class CloudwatchAlarm(AWSCloudwatchBase):
         """
         return self.make_client_call('put_metric_alarm', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS Cloudwatch Alarm.
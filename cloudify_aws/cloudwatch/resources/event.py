@@ -17,9 +17,9 @@
     AWS Cloudwatch Events Event interface
 """
 # Cloudify
-from cloudify_aws.common import decorators
+from cloudify_aws.common import decorators, memoized_properties
 from cloudify_aws.cloudwatch import AWSCloudwatchBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 
 RESOURCE_TYPE = 'Cloudwatch Event'
 
@@ -33,11 +33,12 @@ class CloudwatchEvent(AWSCloudwatchBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('events'),
+            client or ClientFactory(ctx_node, 'events'),
             logger)
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         return None
@@ -22,8 +22,9 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Local imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.cloudwatch import AWSCloudwatchBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 
 RESOURCE_TYPE = 'Cloudwatch Alarm'
 RESOURCE_NAME = 'Name'
@@ -39,11 +40,12 @@ class CloudwatchEventsRule(AWSCloudwatchBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('events'),
+            client or ClientFactory(ctx_node, 'events'),
             logger)
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -68,6 +70,7 @@ class CloudwatchEventsRule(AWSCloudwatchBase):
         """
         return self.make_client_call('put_rule', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS Cloudwatch Events Rule.
@@ -18,8 +18,9 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.cloudwatch import AWSCloudwatchBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ARN
 
 RESOURCE_TYPE = 'Cloudwatch Target'
@@ -40,11 +41,12 @@ class CloudwatchTarget(AWSCloudwatchBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('events'),
+            client or ClientFactory(ctx_node, 'events'),
             logger)
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         return None
@@ -60,6 +62,7 @@ class CloudwatchTarget(AWSCloudwatchBase):
         """
         return self.make_client_call('put_targets', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS Cloudwatch Target.
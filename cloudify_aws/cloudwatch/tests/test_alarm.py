@@ -22,7 +22,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.cloudwatch.resources import alarm
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 
@@ -109,7 +113,7 @@ class TestCloudwatchAlarm(TestBase):
 
         alarm.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('cloudwatch', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cloudwatch', **CLIENT_KWARGS)
 
         self.fake_client.put_metric_alarm.assert_called_with(
             ActionsEnabled='true',
@@ -143,7 +147,7 @@ class TestCloudwatchAlarm(TestBase):
 
         alarm.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('cloudwatch', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cloudwatch', **CLIENT_KWARGS)
 
         self.fake_client.delete_alarms.assert_called_with(
             AlarmNames=['test-cloudwatch1']
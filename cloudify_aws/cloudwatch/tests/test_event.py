@@ -22,7 +22,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.cloudwatch.resources import event
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 
 
@@ -84,7 +88,7 @@ class TestCloudwatchEvent(TestBase):
 
         event.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('events', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('events', **CLIENT_KWARGS)
 
         self.fake_client.put_events.assert_called_with(a='b')
 
@@ -23,7 +23,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.cloudwatch.resources import rule
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 # Constants
@@ -107,7 +111,7 @@ class TestCloudwatchEventsRule(TestBase):
 
         rule.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('events', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('events', **CLIENT_KWARGS)
 
         self.fake_client.put_rule.assert_called_with(
             EventPattern=EVENT_PATTERN_STR,
@@ -135,7 +139,7 @@ class TestCloudwatchEventsRule(TestBase):
 
         rule.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('events', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('events', **CLIENT_KWARGS)
 
         self.fake_client.delete_rule.assert_called_with(
             Name='test-cloudwatch1'
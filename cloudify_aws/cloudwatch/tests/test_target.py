@@ -22,7 +22,7 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.cloudwatch.resources import target
-from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
+from cloudify_aws.common.tests.test_base import DELETE_RESPONSE, CLIENT_KWARGS
 from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 
@@ -114,7 +114,7 @@ class TestCloudwatchTarget(TestBase):
 
         target.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('events', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('events', **CLIENT_KWARGS)
 
         self.fake_client.put_targets.assert_called_with(
             Rule='aws_id', Targets=[{'Id': 'topic1', 'Arn': 'topic1'}]
@@ -132,7 +132,7 @@ class TestCloudwatchTarget(TestBase):
 
         target.delete(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('events', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('events', **CLIENT_KWARGS)
 
         self.fake_client.remove_targets.assert_called_with(
             Ids=['topic1'], Rule='aws_id'
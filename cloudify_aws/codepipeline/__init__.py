@@ -17,8 +17,8 @@
     AWS CodePipline base interface
 """
 # Cloudify AWS
-from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import AWSResourceBase, memoized_properties
+from cloudify_aws.common.connection import ClientFactory
 
 
 class CodePipelineBase(AWSResourceBase):
@@ -27,10 +27,11 @@ class CodePipelineBase(AWSResourceBase):
     """
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         AWSResourceBase.__init__(
-            self, client or Boto3Connection(ctx_node).client('codepipeline'),
+            self, client or ClientFactory(ctx_node, 'codepipeline'),
             resource_id=resource_id, logger=logger)
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         raise NotImplementedError()
@@ -23,6 +23,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 from cloudify.decorators import operation
 from cloudify.exceptions import OperationRetry
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.codepipeline import CodePipelineBase
 
 RESOURCE_TYPE = 'CodePipeline pipeline'
@@ -40,6 +41,7 @@ class CodePipelinePipeline(CodePipelineBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -66,6 +68,7 @@ class CodePipelinePipeline(CodePipelineBase):
         """
         return self.make_client_call('create_pipeline', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing Pipeline.
@@ -75,6 +78,7 @@ class CodePipelinePipeline(CodePipelineBase):
                                              params=params))
         self.client.delete_pipeline(**params)
 
+    @invalidates_properties
     def execute(self, name=None, clientRequestToken=None):
         """
             start execution of an existing Pipeline.
@@ -23,7 +23,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.codepipeline.resources import pipeline
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 
@@ -91,7 +95,7 @@ class TestCodePipeline(TestBase):
             ctx=_ctx, iface=None, params=None
         )
 
-        self.fake_boto.assert_called_with('codepipeline', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('codepipeline', **CLIENT_KWARGS)
 
         self.fake_client.create_pipeline.assert_called_with(
             pipeline={"name": PIPELINE_NAME, "version": 1}
@@ -125,7 +129,7 @@ class TestCodePipeline(TestBase):
 
         pipeline.delete(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('codepipeline', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('codepipeline', **CLIENT_KWARGS)
 
         self.fake_client.delete_pipeline.assert_called_with(
             name=PIPELINE_NAME
@@ -154,7 +158,7 @@ class TestCodePipeline(TestBase):
         pipeline.execute(ctx=_ctx, iface=None, name=PIPELINE_NAME,
                          clientRequestToken=None)
 
-        self.fake_boto.assert_called_with('codepipeline', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('codepipeline', **CLIENT_KWARGS)
 
         self.fake_client.start_pipeline_execution.assert_called_with(
             name=PIPELINE_NAME
@@ -17,8 +17,8 @@
     AWS Cognito base interface
 """
 # Cloudify AWS
-from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import AWSResourceBase, memoized_properties
+from cloudify_aws.common.connection import ClientFactory
 
 # pylint: disable=R0903
 
@@ -29,11 +29,12 @@ class CognitoBase(AWSResourceBase):
     """
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         AWSResourceBase.__init__(
-            self, client or Boto3Connection(ctx_node).client('cognito-idp'),
+            self, client or ClientFactory(ctx_node, 'cognito-idp'),
             resource_id=resource_id, logger=logger)
         self.ctx_node = ctx_node
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         raise NotImplementedError()
@@ -59,6 +60,6 @@ class CognitoIdentityBase(AWSResourceBase):
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         AWSResourceBase.__init__(
             self,
-            client or Boto3Connection(ctx_node).client('cognito-identity'),
+            client or ClientFactory(ctx_node, 'cognito-identity'),
             resource_id=resource_id, logger=logger)
         self.ctx_node = ctx_node
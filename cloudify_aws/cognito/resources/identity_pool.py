@@ -23,7 +23,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Local imports
 from ...iam.resources.role import IAMRole
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 from cloudify_aws.cognito import CognitoIdentityBase
 
 RESOURCE_NAME = 'IdentityPoolName'
@@ -41,6 +41,7 @@ class CognitoIdentityPool(CognitoIdentityBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if self.resource_id:
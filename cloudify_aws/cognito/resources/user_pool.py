@@ -25,7 +25,7 @@ from botocore.exceptions import (
 
 # Local imports
 from cloudify_aws.cognito import CognitoBase
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 
 RESOURCE_NAME = 'PoolName'
 DESCRIBE_INDEX = 'UserPool'
@@ -41,6 +41,7 @@ class CognitoUserPool(CognitoBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if self.resource_id:
@@ -22,7 +22,7 @@
 from botocore.exceptions import ClientError, ParamValidationError
 
 # Local imports
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 from cloudify_aws.cognito import CognitoBase
 
 RESOURCE_NAME = 'ClientName'
@@ -49,6 +49,7 @@ class CognitoUserPoolClient(CognitoBase):
         self._user_pool_id = value
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if self.resource_id:
@@ -22,7 +22,7 @@ from cloudify.state import current_ctx
 
 # Local imports
 from ..resources import identity_pool
-from ...common.tests.test_base import TestBase, CLIENT_CONFIG
+from ...common.tests.test_base import TestBase, CLIENT_CONFIG, CLIENT_KWARGS
 from ...common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 
 # Constants
@@ -110,7 +110,7 @@ class TestCognitoIdentityPool(TestBase):
             return_value=CREATE_RESPONSE,
         )
         identity_pool.create(ctx=_ctx, iface=None, params=None)
-        self.fake_boto.assert_called_with('cognito-identity', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cognito-identity', **CLIENT_KWARGS)
         self.fake_client.create_identity_pool.assert_called_with(
             **_ctx.node.properties['resource_config']
         )
@@ -125,7 +125,7 @@ class TestCognitoIdentityPool(TestBase):
         )
         current_ctx.set(_ctx)
         identity_pool.delete(ctx=_ctx, resource_config=None, iface=None)
-        self.fake_boto.assert_called_with('cognito-identity', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cognito-identity', **CLIENT_KWARGS)
         self.fake_client.delete_identity_pool.assert_called_with(
             IdentityPoolId=IDENTITY_POOL_NAME
         )
@@ -22,7 +22,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from ..resources import identity_provider
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 
 # Constants
@@ -105,7 +109,7 @@ class TestCognitoIdentityProvider(TestBase):
             return_value=CREATE_RESPONSE,
         )
         identity_provider.create(ctx=_ctx, iface=None, params=None)
-        self.fake_boto.assert_called_with('cognito-idp', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cognito-idp', **CLIENT_KWARGS)
         self.fake_client.create_identity_provider.assert_called_with(
             **_ctx.node.properties['resource_config']
         )
@@ -120,7 +124,7 @@ class TestCognitoIdentityProvider(TestBase):
         )
         current_ctx.set(_ctx)
         identity_provider.delete(ctx=_ctx, resource_config=None, iface=None)
-        self.fake_boto.assert_called_with('cognito-idp', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cognito-idp', **CLIENT_KWARGS)
         self.fake_client.delete_identity_provider.assert_called_with(
             ProviderName=IDENTITY_PROVIDER_NAME,
             UserPoolId='foo'
@@ -22,7 +22,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from ..resources import user_pool_client
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 
 # Constants
@@ -91,7 +95,7 @@ class TestCognitoUserPool(TestBase):
             return_value=CREATE_RESPONSE,
         )
         user_pool_client.create(ctx=_ctx, iface=None, params=None)
-        self.fake_boto.assert_called_with('cognito-idp', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cognito-idp', **CLIENT_KWARGS)
         self.fake_client.create_user_pool_client.assert_called_with(
             **_ctx.node.properties['resource_config']
         )
@@ -106,7 +110,7 @@ class TestCognitoUserPool(TestBase):
         )
         current_ctx.set(_ctx)
         user_pool_client.delete(ctx=_ctx, resource_config=None, iface=None)
-        self.fake_boto.assert_called_with('cognito-idp', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('cognito-idp', **CLIENT_KWARGS)
         self.fake_client.delete_user_pool_client.assert_called_with(
             UserPoolId='foo',
             ClientId='foo',
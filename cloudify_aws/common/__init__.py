@@ -16,11 +16,13 @@
     ~~~~~~
     AWS common interfaces
 '''
+import os
 import sys
+import time
+from functools import wraps
 from logging import NullHandler, DEBUG
 
 # Boto
-from boto3 import set_stream_logger
 from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
@@ -29,24 +31,90 @@ from cloudify.logs import init_cloudify_logger
 from cloudify.utils import exception_to_error_cause
 from cloudify_aws.common._compat import text_type
 
-from deepdiff import DeepDiff
-
 from . import utils
+from .connection import ClientFactory, ASSUMED_ROLES
+from .diagnostics import LogPayload, get_operation_stats
+from .constants import (
+    AUTH_ERROR_CODES,
+    PROPERTIES_TTL,
+    PROPERTIES_TTL_ENV,
+    READ_CALL_PREFIXES
+)
 
 FATAL_EXCEPTIONS = (ClientError, ParamValidationError)
 NTP_NOTE = ". If you are positive that you are using the correct " \
            "credentials, " \
            "verify that your system clock is in sync with its NTP server."
+# Response keys of the token for the next page and the request keys to
+# send it back with, for methods which have no botocore paginator.
+PAGE_TOKENS = [
+    ('NextToken', 'NextToken'),
+    ('nextToken', 'nextToken'),
+    ('NextContinuationToken', 'ContinuationToken'),
+    ('NextMarker', 'Marker'),
+    ('Marker', 'Marker'),
+]
+
+
+def memoized_properties(fget):
+    '''Reuses the result of a properties getter, see AWSResourceBase'''
+    @wraps(fget)
+    def wrapper(self):
+        return self._get_properties(fget)
+    return wrapper
+
+
+def invalidates_properties(method):
+    '''Drops the reused properties once a mutating method returns'''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_properties()
+    return wrapper
+
+
+def invalidate_credentials(error):
+    '''Drops the resolved client_config values and the assumed roles
+    when AWS rejected the credentials, they may have been rotated.'''
+    if isinstance(error, ClientError) and error.response.get(
+            'Error', {}).get('Code') in AUTH_ERROR_CODES:
+        utils.invalidate_resolved_values()
+        ASSUMED_ROLES.clear()
+
+
+def _api_error(error):
+    '''Converts an error raised by a client into a NonRecoverableError,
+    from within the except block that caught it.'''
+    _, _, tb = sys.exc_info()
+    invalidate_credentials(error)
+    if isinstance(error, ClientError) and hasattr(error, 'message'):
+        message = error.message + NTP_NOTE
+    else:
+        message = 'API error encountered: {}'.format(error)
+    return NonRecoverableError(
+        text_type(message),
+        causes=[exception_to_error_cause(error, tb)])
 
 
 class AWSResourceBase(object):
     '''
         AWS base interface
+
+        A ``properties`` getter decorated with ``memoized_properties``
+        describes the resource at most once per ``properties_ttl``
+        seconds, and again after any client call through
+        ``make_client_call`` which is not a read, or any method decorated
+        with ``invalidates_properties``, so that ``status`` and
+        ``create_response`` reuse it. ``properties_ttl`` is read from
+        PROPERTIES_TTL_ENV unless a subclass sets its own.
     '''
+    properties_ttl = float(os.environ.get(PROPERTIES_TTL_ENV, PROPERTIES_TTL))
+    _properties_memo = None  # (resource_id, fetched at, value)
+    _properties_fetching = False
 
     def __init__(self, client, resource_id=None, logger=None):
-        # Botocore logs for debugging.
-        set_stream_logger('botocore.parsers', level=DEBUG)
         self.logger = logger or init_cloudify_logger(NullHandler(),
                                                      'AWSResourceBase')
         self._client = client
@@ -60,11 +128,45 @@ class AWSResourceBase(object):
 
     @property
     def client(self):
+        # Interfaces receive a ClientFactory unless a client is injected,
+        # so operations which never call AWS never build a client.
+        if isinstance(self._client, ClientFactory):
+            self._client = self._client()
         return self._client
 
     @client.setter
     def client(self, value):
         self._client = value
+        self._properties_memo = None
+
+    def _get_properties(self, fget):
+        if self._properties_fetching:
+            # A subclass getter reading the getter of its base class.
+            return fget(self)
+        memo = self._properties_memo
+        if memo:
+            resource_id, fetched_at, value = memo
+            if resource_id == self.resource_id and \
+                    time.time() - fetched_at < self.properties_ttl:
+                return value
+            self.invalidate_properties()
+        self._properties_fetching = True
+        try:
+            get_operation_stats()['describe_calls'] += 1
+            value = fget(self)
+        finally:
+            self._properties_fetching = False
+        # Missing resources are described again, callers poll for them.
+        if value:
+            self._properties_memo = (self.resource_id, time.time(), value)
+        return value
+
+    def invalidate_properties(self):
+        '''Makes the next read of properties describe the resource again'''
+        self._properties_memo = None
+        if getattr(self, '_properties', None):
+            # The cache kept by some interfaces themselves.
+            self._properties = {}
 
     def get_describe_result(self, params):
         try:
@@ -73,6 +175,8 @@ class AWSResourceBase(object):
             return {}
 
     def compare_configuration(self):
+        # deepdiff is slow to import and only needed for drift checks.
+        from deepdiff import DeepDiff
         result = DeepDiff(self.expected_configuration,
                           self.remote_configuration)
         delta = utils.JsonCleanuper(result)
@@ -178,6 +282,20 @@ class AWSResourceBase(object):
     def wait_for_status(self, *args, **kwargs):
         return False
 
+    # Botocore waiters which wait_for_status uses, by the status they
+    # wait for, with the arguments of get_waiter_args.
+    status_waiters = {}
+
+    def get_waiter_args(self):
+        '''Gets the arguments of status_waiters for this resource'''
+        return {}
+
+    def report_progress(self):
+        '''
+            Called by wait_for_status and wait_for_delete each time they
+            check the status of the resource, e.g. to log its progress.
+        '''
+
     @property
     def properties(self):
         '''Gets the properties of an external resource'''
@@ -215,10 +333,15 @@ class AWSResourceBase(object):
         """
 
         type_name = getattr(self, 'type_name')
+        # Payloads such as ZipFile or large describe results are only
+        # formatted when DEBUG records are actually emitted.
+        debug = self.logger.isEnabledFor(DEBUG)
 
-        self.logger.debug(
-            'Calling {0} method {1} with parameters: {2}'.format(
-                type_name, client_method_name, client_method_args))
+        if debug:
+            self.logger.debug(
+                'Calling %s method %s with parameters: %s',
+                type_name, client_method_name,
+                LogPayload(client_method_args))
 
         client_method = getattr(self.client, client_method_name)
 
@@ -232,19 +355,92 @@ class AWSResourceBase(object):
             else:
                 res = client_method()
         except fatal_handled_exceptions as error:
-            _, _, tb = sys.exc_info()
-            if isinstance(error, ClientError) and hasattr(error, 'message'):
-                message = error.message + NTP_NOTE
-            else:
-                message = 'API error encountered: {}'.format(error)
-            raise NonRecoverableError(
-                text_type(message),
-                causes=[exception_to_error_cause(error, tb)])
+            self._invalidate_after(client_method_name)
+            raise _api_error(error)
         else:
-            if log_response:
-                self.logger.debug('Response: {0}'.format(res))
+            self._invalidate_after(client_method_name)
+            if log_response and debug:
+                self.logger.debug('Response: %s', LogPayload(res))
         return res
 
+    def iter_client_call(self,
+                         client_method_name,
+                         client_method_args=None,
+                         result_key=None,
+                         max_items=None,
+                         fatal_handled_exceptions=FATAL_EXCEPTIONS):
+        """Streams all of the pages of a list or describe call.
+
+        The botocore paginator of the method is used where there is one,
+        otherwise the NextToken, Marker or continuation token of every
+        response is sent back until there is none.
+
+        :param client_method_name: A method on self.client.
+        :param client_method_args: Optional keyword args.
+        :param result_key: Yield the items under this key of every page
+            instead of the pages.
+        :param max_items: Stop after this many items, or pages.
+        :param fatal_handled_exceptions: exceptions to fail on.
+        :return: A generator of items, or pages.
+        """
+        if max_items is not None and max_items < 1:
+            return
+        params = dict(client_method_args or {})
+        if self.client.can_paginate(client_method_name):
+            pages = self._paginate(
+                client_method_name, params, fatal_handled_exceptions)
+        else:
+            pages = self._follow_page_tokens(
+                client_method_name, params, fatal_handled_exceptions)
+        count = 0
+        for page in pages:
+            for item in (page.get(result_key) or []) if result_key \
+                    else [page]:
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+
+    def _paginate(self, client_method_name, params, fatal_exceptions):
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.debug(
+                'Paginating %s method %s with parameters: %s',
+                getattr(self, 'type_name'), client_method_name,
+                LogPayload(params))
+        paginator = self.client.get_paginator(client_method_name)
+        pages = iter(paginator.paginate(**params))
+        while True:
+            try:
+                page = next(pages)
+            except StopIteration:
+                return
+            except fatal_exceptions as error:
+                raise _api_error(error)
+            yield page
+
+    def _follow_page_tokens(self, client_method_name, params,
+                            fatal_exceptions):
+        previous = None
+        while True:
+            page = self.make_client_call(
+                client_method_name, params,
+                fatal_handled_exceptions=fatal_exceptions)
+            yield page
+            for response_key, request_key in PAGE_TOKENS:
+                token = page.get(response_key)
+                if isinstance(token, text_type):
+                    break
+            else:
+                return
+            # A service which echoes the token back has no more pages.
+            if token == previous:
+                return
+            params[request_key] = previous = token
+
+    def _invalidate_after(self, client_method_name):
+        if not client_method_name.startswith(READ_CALL_PREFIXES):
+            self.invalidate_properties()
+
     def delete(self, params=None):
         '''Deletes a resource'''
         raise NotImplementedError()
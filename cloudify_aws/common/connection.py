@@ -17,21 +17,446 @@
     AWS connection
 """
 import os
+import copy
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Third party imports
 import boto3
 from botocore.config import Config
+from botocore.session import get_session
+from botocore.credentials import RefreshableCredentials
+from cloudify.state import current_ctx, NotInContext
+from cloudify.exceptions import NonRecoverableError
 
 # Local imports
 from .utils import (
     get_uuid,
-    desecretize_client_config
+    get_resolved_client_config
+)
+from .constants import (
+    CLIENT_POOL_SIZE,
+    CLIENT_POOL_SIZE_ENV,
+    DESCRIBE_BATCH_SIZE,
+    DESCRIBE_BATCH_SIZE_ENV,
+    DESCRIBE_WINDOW,
+    DESCRIBE_WINDOW_ENV,
+    MAX_CONCURRENCY,
+    MAX_CONCURRENCY_ENV,
+    ASSUME_ROLE_REFRESH_MARGIN,
+    PERFORMANCE_PROFILE,
+    PERFORMANCE_PROFILES
+)
+from .diagnostics import (
+    instrument_client,
+    configure_wire_logging,
+    get_operation_stats,
+    reset_operation_stats,
+    add_operation_stats,
+    snapshot_operation_stats
 )
-from cloudify_common_sdk.utils import get_client_config
 
 # pylint: disable=R0903
 
 
+def _call_in_worker(parent_ctx, function, args):
+    reset_operation_stats()
+    if parent_ctx is not None:
+        current_ctx.set(parent_ctx)
+    try:
+        outcome = (function(*args), None)
+    except Exception as error:
+        outcome = (None, error)
+    finally:
+        if parent_ctx is not None:
+            current_ctx.clear()
+    return outcome + (snapshot_operation_stats(),)
+
+
+def run_concurrently(function, args_list, max_workers=None):
+    '''
+        Calls ``function(*args)`` for each item of ``args_list`` in a
+        thread pool. The Cloudify context of the caller is available in
+        the workers, and the stats and API metrics they record are added
+        to the operation of the caller.
+
+    :param function: The callable to run
+    :param list args_list: A list of argument tuples
+    :param int max_workers: The maximum number of threads
+    :returns: The results, in the order of ``args_list``
+    :raises: The first exception raised by a call, after all calls ended
+    '''
+    args_list = list(args_list)
+    if max_workers is None:
+        max_workers = int(os.environ.get(
+            MAX_CONCURRENCY_ENV, MAX_CONCURRENCY))
+    max_workers = min(max_workers, len(args_list))
+    if max_workers <= 1:
+        return [function(*args) for args in args_list]
+    try:
+        parent_ctx = current_ctx.get_ctx()
+    except NotInContext:
+        parent_ctx = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_call_in_worker, parent_ctx, function, args)
+            for args in args_list]
+        outcomes = [future.result() for future in futures]
+    results = []
+    errors = []
+    for result, error, stats in outcomes:
+        add_operation_stats(stats)
+        results.append(result)
+        if error is not None:
+            errors.append(error)
+    if errors:
+        raise errors[0]
+    return results
+
+
+def get_botocore_config(profile=None, additional_config=None):
+    '''
+        Builds the botocore ``Config`` of a client from a performance
+        profile, with ``additional_config`` merged over its defaults.
+
+    :param str profile: The name of a profile in PERFORMANCE_PROFILES
+    :param dict additional_config: User-provided botocore Config options
+    :returns: A botocore ``Config`` or None when there is nothing to set
+    '''
+    profile = profile or PERFORMANCE_PROFILE
+    if profile not in PERFORMANCE_PROFILES:
+        raise NonRecoverableError(
+            'Unknown performance_profile "{0}", expected one of: {1}.'.format(
+                profile, ', '.join(sorted(PERFORMANCE_PROFILES))))
+    # Profile options which the installed botocore does not support
+    # are dropped, user-provided options are always passed through.
+    options = {k: copy.deepcopy(v)
+               for k, v in PERFORMANCE_PROFILES[profile].items()
+               if k in Config.OPTION_DEFAULTS}
+    if isinstance(additional_config, dict):
+        for key, value in additional_config.items():
+            if isinstance(value, dict) and isinstance(options.get(key), dict):
+                options[key].update(value)
+            else:
+                options[key] = value
+    return Config(**options) if options else None
+
+
+def _credential_fingerprint(config):
+    '''Hash the credentials so that secrets never end up in a cache key.'''
+    digest = hashlib.sha256()
+    for key in ['aws_access_key_id',
+                'aws_secret_access_key',
+                'aws_session_token']:
+        digest.update(str(config.get(key) or '').encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _botocore_config_key(config):
+    if not isinstance(config, Config):
+        return None
+    # pylint: disable=W0212
+    options = getattr(config, '_user_provided_options', {}) or {}
+    return repr(sorted(options.items(), key=lambda item: item[0]))
+
+
+def client_cache_key(service_name, config, credential_key=None):
+    '''
+        Builds the key which identifies a pooled client.
+
+    :param str service_name: A Boto3 service name
+    :param dict config: The keyword arguments passed to ``boto3.client``
+    :param credential_key: Overrides the credentials part of the key,
+        for clients which do not take static credentials.
+    :returns: A hashable tuple
+    '''
+    return (
+        service_name,
+        config.get('region_name'),
+        credential_key or _credential_fingerprint(config),
+        config.get('endpoint_url'),
+        config.get('api_version'),
+        _botocore_config_key(config.get('config')),
+    )
+
+
+class ClientPool(object):
+    '''
+        Process-wide, thread-safe LRU cache of Boto3 clients.
+
+        Building a client loads and parses the botocore service model,
+        so clients are shared between all of the resource interfaces
+        of an agent or mgmtworker process that use the same service,
+        region, credentials, endpoint and botocore configuration.
+
+    :param int max_size: The maximum number of clients kept in the pool
+    '''
+    def __init__(self, max_size=None):
+        if max_size is None:
+            max_size = int(os.environ.get(
+                CLIENT_POOL_SIZE_ENV, CLIENT_POOL_SIZE))
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._clients = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._clients)
+
+    @property
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._clients),
+            'max_size': self.max_size,
+        }
+
+    def get(self, service_name, config, session=None, credential_key=None):
+        '''
+            Returns a pooled client, building a new one on a miss.
+
+        :param str service_name: A Boto3 service name
+        :param dict config: The keyword arguments passed to ``boto3.client``
+        :param session: An optional ``boto3.Session`` to build the client
+            from instead of the default session.
+        :param credential_key: Identifies the credentials of ``session``.
+        :returns: An AWS service Boto3 client
+        '''
+        factory = session.client if session else boto3.client
+        if self.max_size < 1:
+            self.misses += 1
+            get_operation_stats()['clients_built'] += 1
+            return instrument_client(factory(service_name, **config))
+        key = client_cache_key(service_name, config, credential_key)
+        with self._lock:
+            if key in self._clients:
+                self.hits += 1
+                self._clients.move_to_end(key)
+                return self._clients[key]
+            self.misses += 1
+            get_operation_stats()['clients_built'] += 1
+            # The default boto3 session is not thread-safe, so clients are
+            # built while holding the lock.
+            client = instrument_client(factory(service_name, **config))
+            self._clients[key] = client
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+CLIENT_POOL = ClientPool()
+
+
+class AssumedRoleCache(object):
+    '''
+        Process-wide cache of assumed-role credentials.
+
+        Credentials are kept per role ARN and source credentials as
+        botocore ``RefreshableCredentials``, which call ``sts.assume_role``
+        again once the ``Expiration`` returned by STS is closer than the
+        refresh margin. Clients built from the cached sessions therefore
+        never sign requests with expired tokens, even in long waits.
+    '''
+    def __init__(self):
+        self.assume_role_calls = 0
+        self._sessions = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    @staticmethod
+    def cache_key(role, source_config):
+        return (
+            role,
+            _credential_fingerprint(source_config),
+            source_config.get('region_name'),
+            source_config.get('endpoint_url'),
+        )
+
+    def _refresher(self, role, source_config):
+        def refresh():
+            with self._lock:
+                self.assume_role_calls += 1
+            sts_client = CLIENT_POOL.get('sts', source_config)
+            credentials = sts_client.assume_role(
+                RoleArn=role,
+                RoleSessionName=get_uuid())['Credentials']
+            return {
+                'access_key': credentials['AccessKeyId'],
+                'secret_key': credentials['SecretAccessKey'],
+                'token': credentials['SessionToken'],
+                'expiry_time': credentials['Expiration'].isoformat(),
+            }
+        return refresh
+
+    def get_session(self, role, source_config, refresh_margin=None):
+        '''
+            Returns a ``boto3.Session`` signing with the assumed role.
+
+        :param str role: The ARN of the role to assume
+        :param dict source_config: The configuration used to call STS
+        :param int refresh_margin: Seconds before expiration to refresh
+        :returns: A ``boto3.Session``
+        '''
+        if refresh_margin is None:
+            refresh_margin = ASSUME_ROLE_REFRESH_MARGIN
+        refresh_margin = int(refresh_margin)
+        key = self.cache_key(role, source_config)
+        with self._lock:
+            if key not in self._sessions:
+                refresh = self._refresher(role, source_config)
+                credentials = RefreshableCredentials.create_from_metadata(
+                    metadata=refresh(),
+                    refresh_using=refresh,
+                    method='sts-assume-role',
+                    advisory_timeout=refresh_margin,
+                    mandatory_timeout=refresh_margin)
+                botocore_session = get_session()
+                # pylint: disable=W0212
+                botocore_session._credentials = credentials
+                self._sessions[key] = boto3.Session(
+                    botocore_session=botocore_session,
+                    region_name=source_config.get('region_name'))
+            return self._sessions[key]
+
+    def get_credentials(self, role, source_config, refresh_margin=None):
+        '''Returns the current frozen credentials of the assumed role.'''
+        session = self.get_session(role, source_config, refresh_margin)
+        return session.get_credentials().get_frozen_credentials()
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+            self.assume_role_calls = 0
+
+
+ASSUMED_ROLES = AssumedRoleCache()
+
+
+class _DescribeBatch(object):
+
+    def __init__(self, resource_id, previous):
+        self.ids = [resource_id]
+        self.previous = previous
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class DescribeCoalescer(object):
+    '''
+        Process-wide merging of single-ID describe calls.
+
+        When many node instances of a type poll at once, for example in
+        the threads of a mgmtworker, a describe requested while another
+        one of the same kind is running joins a batch which is sent as a
+        single multi-ID call once the running one returns. Each caller
+        gets the whole response and picks its own resource out of it.
+        If the multi-ID call fails, e.g. because one of the IDs no longer
+        exists, every caller describes its own ID alone.
+
+    :param int max_ids: The maximum number of IDs in one call, 1 disables
+        merging.
+    :param float window: Seconds a batch waits for more callers before
+        it is sent.
+    '''
+    def __init__(self, max_ids=None, window=None):
+        if max_ids is None:
+            max_ids = int(os.environ.get(
+                DESCRIBE_BATCH_SIZE_ENV, DESCRIBE_BATCH_SIZE))
+        if window is None:
+            window = float(os.environ.get(
+                DESCRIBE_WINDOW_ENV, DESCRIBE_WINDOW))
+        self.max_ids = max_ids
+        self.window = window
+        self.requests = 0
+        self.calls = 0
+        self._open = {}
+        self._last = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self):
+        return {'requests': self.requests, 'calls': self.calls}
+
+    def describe(self, key, resource_id, call):
+        '''
+            Describes one resource, merged with concurrent callers.
+
+        :param key: Identifies the kind of describe, e.g. the client,
+            the method name and the name of the IDs parameter.
+        :param resource_id: The ID to describe.
+        :param call: Called with a list of IDs, returns the response.
+        :returns: The response of a call which included ``resource_id``.
+        '''
+        if self.max_ids <= 1:
+            with self._lock:
+                self.requests += 1
+                self.calls += 1
+            return call([resource_id])
+        with self._lock:
+            self.requests += 1
+            batch = self._open.get(key)
+            if batch is not None and len(batch.ids) < self.max_ids:
+                if resource_id not in batch.ids:
+                    batch.ids.append(resource_id)
+                leader = False
+            else:
+                batch = _DescribeBatch(resource_id, self._last.get(key))
+                self._open[key] = batch
+                self._last[key] = batch
+                leader = True
+        if leader:
+            self._send(key, batch, call)
+        else:
+            batch.done.wait()
+        if batch.error is None:
+            return batch.response if leader else \
+                copy.deepcopy(batch.response)
+        if len(batch.ids) == 1:
+            raise batch.error
+        with self._lock:
+            self.calls += 1
+        return call([resource_id])
+
+    def _send(self, key, batch, call):
+        # Callers join the batch while the previous call of its kind runs.
+        if batch.previous is not None:
+            batch.previous.done.wait()
+            batch.previous = None
+        if self.window:
+            time.sleep(self.window)
+        with self._lock:
+            if self._open.get(key) is batch:
+                del self._open[key]
+            self.calls += 1
+        try:
+            batch.response = call(list(batch.ids))
+        except Exception as error:
+            batch.error = error
+        finally:
+            with self._lock:
+                if self._last.get(key) is batch:
+                    del self._last[key]
+            batch.done.set()
+
+
+DESCRIBE_COALESCER = DescribeCoalescer()
+
+
 class Boto3Connection(object):
     '''
         Provides a sugared connection to an AWS service
@@ -49,12 +474,19 @@ class Boto3Connection(object):
             'aws_session_token',
             'api_version']
 
-        config_from_utils = get_client_config(
-            ctx_node=node, alternate_key='aws_config')
+        # Intrinsic functions are resolved once per operation.
+        config_from_utils = get_resolved_client_config(
+            node, alternate_key='aws_config')
 
         # config_from_props = node.properties.get(AWS_CONFIG_PROPERTY, dict())
         # Get additional config from node configuration.
         additional_config = config_from_utils.pop('additional_config', None)
+        performance_profile = config_from_utils.pop(
+            'performance_profile', None)
+        self.assume_role_refresh_margin = config_from_utils.pop(
+            'assume_role_refresh_margin', None)
+        # Botocore wire logging is only installed when requested.
+        configure_wire_logging(config_from_utils.pop('diagnostics', None))
 
         # Handle the Plugin properties
         # config_from_plugin_props = getattr(ctx.plugin, 'properties', {})
@@ -63,8 +495,7 @@ class Boto3Connection(object):
 
         # config_from_plugin_props.update(config_from_props)
         # Merge user-provided AWS config with generated config
-        self._aws_config = desecretize_client_config(
-            config_from_utils)
+        self._aws_config = config_from_utils
         self._aws_config['region_name'] = self._aws_config.get('region_name')
         if aws_config:
             self._aws_config.update(aws_config)
@@ -80,9 +511,11 @@ class Boto3Connection(object):
         self._aws_config = {k: v for k, v in self.aws_config.items()
                             if k in aws_config_whitelist}
 
-        # Add additional config after whitelist filter.
-        if additional_config and isinstance(additional_config, dict):
-            self._aws_config['config'] = Config(**additional_config)
+        # Add the profile and additional config after whitelist filter.
+        botocore_config = get_botocore_config(
+            performance_profile, additional_config)
+        if botocore_config:
+            self._aws_config['config'] = botocore_config
 
     @property
     def aws_config(self):
@@ -95,60 +528,139 @@ class Boto3Connection(object):
     def get_sts_client(self, config):
         return boto3.client("sts", **config)
 
-    def get_sts_credentials(self, role, config):
-        sts_client = self.get_sts_client(config)
+    def _source_config(self, config):
+        return {k: v for k, v in config.items() if k != 'assume_role'}
 
-        sts_credentials = sts_client.assume_role(
-            RoleArn=role,
-            RoleSessionName=get_uuid())["Credentials"]
+    def get_sts_credentials(self, role, config):
+        sts_credentials = ASSUMED_ROLES.get_credentials(
+            role,
+            self._source_config(config),
+            self.assume_role_refresh_margin)
 
         return {
-            "aws_access_key_id": sts_credentials["AccessKeyId"],
-            "aws_secret_access_key": sts_credentials["SecretAccessKey"],
-            "aws_session_token": sts_credentials["SessionToken"],
+            "aws_access_key_id": sts_credentials.access_key,
+            "aws_secret_access_key": sts_credentials.secret_key,
+            "aws_session_token": sts_credentials.token,
             "region_name": self.aws_config["region_name"]
         }
 
+    def assumed_role_client(self, service_name, role, config):
+        '''
+            Builds a client which signs with auto-refreshing credentials
+            of an assumed role.
+
+        :param str service_name: A Boto3 service name
+        :param str role: The ARN of the role to assume
+        :param dict config: The source connection configuration
+        :returns: An AWS service Boto3 client
+        '''
+        source_config = self._source_config(config)
+        session = ASSUMED_ROLES.get_session(
+            role, source_config, self.assume_role_refresh_margin)
+        client_config = {
+            k: v for k, v in source_config.items()
+            if k not in ['aws_access_key_id',
+                         'aws_secret_access_key',
+                         'aws_session_token']
+        }
+        return CLIENT_POOL.get(
+            service_name,
+            client_config,
+            session=session,
+            credential_key=ASSUMED_ROLES.cache_key(role, source_config))
+
     def get_account_id(self):
         sts_client = self.get_sts_client(self.aws_config)
         caller_id = sts_client.get_caller_identity()
         if 'Account' in caller_id:
             return caller_id['Account']
 
-    def client(self, service_name):
+    def _client_config(self, region_name=None):
+        '''
+            Returns a copy of the connection configuration for a client,
+            and the role the client assumes, if any. The shared
+            configuration is never modified, so one connection can build
+            clients for several regions, also from several threads.
+        '''
+        config = dict(self._aws_config)
+        if region_name:
+            config['region_name'] = region_name
+        assume_role = config.pop('assume_role', None) \
+            or os.environ.get("AWS_ASSUME_ROLE_ARN")
+        return config, assume_role
+
+    def client(self, service_name, region_name=None):
         '''
             Builds an AWS connection client
 
         :param str service_name: A Boto3 service name
+        :param str region_name: Overrides the region of the connection
         :returns: An AWS service Boto3 client
         :raises: :exc:`cloudify.exceptions.NonRecoverableError`
         '''
-        config = self._aws_config
-        assume_role = self._aws_config.pop('assume_role', None) \
-            or os.environ.get("AWS_ASSUME_ROLE_ARN")
+        config, assume_role = self._client_config(region_name)
 
         if assume_role:
-            config = self.get_sts_credentials(assume_role, config)
+            return self.assumed_role_client(service_name, assume_role, config)
 
-        resource = boto3.client(service_name, **config)
-        return resource
+        return CLIENT_POOL.get(service_name, config)
 
     def client_with_region(self, service_name, region_name):
         '''
             Builds an AWS connection client
 
         :param str service_name: A Boto3 service name
+        :param str region_name: The region of the client
         :returns: An AWS service Boto3 client
         :raises: :exc:`cloudify.exceptions.NonRecoverableError`
         '''
-        config = self._aws_config
-        config['region_name'] = region_name
+        return self.client(service_name, region_name)
 
-        assume_role = self._aws_config.pop('assume_role', None) \
-            or os.environ.get("AWS_ASSUME_ROLE_ARN")
+    def regional_clients(self, service_name, regions):
+        '''
+            Returns pooled clients of a service for several regions.
 
-        if assume_role:
-            config = self.get_sts_credentials(assume_role, config)
+        :param str service_name: A Boto3 service name
+        :param list regions: Region names
+        :returns: An ordered dict of the clients by region
+        '''
+        return OrderedDict(
+            (region, self.client(service_name, region))
+            for region in regions)
+
+    def map_regions(self, service_name, regions, function, max_workers=None):
+        '''
+            Calls ``function(client, region)`` for several regions
+            concurrently, with a pooled client of each region.
+
+        :param str service_name: A Boto3 service name
+        :param list regions: Region names
+        :param function: The callable to run per region
+        :param int max_workers: The maximum number of threads
+        :returns: An ordered dict of the results by region
+        '''
+        clients = self.regional_clients(service_name, regions)
+        results = run_concurrently(
+            function,
+            [(client, region) for region, client in clients.items()],
+            max_workers)
+        return OrderedDict(zip(clients, results))
+
+
+class ClientFactory(object):
+    '''
+        Defers building a Boto3 client, and resolving the connection
+        configuration it needs, until the client is first used.
+
+    :param `cloudify.context.NodeContext` ctx_node: A Cloudify node
+    :param str service_name: A Boto3 service name
+    :param dict aws_config: AWS connection configuration overrides
+    '''
+    def __init__(self, ctx_node, service_name, aws_config=None):
+        self.ctx_node = ctx_node
+        self.service_name = service_name
+        self.aws_config = aws_config
 
-        resource = boto3.client(service_name, **config)
-        return resource
+    def __call__(self):
+        return Boto3Connection(
+            self.ctx_node, self.aws_config).client(self.service_name)
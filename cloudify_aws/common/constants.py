@@ -38,6 +38,124 @@ SWIFT_ERROR_TOKEN_CODE = 'SignatureDoesNotMatch'
 
 MAX_AWS_NAME = 255
 
+# Maximum number of Boto3 clients shared within a single process.
+CLIENT_POOL_SIZE = 64
+CLIENT_POOL_SIZE_ENV = 'CLOUDIFY_AWS_CLIENT_POOL_SIZE'
+# Threads used to fan API calls out, e.g. across regions.
+MAX_CONCURRENCY = 8
+MAX_CONCURRENCY_ENV = 'CLOUDIFY_AWS_MAX_CONCURRENCY'
+# Seconds before expiration when assumed-role credentials are refreshed.
+ASSUME_ROLE_REFRESH_MARGIN = 600
+# Seconds that resolved get_secret/get_input/get_attribute values of
+# client_config are kept per process, 0 only caches them per operation.
+RESOLVE_CACHE_TTL_ENV = 'CLOUDIFY_AWS_RESOLVE_CACHE_TTL'
+RESOLVE_CACHE_TTL = 0
+# Error codes which mean that cached credentials may have been rotated.
+AUTH_ERROR_CODES = [
+    'AuthFailure',
+    'ExpiredToken',
+    'ExpiredTokenException',
+    'InvalidAccessKeyId',
+    'InvalidClientTokenId',
+    'SignatureDoesNotMatch',
+    'UnrecognizedClientException'
+]
+# Single-ID describes of the same kind, client and region which are
+# requested while one is running are merged into calls of at most this
+# many IDs, optionally waiting DESCRIBE_WINDOW seconds for more callers.
+DESCRIBE_BATCH_SIZE = 200
+DESCRIBE_BATCH_SIZE_ENV = 'CLOUDIFY_AWS_DESCRIBE_BATCH_SIZE'
+DESCRIBE_WINDOW = 0
+DESCRIBE_WINDOW_ENV = 'CLOUDIFY_AWS_DESCRIBE_WINDOW'
+# Seconds that an interface reuses the result of its properties, which
+# are described again after any call that may change the resource.
+PROPERTIES_TTL = 5
+PROPERTIES_TTL_ENV = 'CLOUDIFY_AWS_PROPERTIES_TTL'
+# Client methods starting with one of these prefixes only read.
+READ_CALL_PREFIXES = (
+    'describe_', 'get_', 'head_', 'list_', 'lookup_', 'search_')
+# wait_for_status polls a pending resource in the operation for up to
+# budget seconds before it asks for an OperationRetry, sleeping from
+# initial_delay, times multiplier, up to max_delay seconds with jitter.
+# WAIT_POLICIES overrides it per node type, then the CLOUDIFY_AWS_WAIT_BUDGET
+# environment variable and client_config.wait_policy override both.
+WAIT_POLICY = {
+    'budget': 30,
+    'initial_delay': 2,
+    'max_delay': 15,
+    'multiplier': 2,
+}
+WAIT_BUDGET_ENV = 'CLOUDIFY_AWS_WAIT_BUDGET'
+WAIT_POLICIES = {
+    'cloudify.nodes.aws.ec2.NATGateway': {'budget': 120},
+    'cloudify.nodes.aws.ec2.Image': {'budget': 120, 'max_delay': 30},
+    'cloudify.nodes.aws.rds.Instance': {'budget': 120, 'max_delay': 30},
+    'cloudify.nodes.aws.elb.LoadBalancer': {'budget': 120},
+}
+# Botocore Config defaults selected by client_config.performance_profile.
+# additional_config is merged over the selected profile.
+PERFORMANCE_PROFILE = 'standard'
+PERFORMANCE_PROFILES = {
+    'legacy': {},
+    'standard': {
+        'retries': {'mode': 'standard', 'max_attempts': 5},
+        'max_pool_connections': 20,
+        'connect_timeout': 10,
+        'read_timeout': 60,
+        'tcp_keepalive': True,
+    },
+    'parallel': {
+        'retries': {'mode': 'adaptive', 'max_attempts': 10},
+        'max_pool_connections': 50,
+        'connect_timeout': 10,
+        'read_timeout': 60,
+        'tcp_keepalive': True,
+    },
+}
+
+# Opt-in botocore wire logging, see client_config.diagnostics.
+WIRE_LOGGERS = ['botocore.parsers', 'botocore.endpoint']
+WIRE_LOG_LEVEL_ENV = 'CLOUDIFY_AWS_WIRE_LOG_LEVEL'
+WIRE_LOG_MAX_LENGTH_ENV = 'CLOUDIFY_AWS_WIRE_LOG_MAX_LENGTH'
+WIRE_LOG_MAX_LENGTH = 4096
+
+# API call payloads logged by make_client_call.
+LOG_PAYLOAD_MAX_LENGTH_ENV = 'CLOUDIFY_AWS_LOG_PAYLOAD_MAX_LENGTH'
+LOG_PAYLOAD_MAX_LENGTH = 4096
+LOG_REDACTED_KEYS = [
+    'ZipFile',
+    'Body',
+    'UserData',
+    'SessionToken',
+    'AccessKeyId',
+    'PrivateKey',
+    'KeyMaterial',
+    'Plaintext',
+    'CiphertextBlob',
+    'AuthorizationToken',
+]
+LOG_REDACTED_SUBSTRINGS = ['password', 'secret']
+API_METRICS_ENV = 'CLOUDIFY_AWS_API_METRICS'
+API_METRICS_MODES = ['log', 'runtime_property', 'off']
+API_METRICS_PROPERTY = 'aws_api_metrics'
+API_LATENCY_BUCKETS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+THROTTLING_ERROR_CODES = [
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottledException',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    'TransactionInProgressException',
+    'RequestLimitExceeded',
+    'BandwidthLimitExceeded',
+    'LimitExceededException',
+    'RequestThrottled',
+    'SlowDown',
+    'PriorRequestNotComplete',
+    'EC2ThrottledException'
+]
+
 LOCATIONS = {
     'ap-northeast-1': {
         'coordinates': '35.6828387, 139.7594549',
@@ -19,11 +19,14 @@
 """
 
 # Standard Imports
+import os
 import sys
-from time import sleep
+import random
+from time import sleep, time
+from functools import wraps
 
 # Third party imports
-from botocore.exceptions import ClientError
+from botocore.exceptions import ClientError, WaiterError
 
 from cloudify import ctx
 from cloudify.decorators import operation
@@ -37,12 +40,22 @@ from cloudify_common_sdk.utils import (
 )
 # Local imports
 from .constants import SUPPORT_DRIFT
-from cloudify_aws.eks import EKSBase
-from cloudify_aws.elb import ELBBase
-from cloudify_aws.common import utils
+from cloudify_aws.common import utils, invalidate_credentials
 from cloudify_aws.common._compat import text_type
-from cloudify_common_sdk.utils import get_ctx_instance
+from cloudify_common_sdk.utils import get_ctx_instance, get_ctx_node
+from cloudify_aws.common.diagnostics import (
+    get_operation_stats,
+    reset_operation_stats,
+    get_api_metrics_mode,
+    summarize_api_metrics,
+    merge_api_metrics,
+    format_api_metrics
+)
 from cloudify_aws.common.constants import (
+    API_METRICS_PROPERTY,
+    WAIT_POLICY,
+    WAIT_POLICIES,
+    WAIT_BUDGET_ENV,
     SWIFT_NODE_PREFIX,
     SWIFT_ERROR_TOKEN_CODE,
     EXTERNAL_RESOURCE_ID as EXT_RES_ID,
@@ -51,6 +64,76 @@ from cloudify_aws.common.constants import (
 )
 
 
+def get_wait_policy(node):
+    """
+    Gets the in-process wait policy of a node: WAIT_POLICY, updated by the
+    WAIT_POLICIES of its types, the WAIT_BUDGET_ENV environment variable
+    and its client_config.wait_policy.
+
+    @param node: the node, or None
+    @return: dict with budget, initial_delay, max_delay and multiplier
+    """
+    policy = dict(WAIT_POLICY)
+    type_hierarchy = getattr(node, 'type_hierarchy', None) or []
+    # The policy of a derived type wins over the policies of its parents.
+    for type_name in type_hierarchy:
+        policy.update(WAIT_POLICIES.get(type_name, {}))
+    if os.environ.get(WAIT_BUDGET_ENV):
+        policy['budget'] = float(os.environ[WAIT_BUDGET_ENV])
+    properties = getattr(node, 'properties', None) or {}
+    policy.update((properties.get('client_config') or {}).get(
+        'wait_policy') or {})
+    return policy
+
+
+def _wait_in_process(iface, status, status_pending, status_good, policy,
+                     resource_type='AWS Resource'):
+    """
+    Polls the status of a pending resource in this operation, or waits with
+    a botocore waiter of the interface for a good status, until the status
+    changes or the budget of the policy is spent.
+
+    @param iface: the resource interface
+    @param status: the current status
+    @param status_pending: statuses which are waited for to change
+    @param status_good: the desirable statuses
+    @param policy: see get_wait_policy
+    @param resource_type: the resource type, for logging
+    @return: the last status
+    """
+    deadline = time() + float(policy['budget'])
+    waiter_name = next((iface.status_waiters[good] for good in status_good
+                        if good in iface.status_waiters), None)
+    if waiter_name:
+        delay = max(int(policy['max_delay']), 1)
+        try:
+            iface.client.get_waiter(waiter_name).wait(
+                WaiterConfig={
+                    'Delay': delay,
+                    'MaxAttempts': max(int(policy['budget'] // delay), 1)},
+                **iface.get_waiter_args())
+        except WaiterError as error:
+            ctx.logger.debug('Waiter {0} stopped: {1}'.format(
+                waiter_name, error))
+        iface.invalidate_properties()
+        return iface.status
+    delay = float(policy['initial_delay'])
+    while status in status_pending:
+        remaining = deadline - time()
+        if remaining <= 0:
+            break
+        # Jitter keeps resources created together from polling together.
+        sleep(min(remaining, random.uniform(delay / 2, delay)))
+        delay = min(delay * float(policy['multiplier']),
+                    float(policy['max_delay']))
+        iface.invalidate_properties()
+        iface.report_progress()
+        status = iface.status
+        ctx.logger.debug('%s ID# "%s" reported status: %s.' % (
+            resource_type, iface.resource_id, status))
+    return status
+
+
 def _wait_for_status(kwargs,
                      _ctx,
                      _operation,
@@ -117,6 +200,7 @@ def _wait_for_status(kwargs,
 
     ctx.logger.debug('Requesting ID# "%s" status.' % resource_id)
 
+    kwargs['iface'].report_progress()
     status = kwargs['iface'].status
 
     # Get a resource interface and query for the status
@@ -126,6 +210,15 @@ def _wait_for_status(kwargs,
     if kwargs['iface'].wait_for_status():
         return
 
+    if status in status_pending:
+        policy = get_wait_policy(get_ctx_node(_ctx))
+        if policy['budget'] > 0:
+            status = _wait_in_process(kwargs['iface'], status,
+                                      status_pending, status_good, policy,
+                                      resource_type)
+            ctx.logger.info('%s ID# "%s" reported status: %s.' % (
+                resource_type, resource_id, status))
+
     if status in status_good:
         ctx_instance.runtime_properties['create_response'] = \
             utils.JsonCleanuper(kwargs['iface'].properties).to_dict()
@@ -177,6 +270,58 @@ def _wait_for_status(kwargs,
     return result
 
 
+def _log_operation_stats(_ctx):
+    """Reports the clients built and AWS API calls made by an operation."""
+    stats = get_operation_stats()
+    _ctx.logger.debug('AWS clients built by this operation: {0}.'.format(
+        stats['clients_built']))
+    _ctx.logger.debug('Resource properties described: {0}.'.format(
+        stats['describe_calls']))
+    summary = summarize_api_metrics()
+    if not summary['calls']:
+        return
+    node = get_ctx_node(_ctx)
+    mode = get_api_metrics_mode(
+        (node.properties.get('client_config') or {}).get('diagnostics'))
+    if mode == 'runtime_property' and \
+            _ctx.operation.name == 'cloudify.interfaces.lifecycle.delete':
+        # Deleted instances keep no runtime properties, log them instead.
+        mode = 'log'
+    if mode == 'log':
+        _ctx.logger.debug('AWS API calls: {0}'.format(
+            format_api_metrics(summary)))
+    elif mode == 'runtime_property':
+        instance = get_ctx_instance(_ctx)
+        metrics = instance.runtime_properties.get(API_METRICS_PROPERTY, {})
+        operation_name = _ctx.operation.name
+        metrics[operation_name] = merge_api_metrics(
+            metrics.get(operation_name, {}), summary)
+        instance.runtime_properties[API_METRICS_PROPERTY] = metrics
+        # pylint: disable=W0212
+        instance.runtime_properties._set_changed()
+
+
+def _operation_scope(function):
+    """
+        Scopes the per-operation caches and stats of a decorated operation
+        and reports the stats when it ends, also when it raises.
+    """
+    @wraps(function)
+    def wrapper(**kwargs):
+        reset_operation_stats()
+        utils.RESOLVED_VALUES.begin_operation()
+        try:
+            return function(**kwargs)
+        except ClientError as error:
+            # Raised by a client called directly, not by make_client_call.
+            invalidate_credentials(error)
+            raise
+        finally:
+            utils.RESOLVED_VALUES.end_operation()
+            _log_operation_stats(kwargs.get('ctx') or ctx)
+    return wrapper
+
+
 def aws_relationship(class_decl=None,
                      resource_type='AWS Resource'):
     '''AWS resource decorator'''
@@ -232,7 +377,7 @@ def aws_relationship(class_decl=None,
             ctx.target.instance.runtime_properties._set_changed()
             return ret
 
-        return wrapper_inner
+        return _operation_scope(wrapper_inner)
 
     return operation(func=wrapper_outer, resumable=True)
 
@@ -573,7 +718,7 @@ def aws_resource(class_decl=None,
                 ignore_properties,
                 **kwargs)
 
-        return wrapper_inner
+        return _operation_scope(wrapper_inner)
 
     return operation(func=wrapper_outer, resumable=True)
 
@@ -606,7 +751,7 @@ def multiple_aws_resource(class_decl=None,
                               ignore_properties,
                               **kwargs)
 
-        return wrapper_inner
+        return _operation_scope(wrapper_inner)
 
     return operation(func=wrapper_outer, resumable=True)
 
@@ -734,6 +879,7 @@ def _wait_for_delete(kwargs,
         # flag will be removed after first call without any exceptions
         ctx_instance.runtime_properties['__deleted'] = True
     # Get a resource interface and query for the status
+    iface.report_progress()
     status = iface.status
     ctx.logger.debug('%s ID# "%s" reported status: %s'
                      % (resource_type, iface.resource_id, status))
@@ -876,6 +1022,10 @@ def untag_resources(fn):
             ctx.node.properties.get('Tags'),
             ctx.instance.runtime_properties.get('Tags'),
             kwargs.get('Tags'))
+        # Imported here so that every operation module does not load
+        # the EKS and ELB packages.
+        from cloudify_aws.eks import EKSBase
+        from cloudify_aws.elb import ELBBase
         if isinstance(iface, (ELBBase, EKSBase)):
             can_be_deleted = False
         else:
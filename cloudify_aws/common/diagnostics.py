@@ -0,0 +1,371 @@
+# Copyright (c) 2018 Cloudify Platform Ltd. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+'''
+    Common.Diagnostics
+    ~~~~~~~~~~~~~~~~~~
+    Opt-in botocore wire logging, cheap API call logging and
+    per-operation API call metrics
+'''
+import os
+import copy
+import json
+import time
+import logging
+import threading
+from collections import Counter
+
+from .constants import (
+    WIRE_LOGGERS,
+    WIRE_LOG_LEVEL_ENV,
+    WIRE_LOG_MAX_LENGTH_ENV,
+    WIRE_LOG_MAX_LENGTH,
+    LOG_PAYLOAD_MAX_LENGTH_ENV,
+    LOG_PAYLOAD_MAX_LENGTH,
+    LOG_REDACTED_KEYS,
+    LOG_REDACTED_SUBSTRINGS,
+    API_METRICS_ENV,
+    API_METRICS_MODES,
+    API_LATENCY_BUCKETS,
+    THROTTLING_ERROR_CODES
+)
+
+_lock = threading.Lock()
+_installed = {}
+_operation = threading.local()
+_STARTED = 'cloudify_aws_started'
+
+
+class TruncatingFormatter(logging.Formatter):
+    '''
+        Formatter which cuts log records down to a maximum length, so that
+        large request and response payloads do not flood the logs.
+    '''
+    def __init__(self, fmt=None, max_length=WIRE_LOG_MAX_LENGTH):
+        super(TruncatingFormatter, self).__init__(fmt)
+        self.max_length = max_length
+
+    def format(self, record):
+        message = super(TruncatingFormatter, self).format(record)
+        if self.max_length and len(message) > self.max_length:
+            message = '{0}... [{1} characters truncated]'.format(
+                message[:self.max_length],
+                len(message) - self.max_length)
+        return message
+
+
+def _is_secret(key):
+    if key in LOG_REDACTED_KEYS:
+        return True
+    key = key.lower()
+    return any(substring in key for substring in LOG_REDACTED_SUBSTRINGS)
+
+
+def redact(value):
+    '''
+        Returns a copy of an API payload that is safe and cheap to log:
+        secret fields are masked, and binary or streamed bodies are
+        replaced with a short description.
+
+    :param value: A request or response payload
+    :returns: The redacted payload
+    '''
+    if isinstance(value, dict):
+        return {
+            k: '******' if isinstance(k, str) and _is_secret(k)
+            else redact(v) for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(v) for v in value]
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '<binary: {0} bytes>'.format(len(value))
+    if hasattr(value, 'read'):
+        return '<stream: {0}>'.format(type(value).__name__)
+    return value
+
+
+class LogPayload(object):
+    '''
+        Defers redacting and formatting a payload until a log record is
+        actually emitted, so nothing is converted when DEBUG is off.
+
+    :param payload: A request or response payload
+    :param int max_length: The maximum length of the formatted payload
+    '''
+    __slots__ = ('payload', 'max_length')
+
+    def __init__(self, payload, max_length=None):
+        self.payload = payload
+        self.max_length = get_log_payload_max_length() \
+            if max_length is None else max_length
+
+    def __str__(self):
+        message = str(redact(self.payload))
+        if self.max_length and len(message) > self.max_length:
+            message = '{0}... [{1} characters truncated]'.format(
+                message[:self.max_length],
+                len(message) - self.max_length)
+        return message
+
+
+def get_log_payload_max_length():
+    return int(os.environ.get(
+        LOG_PAYLOAD_MAX_LENGTH_ENV, LOG_PAYLOAD_MAX_LENGTH))
+
+
+def get_wire_log_settings(diagnostics=None):
+    '''
+        Merges the diagnostics settings from the environment with the
+        ``diagnostics`` key of ``client_config``, the latter taking priority.
+
+    :param dict diagnostics: The ``client_config.diagnostics`` value
+    :returns: A tuple of the log level name and the maximum record length
+    '''
+    diagnostics = diagnostics if isinstance(diagnostics, dict) else {}
+    level = diagnostics.get('wire_log_level') or \
+        os.environ.get(WIRE_LOG_LEVEL_ENV)
+    max_length = diagnostics.get('wire_log_max_length') or \
+        os.environ.get(WIRE_LOG_MAX_LENGTH_ENV) or \
+        WIRE_LOG_MAX_LENGTH
+    return (level.upper() if level else None), int(max_length)
+
+
+def configure_wire_logging(diagnostics=None):
+    '''
+        Installs a stream handler on the botocore wire loggers, once per
+        process. Nothing is installed unless a level is configured.
+
+    :param dict diagnostics: The ``client_config.diagnostics`` value
+    :returns: The installed handler or None
+    '''
+    level, max_length = get_wire_log_settings(diagnostics)
+    if not level:
+        return None
+    with _lock:
+        if 'handler' in _installed:
+            return _installed['handler']
+        handler = logging.StreamHandler()
+        handler.setFormatter(TruncatingFormatter(
+            '%(asctime)s %(name)s [%(levelname)s] %(message)s',
+            max_length=max_length))
+        for name in WIRE_LOGGERS:
+            logger = logging.getLogger(name)
+            logger.setLevel(level)
+            logger.addHandler(handler)
+        _installed['handler'] = handler
+        return handler
+
+
+def remove_wire_logging():
+    '''Removes the handler installed by configure_wire_logging.'''
+    with _lock:
+        handler = _installed.pop('handler', None)
+        if handler:
+            for name in WIRE_LOGGERS:
+                logger = logging.getLogger(name)
+                logger.removeHandler(handler)
+                logger.setLevel(logging.NOTSET)
+
+
+def get_operation_stats():
+    '''
+        Returns the counters of the operation running in this thread,
+        e.g. ``clients_built``.
+    '''
+    stats = getattr(_operation, 'stats', None)
+    if stats is None:
+        stats = _operation.stats = Counter()
+    return stats
+
+
+def get_api_metrics():
+    '''
+        Returns the API call metrics of the operation running in this
+        thread, keyed by ``<service>.<OperationName>``.
+    '''
+    metrics = getattr(_operation, 'api_metrics', None)
+    if metrics is None:
+        metrics = _operation.api_metrics = {}
+    return metrics
+
+
+def reset_operation_stats():
+    _operation.stats = Counter()
+    _operation.api_metrics = {}
+    return _operation.stats
+
+
+def _latency_bucket(elapsed_ms):
+    for bucket in API_LATENCY_BUCKETS:
+        if elapsed_ms <= bucket:
+            return 'le_{0}ms'.format(bucket)
+    return 'gt_{0}ms'.format(API_LATENCY_BUCKETS[-1])
+
+
+def _api_metric(operation_model):
+    key = '{0}.{1}'.format(
+        operation_model.service_model.service_name, operation_model.name)
+    metrics = get_api_metrics()
+    if key not in metrics:
+        metrics[key] = {
+            'calls': 0,
+            'errors': 0,
+            'retries': 0,
+            'throttles': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'latency': {},
+        }
+    return metrics[key]
+
+
+def _before_call(context=None, **_):
+    if context is not None:
+        context[_STARTED] = time.time()
+
+
+def _after_call(http_response=None, parsed=None, model=None,
+                context=None, **_):
+    started = (context or {}).pop(_STARTED, None)
+    elapsed_ms = (time.time() - started) * 1000 if started else 0.0
+    metric = _api_metric(model)
+    metric['calls'] += 1
+    metric['total_ms'] += elapsed_ms
+    metric['max_ms'] = max(metric['max_ms'], elapsed_ms)
+    bucket = _latency_bucket(elapsed_ms)
+    metric['latency'][bucket] = metric['latency'].get(bucket, 0) + 1
+    response_metadata = (parsed or {}).get('ResponseMetadata', {})
+    metric['retries'] += response_metadata.get('RetryAttempts', 0)
+    status_code = getattr(http_response, 'status_code', None) or \
+        response_metadata.get('HTTPStatusCode', 200)
+    if status_code >= 300:
+        metric['errors'] += 1
+
+
+def _needs_retry(response=None, operation=None, **_):
+    # Only observes the response, the retry decision is left to botocore.
+    if not response or not operation:
+        return
+    error_code = (response[1] or {}).get('Error', {}).get('Code')
+    if error_code in THROTTLING_ERROR_CODES:
+        _api_metric(operation)['throttles'] += 1
+
+
+def instrument_client(client):
+    '''
+        Registers the botocore event hooks which record the API call
+        metrics of the current operation. Pooled clients are shared
+        between threads, so the hooks always record into the metrics
+        of the calling thread.
+
+    :param client: A Boto3 client
+    :returns: The client
+    '''
+    events = client.meta.events
+    events.register(
+        'before-call', _before_call, unique_id='cloudify-aws-before-call')
+    events.register(
+        'after-call', _after_call, unique_id='cloudify-aws-after-call')
+    events.register(
+        'needs-retry', _needs_retry, unique_id='cloudify-aws-needs-retry')
+    return client
+
+
+def summarize_api_metrics(metrics=None):
+    '''
+        Totals the API call metrics of an operation.
+
+    :param dict metrics: Metrics keyed by service and operation,
+        the metrics of the current operation by default.
+    :returns: A JSON serializable dict
+    '''
+    metrics = get_api_metrics() if metrics is None else metrics
+    summary = {
+        'calls': 0,
+        'errors': 0,
+        'retries': 0,
+        'throttles': 0,
+        'total_ms': 0.0,
+        'operations': {},
+    }
+    for key, metric in metrics.items():
+        for counter in ['calls', 'errors', 'retries', 'throttles']:
+            summary[counter] += metric[counter]
+        summary['total_ms'] += metric['total_ms']
+        summary['operations'][key] = dict(
+            metric,
+            total_ms=round(metric['total_ms'], 3),
+            max_ms=round(metric['max_ms'], 3))
+    summary['total_ms'] = round(summary['total_ms'], 3)
+    return summary
+
+
+def _add_api_metric(metrics, key, metric):
+    if key not in metrics:
+        metrics[key] = copy.deepcopy(metric)
+        return
+    previous = metrics[key]
+    for counter in ['calls', 'errors', 'retries', 'throttles', 'total_ms']:
+        previous[counter] += metric[counter]
+    previous['max_ms'] = max(previous['max_ms'], metric['max_ms'])
+    for bucket, count in metric['latency'].items():
+        previous['latency'][bucket] = \
+            previous['latency'].get(bucket, 0) + count
+
+
+def merge_api_metrics(first, second):
+    '''
+        Adds up two summaries returned by summarize_api_metrics, e.g. to
+        keep the totals of an operation across its retries.
+    '''
+    operations = copy.deepcopy(first.get('operations', {}))
+    for key, metric in second.get('operations', {}).items():
+        _add_api_metric(operations, key, metric)
+    return summarize_api_metrics(operations)
+
+
+def snapshot_operation_stats():
+    '''Returns a copy of the stats and API metrics of this thread.'''
+    return Counter(get_operation_stats()), copy.deepcopy(get_api_metrics())
+
+
+def add_operation_stats(snapshot):
+    '''
+        Adds stats recorded by another thread, e.g. a worker of
+        run_concurrently, to the operation running in this thread.
+
+    :param tuple snapshot: A value returned by snapshot_operation_stats
+    '''
+    stats, metrics = snapshot
+    get_operation_stats().update(stats)
+    api_metrics = get_api_metrics()
+    for key, metric in metrics.items():
+        _add_api_metric(api_metrics, key, metric)
+
+
+def get_api_metrics_mode(diagnostics=None):
+    '''
+        Returns where API call metrics are written at the end of an
+        operation: ``log`` (default), ``runtime_property`` or ``off``.
+
+    :param dict diagnostics: The ``client_config.diagnostics`` value
+    '''
+    diagnostics = diagnostics if isinstance(diagnostics, dict) else {}
+    mode = diagnostics.get('api_metrics') or \
+        os.environ.get(API_METRICS_ENV) or 'log'
+    mode = mode.lower()
+    return mode if mode in API_METRICS_MODES else 'log'
+
+
+def format_api_metrics(summary):
+    return json.dumps(summary, sort_keys=True)
@@ -16,7 +16,7 @@ import copy
 import unittest
 from functools import wraps
 
-from mock import MagicMock, patch
+from mock import MagicMock, patch, ANY
 
 from botocore.exceptions import ClientError
 from botocore.exceptions import UnknownServiceError
@@ -28,6 +28,8 @@ from cloudify.constants import RELATIONSHIP_INSTANCE
 
 from cloudify_aws.common import AWSResourceBase
 from cloudify_aws.common._compat import text_type
+from cloudify_aws.common.utils import RESOLVED_VALUES
+from cloudify_aws.common.connection import CLIENT_POOL, ASSUMED_ROLES
 
 
 CLIENT_CONFIG = {
@@ -36,6 +38,10 @@ CLIENT_CONFIG = {
     'region_name': 'aq-testzone-1'
 }
 
+# The keyword arguments boto3.client receives for CLIENT_CONFIG, including
+# the botocore Config of the default performance profile.
+CLIENT_KWARGS = dict(CLIENT_CONFIG, config=ANY)
+
 DELETE_RESPONSE = {
     'ResponseMetadata': {
         'RetryAttempts': 0,
@@ -112,6 +118,11 @@ class TestBase(unittest.TestCase):
         self.sleep_mock = patch('time.sleep', mock_sleep)
         self.sleep_mock.start()
         self.maxDiff = None
+        # Clients are pooled per process, so mocked clients must not leak
+        # between tests.
+        CLIENT_POOL.clear()
+        ASSUMED_ROLES.clear()
+        RESOLVED_VALUES.clear()
 
     def tearDown(self):
         if self.sleep_mock:
@@ -489,6 +500,8 @@ class TestBase(unittest.TestCase):
             fake_client = client
         else:
             fake_client = MagicMock()
+            # Mocked calls are paged through by following their tokens.
+            fake_client.can_paginate.return_value = False
         fun = getattr(fake_client, fun_name)
         if side_effect:
             fun.side_effect = side_effect
@@ -508,6 +521,7 @@ class TestBase(unittest.TestCase):
 
     def fake_boto_client(self, client_type):
         fake_client = MagicMock()
+        fake_client.can_paginate.return_value = False
 
         if client_type == "rds":
             self._fake_rds(fake_client, client_type)
@@ -575,7 +589,7 @@ class TestBase(unittest.TestCase):
             if type_name == 'iam':
                 return fake_boto
             else:
-                fake_boto.assert_called_with(type_name, **CLIENT_CONFIG)
+                fake_boto.assert_called_with(type_name, **CLIENT_KWARGS)
 
     def _create_common_relationships(self,
                                      node_id,
@@ -13,13 +13,35 @@
 # limitations under the License.
 
 import copy
+import time
 import unittest
-from mock import patch, MagicMock
+import datetime
+import threading
+from mock import patch, MagicMock, ANY
+from cloudify.exceptions import NonRecoverableError
 from cloudify.state import current_ctx
 
 
-from cloudify_aws.common.connection import Boto3Connection
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.connection import (
+    CLIENT_POOL,
+    ASSUMED_ROLES,
+    ClientPool,
+    ClientFactory,
+    Boto3Connection,
+    DescribeCoalescer,
+    run_concurrently,
+    get_botocore_config
+)
+from cloudify_aws.common.diagnostics import (
+    get_operation_stats,
+    reset_operation_stats
+)
+from cloudify_aws.common import AWSResourceBase
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 
 
 class TestConnection(TestBase):
@@ -50,7 +72,7 @@ class TestConnection(TestBase):
         connection.client('abc')
 
         self.fake_boto.assert_called_with(
-            'abc', **CLIENT_CONFIG
+            'abc', **CLIENT_KWARGS
         )
 
     def test_client_node_params(self):
@@ -66,10 +88,10 @@ class TestConnection(TestBase):
         connection.client('abc')
 
         self.fake_boto.assert_called_with(
-            'abc', **CLIENT_CONFIG
+            'abc', **CLIENT_KWARGS
         )
 
-        self.assertEqual(connection.aws_config, CLIENT_CONFIG)
+        self.assertEqual(connection.aws_config, CLIENT_KWARGS)
 
     def test_client_session_token(self):
 
@@ -89,17 +111,320 @@ class TestConnection(TestBase):
         self.fake_boto.assert_called_with(
             'abc', **{
                 'aws_session_token': 'foo',
-                'region_name': 'bar'
+                'region_name': 'bar',
+                'config': ANY
             }
         )
 
         self.assertEqual(
             connection.aws_config, {
                 'aws_session_token': 'foo',
-                'region_name': 'bar'
+                'region_name': 'bar',
+                'config': ANY
             }
         )
 
+    def test_performance_profile(self):
+        config = get_botocore_config()
+        self.assertEqual(
+            config.retries, {'mode': 'standard', 'max_attempts': 5})
+        self.assertEqual(config.max_pool_connections, 20)
+        self.assertTrue(config.tcp_keepalive)
+
+        config = get_botocore_config('parallel', {
+            'retries': {'max_attempts': 3},
+            'read_timeout': 300})
+        self.assertEqual(
+            config.retries, {'mode': 'adaptive', 'max_attempts': 3})
+        self.assertEqual(config.read_timeout, 300)
+        self.assertEqual(config.max_pool_connections, 50)
+
+        self.assertIsNone(get_botocore_config('legacy'))
+        self.assertEqual(
+            get_botocore_config('legacy', {'retries': {'mode': 'legacy'}})
+            .retries, {'mode': 'legacy'})
+        with self.assertRaises(NonRecoverableError):
+            get_botocore_config('fastest')
+
+    def test_client_legacy_profile(self):
+
+        node = MagicMock()
+        node.properties = {
+            'client_config': dict(
+                CLIENT_CONFIG, performance_profile='legacy')
+        }
+        _ctx = self.get_mock_ctx('test')
+        current_ctx.set(_ctx)
+
+        connection = Boto3Connection(node)
+        connection.client('abc')
+
+        self.fake_boto.assert_called_with('abc', **CLIENT_CONFIG)
+
+    def test_client_pool_reuse(self):
+
+        node = MagicMock()
+        node.properties = {}
+        _ctx = self.get_mock_ctx('test')
+        current_ctx.set(_ctx)
+
+        first = Boto3Connection(node, copy.deepcopy(CLIENT_CONFIG))
+        second = Boto3Connection(node, copy.deepcopy(CLIENT_CONFIG))
+        self.assertIs(first.client('abc'), second.client('abc'))
+        self.assertEqual(self.fake_boto.call_count, 1)
+        self.assertEqual(CLIENT_POOL.stats['hits'], 1)
+        self.assertEqual(CLIENT_POOL.stats['misses'], 1)
+
+        other_config = copy.deepcopy(CLIENT_CONFIG)
+        other_config['aws_secret_access_key'] = 'zzz'
+        Boto3Connection(node, other_config).client('abc')
+        first.client('def')
+        self.assertEqual(self.fake_boto.call_count, 3)
+        self.assertEqual(CLIENT_POOL.stats['misses'], 3)
+
+    def test_client_pool_eviction(self):
+        pool = ClientPool(max_size=2)
+        pool.get('abc', CLIENT_CONFIG)
+        pool.get('def', CLIENT_CONFIG)
+        pool.get('abc', CLIENT_CONFIG)
+        pool.get('ghi', CLIENT_CONFIG)
+        self.assertEqual(len(pool), 2)
+        # "def" was the least recently used client.
+        pool.get('def', CLIENT_CONFIG)
+        self.assertEqual(pool.stats['hits'], 1)
+        self.assertEqual(pool.stats['misses'], 4)
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+
+    def _fake_assume_role(self, expires_in):
+        expiration = datetime.datetime.now(datetime.timezone.utc) + \
+            datetime.timedelta(seconds=expires_in)
+        self.fake_client.assume_role = MagicMock(return_value={
+            'Credentials': {
+                'AccessKeyId': 'role_key',
+                'SecretAccessKey': 'role_secret',
+                'SessionToken': 'role_token',
+                'Expiration': expiration
+            }
+        })
+
+    def test_assume_role_credentials_cached(self):
+
+        node = MagicMock()
+        node.properties = {}
+        _ctx = self.get_mock_ctx('test')
+        current_ctx.set(_ctx)
+        self._fake_assume_role(3600)
+
+        for _ in range(3):
+            config = copy.deepcopy(CLIENT_CONFIG)
+            config['assume_role'] = 'arn:aws:iam::123:role/test'
+            connection = Boto3Connection(node, config)
+            credentials = connection.get_sts_credentials(
+                config['assume_role'], connection.aws_config)
+
+        self.assertEqual(credentials['aws_session_token'], 'role_token')
+        self.assertEqual(ASSUMED_ROLES.assume_role_calls, 1)
+        self.assertEqual(len(ASSUMED_ROLES), 1)
+        self.fake_client.assume_role.assert_called_once()
+
+    def test_assume_role_credentials_refreshed(self):
+
+        node = MagicMock()
+        node.properties = {}
+        _ctx = self.get_mock_ctx('test')
+        current_ctx.set(_ctx)
+        # The credentials expire inside the refresh margin.
+        self._fake_assume_role(60)
+
+        config = copy.deepcopy(CLIENT_CONFIG)
+        connection = Boto3Connection(node, config)
+        connection.get_sts_credentials('arn:aws:iam::123:role/test', config)
+        connection.get_sts_credentials('arn:aws:iam::123:role/test', config)
+        self.assertEqual(ASSUMED_ROLES.assume_role_calls, 3)
+
+    def test_assume_role_client(self):
+
+        node = MagicMock()
+        node.properties = {}
+        _ctx = self.get_mock_ctx('test')
+        current_ctx.set(_ctx)
+        self._fake_assume_role(3600)
+
+        config = copy.deepcopy(CLIENT_CONFIG)
+        config['assume_role'] = 'arn:aws:iam::123:role/test'
+        client = Boto3Connection(node, config).client('ec2')
+        credentials = client._request_signer._credentials
+        self.assertEqual(credentials.access_key, 'role_key')
+        self.assertEqual(client.meta.region_name, 'aq-testzone-1')
+        self.assertIs(
+            client, Boto3Connection(node, copy.deepcopy(config)).client('ec2'))
+        self.assertEqual(ASSUMED_ROLES.assume_role_calls, 1)
+
+    def test_client_factory_is_lazy(self):
+
+        node = MagicMock()
+        node.properties = {'client_config': copy.deepcopy(CLIENT_CONFIG)}
+        _ctx = self.get_mock_ctx('test')
+        current_ctx.set(_ctx)
+        reset_operation_stats()
+
+        iface = AWSResourceBase(ClientFactory(node, 'abc'))
+        self.fake_boto.assert_not_called()
+        self.assertEqual(get_operation_stats()['clients_built'], 0)
+
+        self.assertIs(iface.client, self.fake_client)
+        self.assertIs(iface.client, self.fake_client)
+        self.fake_boto.assert_called_once_with('abc', **CLIENT_KWARGS)
+        self.assertEqual(get_operation_stats()['clients_built'], 1)
+
+        # A client of the pool is not built again.
+        other = AWSResourceBase(ClientFactory(node, 'abc'))
+        self.assertIs(other.client, self.fake_client)
+        self.fake_boto.assert_called_once_with('abc', **CLIENT_KWARGS)
+        self.assertEqual(get_operation_stats()['clients_built'], 1)
+
+    def test_client_with_region(self):
+
+        node = MagicMock()
+        node.properties = {'client_config': dict(
+            CLIENT_CONFIG, assume_role='arn:aws:iam::123:role/test')}
+        _ctx = self.get_mock_ctx('test')
+        current_ctx.set(_ctx)
+
+        connection = Boto3Connection(node)
+        aws_config = dict(connection.aws_config)
+        with patch.object(connection, 'assumed_role_client') as client:
+            connection.client_with_region('ec2', 'us-west-1')
+            connection.client_with_region('ec2', 'us-east-2')
+            connection.client('ec2')
+        self.assertEqual(
+            [c[0][2]['region_name'] for c in client.call_args_list],
+            ['us-west-1', 'us-east-2', 'aq-testzone-1'])
+        self.assertEqual(
+            [c[0][1] for c in client.call_args_list],
+            ['arn:aws:iam::123:role/test'] * 3)
+        self.assertEqual(connection.aws_config, aws_config)
+
+    def test_regional_clients(self):
+
+        node = MagicMock()
+        node.properties = {'client_config': copy.deepcopy(CLIENT_CONFIG)}
+        _ctx = self.get_mock_ctx('test')
+        current_ctx.set(_ctx)
+        self.fake_boto.side_effect = lambda *_, **__: MagicMock()
+
+        connection = Boto3Connection(node)
+        regions = ['us-east-1', 'us-west-2']
+        clients = connection.regional_clients('ec2', regions)
+        self.assertEqual(list(clients), regions)
+        self.assertIsNot(clients['us-east-1'], clients['us-west-2'])
+        self.assertEqual(
+            connection.regional_clients('ec2', regions), clients)
+        self.assertEqual(self.fake_boto.call_count, 2)
+
+        def region_name(client, region):
+            self.assertIs(current_ctx.get_ctx(), _ctx)
+            self.assertIs(client, clients[region])
+            get_operation_stats()['clients_built'] += 1
+            return region.upper()
+
+        reset_operation_stats()
+        self.assertEqual(
+            connection.map_regions('ec2', regions, region_name),
+            {'us-east-1': 'US-EAST-1', 'us-west-2': 'US-WEST-2'})
+        self.assertEqual(get_operation_stats()['clients_built'], 2)
+
+    def test_run_concurrently_raises(self):
+
+        def check(value):
+            if value == 2:
+                raise ValueError(value)
+            return value
+
+        self.assertEqual(
+            run_concurrently(check, [(1,), (3,)], max_workers=2), [1, 3])
+        with self.assertRaises(ValueError):
+            run_concurrently(check, [(1,), (2,), (3,)], max_workers=3)
+
+    def _describe_in_threads(self, coalescer, call, resource_ids):
+        results = {}
+
+        def describe(resource_id):
+            try:
+                results[resource_id] = coalescer.describe(
+                    'describe_vpcs', resource_id, call)
+            except NonRecoverableError as error:
+                results[resource_id] = error
+
+        threads = []
+        for resource_id in resource_ids:
+            requests = coalescer.requests
+            thread = threading.Thread(target=describe, args=(resource_id,))
+            thread.start()
+            threads.append(thread)
+            while coalescer.requests == requests:
+                time.sleep(0.001)
+        return threads, results
+
+    def test_describe_coalescer(self):
+        coalescer = DescribeCoalescer(max_ids=3)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def call(resource_ids):
+            calls.append(resource_ids)
+            started.set()
+            release.wait(5)
+            return {'Vpcs': [{'VpcId': i} for i in resource_ids]}
+
+        threads, results = self._describe_in_threads(
+            coalescer, call, ['a'])
+        started.wait(5)
+        more_threads, _ = self._describe_in_threads(
+            coalescer, call, ['b', 'c', 'b', 'd', 'e'])
+        release.set()
+        for thread in threads + more_threads:
+            thread.join(5)
+
+        self.assertEqual(calls, [['a'], ['b', 'c', 'd'], ['e']])
+        self.assertEqual(coalescer.stats, {'requests': 6, 'calls': 3})
+        self.assertEqual(results['a'], {'Vpcs': [{'VpcId': 'a'}]})
+
+    def test_describe_coalescer_falls_back(self):
+        coalescer = DescribeCoalescer(max_ids=10)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def call(resource_ids):
+            calls.append(resource_ids)
+            started.set()
+            release.wait(5)
+            if 'missing' in resource_ids:
+                raise NonRecoverableError('InvalidVpcID.NotFound')
+            return {'Vpcs': [{'VpcId': i} for i in resource_ids]}
+
+        threads, _ = self._describe_in_threads(coalescer, call, ['a'])
+        started.wait(5)
+        more_threads, results = self._describe_in_threads(
+            coalescer, call, ['b', 'missing'])
+        release.set()
+        for thread in threads + more_threads:
+            thread.join(5)
+
+        self.assertEqual(
+            calls, [['a'], ['b', 'missing'], ['b'], ['missing']])
+        self.assertEqual(results['b'], {'Vpcs': [{'VpcId': 'b'}]})
+        self.assertIsInstance(results['missing'], NonRecoverableError)
+
+    def test_describe_coalescer_disabled(self):
+        call = MagicMock(return_value={})
+        coalescer = DescribeCoalescer(max_ids=1)
+        coalescer.describe('describe_vpcs', 'a', call)
+        call.assert_called_once_with(['a'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,12 +14,23 @@
 
 import unittest
 
-from mock import MagicMock, PropertyMock
+from mock import MagicMock, PropertyMock, patch
 from cloudify_aws.common.tests.test_base import TestBase
 from cloudify.state import current_ctx
 from cloudify.exceptions import OperationRetry, NonRecoverableError
+from botocore.exceptions import ClientError
 
-from cloudify_aws.common import decorators
+from cloudify_aws.common import (
+    AWSResourceBase,
+    decorators,
+    diagnostics,
+    memoized_properties
+)
+from cloudify_aws.common.constants import (
+    API_METRICS_ENV,
+    API_METRICS_PROPERTY,
+    WAIT_BUDGET_ENV
+)
 
 
 class TestDecorators(TestBase):
@@ -107,8 +118,22 @@ class TestDecorators(TestBase):
         mock_interface.resource_id = 'foo'
         mock_interface.wait_for_status = wait_for_status
 
-        with self.assertRaises(OperationRetry):
-            test_ok(ctx=_ctx, iface=mock_interface)
+        clock = [0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch('cloudify_aws.common.decorators.time',
+                   lambda: clock[0]), \
+                patch('cloudify_aws.common.decorators.sleep',
+                      side_effect=fake_sleep) as sleep:
+            with self.assertRaises(OperationRetry):
+                test_ok(ctx=_ctx, iface=mock_interface)
+        # Polled with growing delays for the 30 seconds budget.
+        self.assertEqual(clock[0], 30)
+        delays = [call[0][0] for call in sleep.call_args_list]
+        self.assertTrue(1 <= delays[0] <= 2)
+        self.assertTrue(all(delay <= 15 for delay in delays))
 
         # ok
         mock_interface = MagicMock()
@@ -157,6 +182,114 @@ class TestDecorators(TestBase):
         with self.assertRaises(OperationRetry):
             test_ignore(ctx=_ctx, iface=mock_interface)
 
+    def test_wait_for_status_in_process(self):
+        _ctx = self._gen_decorators_context(
+            'test_wait_for_status_in_process',
+            runtime_prop={'aws_resource_id': 'foo', 'resource_config': {}},
+            op_name='cloudify.interfaces.lifecycle.create')
+
+        @decorators.wait_for_status(status_good=['ok'],
+                                    status_pending=['pending'])
+        def test_ok(*args, **kwargs):
+            pass
+
+        statuses = ['pending', 'pending', 'ok']
+        mock_interface = MagicMock()
+        type(mock_interface).status = PropertyMock(
+            side_effect=lambda: statuses.pop(0) if len(statuses) > 1
+            else statuses[0])
+        mock_interface.properties = {'status': 'ok'}
+        mock_interface.resource_id = 'foo'
+        mock_interface.wait_for_status.return_value = False
+        mock_interface.status_waiters = {}
+
+        with patch('cloudify_aws.common.decorators.sleep') as sleep:
+            test_ok(ctx=_ctx, iface=mock_interface)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(mock_interface.invalidate_properties.call_count, 2)
+        self.assertEqual(
+            _ctx.instance.runtime_properties['create_response'],
+            {'status': 'ok'})
+
+        # A native waiter replaces the polling.
+        statuses = ['pending', 'ok']
+        mock_interface.status_waiters = {'ok': 'resource_ok'}
+        mock_interface.get_waiter_args.return_value = {'Ids': ['foo']}
+        with patch('cloudify_aws.common.decorators.sleep') as sleep:
+            test_ok(ctx=_ctx, iface=mock_interface)
+        self.assertFalse(sleep.called)
+        mock_interface.client.get_waiter.assert_called_once_with(
+            'resource_ok')
+        mock_interface.client.get_waiter.return_value.wait.\
+            assert_called_once_with(
+                WaiterConfig={'Delay': 15, 'MaxAttempts': 2}, Ids=['foo'])
+
+        # Without a budget an OperationRetry is raised at once.
+        statuses = ['pending']
+        with patch.dict('os.environ', {WAIT_BUDGET_ENV: '0'}):
+            with self.assertRaises(OperationRetry):
+                test_ok(ctx=_ctx, iface=mock_interface)
+        mock_interface.client.get_waiter.assert_called_once_with(
+            'resource_ok')
+
+    def test_get_wait_policy(self):
+        node = MagicMock()
+        node.type_hierarchy = ['cloudify.nodes.Root',
+                               'cloudify.nodes.aws.rds.Instance']
+        node.properties = {}
+        self.assertEqual(decorators.get_wait_policy(node), {
+            'budget': 120, 'initial_delay': 2, 'max_delay': 30,
+            'multiplier': 2})
+
+        node.properties = {'client_config': {'wait_policy': {'budget': 10}}}
+        with patch.dict('os.environ', {WAIT_BUDGET_ENV: '60'}):
+            self.assertEqual(decorators.get_wait_policy(node)['budget'], 10)
+            node.properties = {}
+            self.assertEqual(decorators.get_wait_policy(node)['budget'], 60)
+        self.assertEqual(decorators.get_wait_policy(None)['budget'], 30)
+
+    def test_wait_for_status_describes_once(self):
+
+        class FakeResource(AWSResourceBase):
+
+            type_name = 'fake'
+
+            @property
+            @memoized_properties
+            def properties(self):
+                return self.make_client_call(
+                    'describe_fake', {'Id': self.resource_id})
+
+            @property
+            def status(self):
+                return self.properties.get('State')
+
+            def create(self, params):
+                self.resource_id = self.make_client_call(
+                    'create_fake', params)['Id']
+
+        _ctx = self._gen_decorators_context(
+            'test_wait_for_status_describes_once')
+
+        @decorators.wait_for_status(status_good=['ok'],
+                                    status_pending=['pending'])
+        def test_create(*args, **kwargs):
+            kwargs['iface'].create({})
+
+        client = MagicMock()
+        client.create_fake.return_value = {'Id': 'foo'}
+        client.describe_fake.return_value = {'State': 'ok'}
+        iface = FakeResource(client)
+        diagnostics.reset_operation_stats()
+        test_create(ctx=_ctx, iface=iface)
+
+        client.describe_fake.assert_called_once_with(Id='foo')
+        self.assertEqual(
+            diagnostics.get_operation_stats()['describe_calls'], 1)
+        self.assertEqual(
+            _ctx.instance.runtime_properties['create_response'],
+            {'State': 'ok'})
+
     def test_aws_params_default(self):
         """params is in priority"""
         @decorators.aws_params("name")
@@ -449,6 +582,102 @@ class TestDecorators(TestBase):
                           'a': 'b',
                           'resource_config': {}})
 
+    def test_aws_resource_api_metrics(self):
+
+        fake_class_instance = MagicMock()
+        FakeClass = MagicMock(return_value=fake_class_instance)
+
+        @decorators.aws_resource(class_decl=FakeClass)
+        def test_func(*agrs, **kwargs):
+            diagnostics.get_api_metrics()['sqs.ListQueues'] = {
+                'calls': 1, 'errors': 0, 'retries': 0, 'throttles': 0,
+                'total_ms': 5.0, 'max_ms': 5.0, 'latency': {'le_10ms': 1}
+            }
+            raise OperationRetry('Waiting.')
+
+        _ctx = self._gen_decorators_context('test_aws_resource', runtime_prop={
+            'aws_resource_id': 'aws_id',
+            'resource_config': {}
+        })
+
+        with patch.dict('os.environ', {API_METRICS_ENV: 'runtime_property'}):
+            for _ in range(2):
+                with self.assertRaises(OperationRetry):
+                    test_func(ctx=_ctx, aws_resource_id='res_id')
+
+        metrics = _ctx.instance.runtime_properties[API_METRICS_PROPERTY]
+        create = metrics['cloudify.interfaces.lifecycle.create']
+        self.assertEqual(create['calls'], 2)
+        self.assertEqual(create['total_ms'], 10.0)
+        self.assertEqual(
+            create['operations']['sqs.ListQueues']['latency'],
+            {'le_10ms': 2})
+
+    def test_aws_resource_api_metrics_delete(self):
+
+        @decorators.aws_resource(class_decl=MagicMock(),
+                                 ignore_properties=True)
+        def test_func(*agrs, **kwargs):
+            diagnostics.get_api_metrics()['sqs.DeleteQueue'] = {
+                'calls': 1, 'errors': 0, 'retries': 0, 'throttles': 0,
+                'total_ms': 5.0, 'max_ms': 5.0, 'latency': {'le_10ms': 1}
+            }
+
+        _ctx = self._gen_decorators_context(
+            'test_aws_resource', runtime_prop={'aws_resource_id': 'aws_id'},
+            op_name='cloudify.interfaces.lifecycle.delete')
+
+        with patch.dict('os.environ', {API_METRICS_ENV: 'runtime_property'}):
+            with patch('cloudify_aws.common.decorators.format_api_metrics',
+                       return_value='') as format_api_metrics:
+                test_func(ctx=_ctx, aws_resource_id='aws_id')
+
+        # The metrics are logged instead.
+        self.assertNotIn(API_METRICS_PROPERTY,
+                         _ctx.instance.runtime_properties)
+        summary = format_api_metrics.call_args[0][0]
+        self.assertEqual(summary['operations']['sqs.DeleteQueue']['calls'],
+                         1)
+
+    def test_aws_resource_auth_error_invalidates(self):
+
+        @decorators.aws_resource(class_decl=MagicMock())
+        def test_func(*agrs, **kwargs):
+            self.assertIsNotNone(
+                decorators.utils.RESOLVED_VALUES.operation_values)
+            raise ClientError(
+                {'Error': {'Code': 'AuthFailure'}}, 'DescribeVpcs')
+
+        _ctx = self._gen_decorators_context('test_aws_resource')
+
+        with patch('cloudify_aws.common.utils.'
+                   'invalidate_resolved_values') as invalidate:
+            with self.assertRaises(ClientError):
+                test_func(ctx=_ctx, aws_resource_id='res_id')
+        invalidate.assert_called_once_with()
+        self.assertIsNone(decorators.utils.RESOLVED_VALUES.operation_values)
+
+    def test_aws_resource_auth_error_through_client_call(self):
+        client = MagicMock()
+        client.describe_vpcs.side_effect = ClientError(
+            {'Error': {'Code': 'ExpiredToken'}}, 'DescribeVpcs')
+        iface = AWSResourceBase(client, resource_id='res_id')
+        iface.type_name = 'Vpc'
+
+        @decorators.aws_resource(class_decl=MagicMock())
+        def test_func(*agrs, **kwargs):
+            iface.make_client_call('describe_vpcs', {})
+
+        _ctx = self._gen_decorators_context('test_aws_resource')
+
+        with patch('cloudify_aws.common.utils.'
+                   'invalidate_resolved_values') as invalidate, \
+                patch('cloudify_aws.common.ASSUMED_ROLES') as assumed_roles:
+            with self.assertRaises(NonRecoverableError):
+                test_func(ctx=_ctx, aws_resource_id='res_id')
+        invalidate.assert_called_once_with()
+        assumed_roles.clear.assert_called_once_with()
+
     def test_aws_resource_remove_kwargs(self):
         # remove kwargs
         fake_class_instance = MagicMock()
@@ -0,0 +1,183 @@
+# Copyright (c) 2018 Cloudify Platform Ltd. All rights reserved
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import logging
+import unittest
+
+import boto3
+from mock import patch, MagicMock
+from botocore.stub import Stubber
+
+from cloudify_aws.common import diagnostics
+from cloudify_aws.common.constants import (
+    WIRE_LOGGERS,
+    WIRE_LOG_LEVEL_ENV,
+    API_METRICS_ENV
+)
+
+
+class TestDiagnostics(unittest.TestCase):
+
+    def tearDown(self):
+        diagnostics.remove_wire_logging()
+        super(TestDiagnostics, self).tearDown()
+
+    def _handlers(self):
+        return logging.getLogger(WIRE_LOGGERS[0]).handlers
+
+    def test_no_handler_by_default(self):
+        with patch.dict('os.environ', {}, clear=True):
+            before = list(self._handlers())
+            self.assertIsNone(diagnostics.configure_wire_logging())
+            self.assertIsNone(diagnostics.configure_wire_logging({}))
+            self.assertEqual(self._handlers(), before)
+
+    def test_installed_once(self):
+        handler = diagnostics.configure_wire_logging(
+            {'wire_log_level': 'debug', 'wire_log_max_length': 10})
+        self.assertIs(handler, diagnostics.configure_wire_logging(
+            {'wire_log_level': 'debug'}))
+        self.assertEqual(self._handlers().count(handler), 1)
+        self.assertEqual(
+            logging.getLogger(WIRE_LOGGERS[0]).level, logging.DEBUG)
+
+    def test_environment(self):
+        with patch.dict('os.environ', {WIRE_LOG_LEVEL_ENV: 'INFO'}):
+            self.assertEqual(
+                diagnostics.get_wire_log_settings(),
+                ('INFO', 4096))
+            self.assertEqual(
+                diagnostics.get_wire_log_settings(
+                    {'wire_log_level': 'DEBUG', 'wire_log_max_length': 5}),
+                ('DEBUG', 5))
+
+    def test_truncation(self):
+        formatter = diagnostics.TruncatingFormatter('%(message)s', 5)
+        record = logging.LogRecord(
+            'botocore.parsers', logging.DEBUG, __file__, 1,
+            'Response body: %s', ('x' * 20,), None)
+        self.assertEqual(
+            formatter.format(record),
+            'Respo... [30 characters truncated]')
+
+    def test_redact(self):
+        self.assertEqual(
+            diagnostics.redact({
+                'FunctionName': 'foo',
+                'Code': {'ZipFile': b'x' * 1024},
+                'MasterUserPassword': 'hunter2',
+                'Items': [{'Body': io.BytesIO(b'x')}],
+                'Stream': io.BytesIO(b'y'),
+                'Content': bytearray(3),
+            }),
+            {
+                'FunctionName': 'foo',
+                'Code': {'ZipFile': '******'},
+                'MasterUserPassword': '******',
+                'Items': [{'Body': '******'}],
+                'Stream': '<stream: BytesIO>',
+                'Content': '<binary: 3 bytes>',
+            })
+
+    def test_log_payload(self):
+        payload = {'Reservations': [{'InstanceId': 'i-1'}] * 100}
+        message = str(diagnostics.LogPayload(payload, max_length=20))
+        self.assertTrue(message.startswith(str(payload)[:20]))
+        self.assertTrue(message.endswith('characters truncated]'))
+        self.assertEqual(
+            str(diagnostics.LogPayload({'a': b'xy'}, max_length=0)),
+            "{'a': '<binary: 2 bytes>'}")
+
+    def _instrumented_client(self):
+        return diagnostics.instrument_client(boto3.client(
+            'sqs',
+            region_name='us-east-1',
+            aws_access_key_id='xxx',
+            aws_secret_access_key='yyy'))
+
+    def test_api_metrics(self):
+        diagnostics.reset_operation_stats()
+        client = self._instrumented_client()
+        # Registering twice must not record every call twice.
+        diagnostics.instrument_client(client)
+        with Stubber(client) as stubber:
+            stubber.add_response('list_queues', {'QueueUrls': []})
+            stubber.add_response('list_queues', {'QueueUrls': []})
+            stubber.add_client_error('get_queue_url', 'NonExistentQueue')
+            client.list_queues()
+            client.list_queues()
+            with self.assertRaises(Exception):
+                client.get_queue_url(QueueName='missing')
+        metrics = diagnostics.get_api_metrics()
+        self.assertEqual(metrics['sqs.ListQueues']['calls'], 2)
+        self.assertEqual(metrics['sqs.ListQueues']['errors'], 0)
+        self.assertEqual(
+            sum(metrics['sqs.ListQueues']['latency'].values()), 2)
+        self.assertEqual(metrics['sqs.GetQueueUrl']['errors'], 1)
+        summary = diagnostics.summarize_api_metrics()
+        self.assertEqual(summary['calls'], 3)
+        self.assertEqual(summary['errors'], 1)
+        diagnostics.reset_operation_stats()
+        self.assertEqual(diagnostics.summarize_api_metrics()['calls'], 0)
+
+    def test_throttles(self):
+        diagnostics.reset_operation_stats()
+        client = self._instrumented_client()
+        operation = client.meta.service_model.operation_model('ListQueues')
+        diagnostics._needs_retry(
+            response=(MagicMock(), {'Error': {'Code': 'RequestThrottled'}}),
+            operation=operation)
+        diagnostics._needs_retry(
+            response=(MagicMock(), {'ResponseMetadata': {}}),
+            operation=operation)
+        diagnostics._after_call(
+            http_response=MagicMock(status_code=200),
+            parsed={'ResponseMetadata': {'RetryAttempts': 1}},
+            model=operation,
+            context={})
+        metric = diagnostics.get_api_metrics()['sqs.ListQueues']
+        self.assertEqual(metric['throttles'], 1)
+        self.assertEqual(metric['retries'], 1)
+        self.assertEqual(metric['latency'], {'le_10ms': 1})
+
+    def test_merge_api_metrics(self):
+        summary = diagnostics.summarize_api_metrics({
+            'sqs.ListQueues': {
+                'calls': 1, 'errors': 0, 'retries': 1, 'throttles': 1,
+                'total_ms': 20.0, 'max_ms': 20.0, 'latency': {'le_25ms': 1}
+            }
+        })
+        merged = diagnostics.merge_api_metrics(summary, summary)
+        self.assertEqual(merged['calls'], 2)
+        self.assertEqual(merged['throttles'], 2)
+        self.assertEqual(merged['total_ms'], 40.0)
+        self.assertEqual(
+            merged['operations']['sqs.ListQueues']['latency'],
+            {'le_25ms': 2})
+        self.assertEqual(diagnostics.merge_api_metrics({}, summary), summary)
+
+    def test_api_metrics_mode(self):
+        with patch.dict('os.environ', {}, clear=True):
+            self.assertEqual(diagnostics.get_api_metrics_mode(), 'log')
+        with patch.dict('os.environ', {API_METRICS_ENV: 'OFF'}):
+            self.assertEqual(diagnostics.get_api_metrics_mode(), 'off')
+            self.assertEqual(
+                diagnostics.get_api_metrics_mode(
+                    {'api_metrics': 'runtime_property'}),
+                'runtime_property')
+
+
+if __name__ == '__main__':
+    unittest.main()
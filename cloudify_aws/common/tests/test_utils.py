@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import unittest
-from mock import MagicMock
+from mock import MagicMock, patch
 
 from cloudify.state import current_ctx
 from cloudify.mocks import MockCloudifyContext
@@ -331,6 +331,66 @@ class TestUtils(TestBase):
             all([isinstance(t['Value'], text_type) for t in out]))
         self.assertEqual(len(out), 3)
 
+    @patch('cloudify_aws.common.utils.get_secret')
+    def test_resolved_values_operation_scope(self, get_secret):
+        get_secret.side_effect = lambda name: name.upper()
+        prop = {'get_secret': 'aws_access_key_id'}
+        cache = utils.ResolvedValueCache(ttl=0)
+        with patch('cloudify_aws.common.utils.RESOLVED_VALUES', cache):
+            # Outside of an operation nothing is cached.
+            utils.resolve_intrinsic_functions(prop)
+            utils.resolve_intrinsic_functions(prop)
+            self.assertEqual(get_secret.call_count, 2)
+
+            cache.begin_operation()
+            self.assertEqual(
+                utils.desecretize_client_config({'a': prop, 'b': prop}),
+                {'a': 'AWS_ACCESS_KEY_ID', 'b': 'AWS_ACCESS_KEY_ID'})
+            self.assertEqual(get_secret.call_count, 3)
+            utils.invalidate_resolved_values('aws_access_key_id')
+            utils.resolve_intrinsic_functions(prop)
+            self.assertEqual(get_secret.call_count, 4)
+            cache.end_operation()
+
+            cache.begin_operation()
+            utils.resolve_intrinsic_functions(prop)
+            self.assertEqual(get_secret.call_count, 5)
+            cache.end_operation()
+
+    @patch('cloudify_aws.common.utils.get_secret')
+    def test_resolved_values_ttl(self, get_secret):
+        get_secret.return_value = 'value'
+        prop = {'get_secret': 'aws_secret_access_key'}
+        cache = utils.ResolvedValueCache(ttl=300)
+        with patch('cloudify_aws.common.utils.RESOLVED_VALUES', cache):
+            for _ in range(3):
+                cache.begin_operation()
+                utils.resolve_intrinsic_functions(prop)
+                cache.end_operation()
+            self.assertEqual(get_secret.call_count, 1)
+            cache.invalidate()
+            utils.resolve_intrinsic_functions(prop)
+            self.assertEqual(get_secret.call_count, 2)
+
+    @patch('cloudify_aws.common.utils.get_secret')
+    @patch('cloudify_aws.common.utils.get_client_config')
+    def test_get_resolved_client_config(self, get_client_config, get_secret):
+        get_client_config.side_effect = lambda **_: {
+            'region_name': {'get_secret': 'region'}}
+        get_secret.return_value = 'us-east-1'
+        node = MagicMock(id='node')
+        utils.RESOLVED_VALUES.begin_operation()
+        try:
+            config = utils.get_resolved_client_config(node)
+            config.pop('region_name')
+            self.assertEqual(
+                utils.get_resolved_client_config(node),
+                {'region_name': 'us-east-1'})
+        finally:
+            utils.RESOLVED_VALUES.end_operation()
+        self.assertEqual(get_client_config.call_count, 1)
+        self.assertEqual(get_secret.call_count, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,8 +19,12 @@
 
 # Standard imports
 import re
+import os
 import sys
+import json
+import time
 import uuid
+import threading
 from time import sleep
 from copy import deepcopy
 
@@ -40,6 +44,7 @@ from cloudify_rest_client.exceptions import (
     DeploymentEnvironmentCreationPendingError,
     DeploymentEnvironmentCreationInProgressError)
 from cloudify_common_sdk.clean_json import JsonCleanuper  # noqa
+from cloudify_common_sdk.utils import get_client_config
 
 # Local imports
 from cloudify_aws.common import constants, _compat
@@ -683,6 +688,129 @@ def generate_deployment_ids(deployment_id, resources):
     return '{}-{}'.format(deployment_id, resources)
 
 
+class ResolvedValueCache(object):
+    '''
+        Cache of values resolved by resolve_intrinsic_functions, so that
+        credentials kept in secrets cost one REST call per operation
+        instead of one per Boto3Connection.
+
+        Values are kept for the running operation, which the operation
+        decorators scope with begin_operation and end_operation. When
+        the CLOUDIFY_AWS_RESOLVE_CACHE_TTL environment variable is set,
+        values are also shared by the operations of the process for
+        that many seconds.
+
+    :param int ttl: Seconds that values are kept per process
+    '''
+    def __init__(self, ttl=None):
+        if ttl is None:
+            ttl = int(os.environ.get(
+                constants.RESOLVE_CACHE_TTL_ENV,
+                constants.RESOLVE_CACHE_TTL))
+        self.ttl = ttl
+        self.lookups = 0
+        self._values = {}
+        self._operation = threading.local()
+        self._lock = threading.RLock()
+
+    @property
+    def operation_values(self):
+        return getattr(self._operation, 'values', None)
+
+    def begin_operation(self):
+        self._operation.values = {}
+
+    def end_operation(self):
+        self._operation.values = None
+
+    @staticmethod
+    def _scope():
+        for _ctx in [ctx, wtx]:
+            try:
+                return _ctx.tenant_name, _ctx.deployment.id
+            except Exception:
+                continue
+        return None, None
+
+    def get(self, function_name, name, resolver):
+        '''
+            Returns the cached value of a lookup, calling resolver on a miss.
+
+        :param str function_name: The intrinsic function, e.g. get_secret
+        :param name: The function arguments
+        :param resolver: Returns the value when it is not cached
+        '''
+        key = (function_name, self._scope(),
+               json.dumps(name, sort_keys=True, default=str))
+        values = self.operation_values
+        if values is not None and key in values:
+            return values[key]
+        if self.ttl > 0:
+            with self._lock:
+                expires, value = self._values.get(key, (0, None))
+            if expires > time.time():
+                if values is not None:
+                    values[key] = value
+                return value
+        with self._lock:
+            self.lookups += 1
+        value = resolver()
+        if values is not None:
+            values[key] = value
+        if self.ttl > 0:
+            with self._lock:
+                self._values[key] = (time.time() + self.ttl, value)
+        return value
+
+    def invalidate(self, name=None):
+        '''
+            Drops cached values, e.g. after a secret was rotated.
+
+        :param name: Only drop the values of this secret, input or
+            get_attribute argument list. Everything is dropped by default.
+        '''
+        def keep(key):
+            return name is not None and \
+                key[2] != json.dumps(name, sort_keys=True, default=str)
+        with self._lock:
+            self._values = {k: v for k, v in self._values.items() if keep(k)}
+        values = self.operation_values
+        if values:
+            self._operation.values = {
+                k: v for k, v in values.items() if keep(k)}
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.lookups = 0
+        self.end_operation()
+
+
+RESOLVED_VALUES = ResolvedValueCache()
+
+
+def invalidate_resolved_values(name=None):
+    '''Drops resolved client_config values, e.g. after secret rotation.'''
+    RESOLVED_VALUES.invalidate(name)
+
+
+def get_resolved_client_config(ctx_node, alternate_key='aws_config'):
+    '''
+        Returns the client config of a node with its intrinsic functions
+        resolved. Within an operation, the result is computed once per
+        node and a copy is returned to every caller.
+    '''
+    values = RESOLVED_VALUES.operation_values
+    key = ('client_config', ctx_node.id, alternate_key)
+    if values is None or key not in values:
+        config = desecretize_client_config(get_client_config(
+            ctx_node=ctx_node, alternate_key=alternate_key))
+        if values is None:
+            return config
+        values[key] = config
+    return deepcopy(values[key])
+
+
 def desecretize_client_config(config):
     for key, value in config.items():
         config[key] = resolve_intrinsic_functions(value)
@@ -695,19 +823,23 @@ def resolve_intrinsic_functions(prop, dep_id=None):
             prop = prop.get('get_secret')
             if isinstance(prop, dict):
                 prop = resolve_intrinsic_functions(prop, dep_id)
-            return get_secret(prop)
+            return RESOLVED_VALUES.get(
+                'get_secret', prop, lambda: get_secret(prop))
         if 'get_input' in prop:
             prop = prop.get('get_input')
             if isinstance(prop, dict):
                 prop = resolve_intrinsic_functions(prop, dep_id)
-            return get_input(prop)
+            return RESOLVED_VALUES.get(
+                'get_input', prop, lambda: get_input(prop))
         if 'get_attribute' in prop:
             prop = prop.get('get_attribute')
             if isinstance(prop, dict):
                 prop = resolve_intrinsic_functions(prop, dep_id)
             node_id = prop[0]
             runtime_property = prop[1]
-            return get_attribute(node_id, runtime_property, dep_id)
+            return RESOLVED_VALUES.get(
+                'get_attribute', [node_id, runtime_property, dep_id],
+                lambda: get_attribute(node_id, runtime_property, dep_id))
     return prop
 
 
@@ -21,6 +21,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.dynamodb import DynamoDBBase
 
 RESOURCE_TYPE = 'DynamoDB Table'
@@ -36,6 +37,7 @@ class DynamoDBTable(DynamoDBBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -64,6 +66,7 @@ class DynamoDBTable(DynamoDBBase):
         """
         return self.make_client_call('create_table', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS DynamoDB Table.
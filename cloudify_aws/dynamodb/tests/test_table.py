@@ -23,7 +23,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.dynamodb.resources import table
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 
@@ -111,7 +115,7 @@ class TestDynamoDBTable(TestBase):
             }, iface=None, params=None
         )
 
-        self.fake_boto.assert_called_with('dynamodb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('dynamodb', **CLIENT_KWARGS)
 
         self.fake_client.create_table.assert_called_with(
             AttributeDefinitions=[{
@@ -157,7 +161,7 @@ class TestDynamoDBTable(TestBase):
 
         table.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('dynamodb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('dynamodb', **CLIENT_KWARGS)
 
         self.fake_client.delete_table.assert_called_with(
             TableName='aws_table_name'
@@ -17,11 +17,19 @@
     AWS EC2 base interface
 """
 
+# Cloudify
+from cloudify.exceptions import NonRecoverableError
 # Cloudify AWS
 from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.utils import check_region_name
-from cloudify_common_sdk.utils import get_client_config
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import memoized_properties, invalidates_properties
+from cloudify_aws.common.utils import (
+    check_region_name,
+    get_resolved_client_config
+)
+from cloudify_aws.common.connection import (
+    ClientFactory,
+    DESCRIBE_COALESCER
+)
 
 # pylint: disable=R0903
 
@@ -37,12 +45,10 @@ class EC2Base(AWSResourceBase):
                  logger=None):
 
         if not client:
-            config_from_utils = get_client_config(
-                ctx_node=ctx_node,
-                alternate_key='aws_config')
+            config_from_utils = get_resolved_client_config(ctx_node)
             check_region_name(config_from_utils.get('region_name'))
         AWSResourceBase.__init__(
-            self, client or Boto3Connection(ctx_node).client('ec2'),
+            self, client or ClientFactory(ctx_node, 'ec2'),
             resource_id=resource_id, logger=logger)
         self.type_name = None
         self._properties = {}
@@ -51,6 +57,7 @@ class EC2Base(AWSResourceBase):
         self._id_key = None
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self._properties:
@@ -61,6 +68,20 @@ class EC2Base(AWSResourceBase):
                         self._properties = n
         return self._properties
 
+    def get_describe_result(self, params):
+        '''Describes a single resource together with concurrent callers'''
+        ids = params.get(self._ids_key) if self._ids_key else None
+        if len(params) != 1 or not isinstance(ids, list) or len(ids) != 1:
+            return AWSResourceBase.get_describe_result(self, params)
+        key = (self.client, self._describe_call, self._ids_key)
+        try:
+            return DESCRIBE_COALESCER.describe(
+                key, ids[0],
+                lambda resource_ids: self.make_client_call(
+                    self._describe_call, {self._ids_key: resource_ids}))
+        except NonRecoverableError:
+            return {}
+
     @property
     def status(self):
         '''Gets the status of an external resource'''
@@ -74,6 +95,7 @@ class EC2Base(AWSResourceBase):
         """Deletes a resource"""
         raise NotImplementedError()
 
+    @invalidates_properties
     def tag(self, params):
         """Creates a resource"""
         self.logger.info('Tagging %s.' % params)
@@ -81,6 +103,7 @@ class EC2Base(AWSResourceBase):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def untag(self, params):
         """Creates a resource"""
         self.logger.info('Untagging %s.' % params)
@@ -21,6 +21,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 
 RESOURCE_TYPE = 'EC2 Customer Gateway'
@@ -41,6 +42,7 @@ class EC2CustomerGateway(EC2Base):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -68,6 +70,7 @@ class EC2CustomerGateway(EC2Base):
         """
         return self.make_client_call('create_customer_gateway', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EC2 Customer Gateway.
@@ -18,7 +18,7 @@
 """
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -49,6 +49,7 @@ class EC2DHCPOptions(EC2Base):
         """
         return self.make_client_call('create_dhcp_options', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EC2 DhcpOptions.
@@ -59,6 +60,7 @@ class EC2DHCPOptions(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def attach(self, params):
         '''
             Attach an AWS EC2 DhcpOptions to a VPC.
@@ -69,6 +71,7 @@ class EC2DHCPOptions(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def detach(self, params):
         '''
             Detach an AWS EC2 VPN Gateway from a VPC.
@@ -21,7 +21,7 @@ from botocore.exceptions import CapacityNotAvailableError
 
 # Cloudify
 from cloudify.exceptions import NonRecoverableError
-from cloudify_aws.common import decorators
+from cloudify_aws.common import decorators, invalidates_properties
 from cloudify_aws.common import constants
 from cloudify_aws.common import utils
 from cloudify_aws.ec2 import EC2Base
@@ -77,6 +77,7 @@ class EC2VolumeMixin(object):
 
         return self.make_client_call('attach_volume', params)
 
+    @invalidates_properties
     def detach(self, params={}):
         """
         Detaches An AWS EC2 EBS Volume From Instance
@@ -103,6 +104,7 @@ class EC2Volume(EC2VolumeMixin, EC2Base):
         """
         return self.make_client_call('create_volume', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
         Deletes An existing AWS EC2 EBS Volume
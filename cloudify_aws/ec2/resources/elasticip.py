@@ -17,13 +17,14 @@
     AWS EC2 ElasticIP interface
 """
 # Boto
-from botocore.exceptions import ClientError, ParamValidationError
+from botocore.exceptions import ClientError
 
-from cloudify.exceptions import OperationRetry
+from cloudify.exceptions import OperationRetry, NonRecoverableError
 
 # Cloudify
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common.constants import (
     EXTERNAL_RESOURCE_ID,
@@ -57,13 +58,10 @@ class EC2ElasticIP(EC2Base):
 
     def get(self, params=None):
         try:
-            if params:
-                resources = self.client.describe_addresses(**params)
-            else:
-                resources = self.client.describe_addresses()
-        except (ParamValidationError, ClientError):
+            return list(self.iter_client_call(
+                'describe_addresses', params, ADDRESSES))
+        except NonRecoverableError:
             return {}
-        return resources.get(ADDRESSES, {})
 
     def update_allocation_id(self, allocation_id):
         self.allocation_id = allocation_id
@@ -73,6 +71,7 @@ class EC2ElasticIP(EC2Base):
         super(EC2ElasticIP, self).tag(params)
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -102,6 +101,7 @@ class EC2ElasticIP(EC2Base):
         """
         return self.make_client_call('allocate_address', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EC2 ElasticIP.
@@ -112,6 +112,7 @@ class EC2ElasticIP(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def attach(self, params):
         '''
             Attach an AWS EC2 ElasticIP to an Instance or a NetworkInterface.
@@ -124,6 +125,7 @@ class EC2ElasticIP(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def detach(self, params):
         '''
             Detach an AWS EC2 ElasticIP from an Instance or a NetworkInterface.
@@ -23,7 +23,7 @@ from cloudify.exceptions import OperationRetry
 
 # Cloudify
 from cloudify_aws.ec2 import EC2Base
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'EC2 Network Interface'
@@ -91,6 +91,7 @@ class EC2NetworkInterface(EC2Base):
             self.create_response['NetworkInterface'].get(
                 NETWORKINTERFACE_ID, ''))
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EC2 NetworkInterface.
@@ -101,6 +102,7 @@ class EC2NetworkInterface(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def attach(self, params):
         '''
             Attach an AWS EC2 NetworkInterface to a Subnet.
@@ -111,6 +113,7 @@ class EC2NetworkInterface(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def detach(self, params):
         '''
             Detach an AWS EC2 NetworkInterface from a Subnet.
@@ -123,6 +126,7 @@ class EC2NetworkInterface(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def modify_network_interface_attribute(self, params):
         '''
             Modify an AWS EC2 NetworkInterface attribute.
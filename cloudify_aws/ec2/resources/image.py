@@ -19,6 +19,7 @@
 # Cloudify
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify.exceptions import NonRecoverableError
 
 # Boto
@@ -54,6 +55,7 @@ class EC2Image(EC2Base):
             self.prepare_describe_image_filter({FILTERS: image_filters})
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         params = self.describe_image_filters
@@ -84,6 +86,7 @@ class EC2Image(EC2Base):
             return None
         return props.get('State')
 
+    @invalidates_properties
     def create(self, params):
         """
             Create a new AWS EC2 Image.
@@ -94,6 +97,7 @@ class EC2Image(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def delete(self, params=None):
         self.logger.debug('Deleting %s' % self.type_name)
         self.logger.debug('Deregistering ImageId %s' % params.get('ImageId'))
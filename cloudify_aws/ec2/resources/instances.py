@@ -23,9 +23,6 @@ import json
 from base64 import b64encode
 from collections import defaultdict
 
-# Third Party imports
-from Crypto.PublicKey import RSA
-
 # Cloudify
 from cloudify import ctx
 from cloudify import compute
@@ -34,7 +31,7 @@ from cloudify.exceptions import NonRecoverableError, OperationRetry
 # local imports
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common._compat import text_type
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 from cloudify_aws.ec2.decrypt import decrypt_password
 from cloudify_aws.common.constants import (
     EXTERNAL_RESOURCE_ID,
@@ -87,6 +84,7 @@ class EC2Instances(EC2Base):
         return self.prepare_instance_ids_request()
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self._properties:
@@ -116,10 +114,7 @@ class EC2Instances(EC2Base):
         return 'NOT OK'
 
     def describe(self, params):
-        try:
-            return self.make_client_call('describe_instances', params)
-        except NonRecoverableError:
-            return {}
+        return self.get_describe_result(params)
 
     def create(self, params):
         '''
@@ -405,6 +400,8 @@ def _handle_password(iface):
     if not encrypted_password:
         ctx.logger.error('password_data is {0}'.format(password_data))
         return False
+    # Only needed when a password is requested, so imported here.
+    from Crypto.PublicKey import RSA
     key = RSA.importKey(key_data)
     password = decrypt_password(key, encrypted_password)
     ctx.instance.runtime_properties['password'] = \
@@ -20,7 +20,7 @@ from time import sleep
 
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common.constants import (EXTERNAL_RESOURCE_ID,
                                            TAG_SPECIFICATIONS_KWARG)
@@ -69,6 +69,7 @@ class EC2InternetGateway(EC2Base):
         '''
         return self.make_client_call('create_internet_gateway', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS EC2 Internet Gateway.
@@ -79,6 +80,7 @@ class EC2InternetGateway(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def attach(self, params):
         '''
             Attach an AWS EC2 Internet Gateway to a VPC.
@@ -89,6 +91,7 @@ class EC2InternetGateway(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def detach(self, params):
         '''
             Detach an AWS EC2 Internet Gateway from a VPC.
@@ -26,7 +26,7 @@ from cloudify.manager import get_rest_client
 # Lcaol imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.ec2 import EC2Base
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_rest_client.exceptions import CloudifyClientError
 
 RESOURCE_TYPE = 'EC2 Keypairs'
@@ -60,6 +60,7 @@ class EC2Keypair(EC2Base):
         return self.make_client_call(
             'create_key_pair', params, log_response)
 
+    @invalidates_properties
     def import_keypair(self, params, log_response=False):
         '''
             Create AWS EC2 Instances.
@@ -72,6 +73,7 @@ class EC2Keypair(EC2Base):
             self.logger.debug('Response: {0}'.format(res))
         return res
 
+    @invalidates_properties
     def delete(self, params):
         '''
             Delete AWS EC2 Instances.
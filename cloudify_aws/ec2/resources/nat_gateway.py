@@ -20,7 +20,7 @@
 from botocore.exceptions import ClientError
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify.exceptions import NonRecoverableError
 
@@ -42,6 +42,7 @@ class EC2NatGateway(EC2Base):
     """
         EC2 NAT Gateway interface
     """
+    status_waiters = {'available': 'nat_gateway_available'}
 
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         EC2Base.__init__(self, ctx_node, resource_id, client, logger)
@@ -59,6 +60,9 @@ class EC2NatGateway(EC2Base):
             return None
         return props['State']
 
+    def get_waiter_args(self):
+        return {NATGATEWAY_IDS: [self.resource_id]}
+
     @property
     def check_status(self):
         if self.status in ['available']:
@@ -71,6 +75,7 @@ class EC2NatGateway(EC2Base):
         """
         return self.make_client_call('create_nat_gateway', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EC2 NAT Gateway.
@@ -20,7 +20,7 @@
 from botocore.exceptions import ClientError
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -73,6 +73,7 @@ class EC2NetworkAcl(EC2Base):
         """
         return self.make_client_call('create_network_acl', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EC2 NetworkAcl.
@@ -83,6 +84,7 @@ class EC2NetworkAcl(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def replace(self, params):
         '''
             Replace Network ACL association ID.
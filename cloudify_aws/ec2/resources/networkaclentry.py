@@ -20,7 +20,7 @@
 from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -62,6 +62,7 @@ class EC2NetworkAclEntry(EC2Base):
         return self.make_client_call(
             'create_network_acl_entry', params)
 
+    @invalidates_properties
     def replace(self, params):
         """
             Create a new AWS EC2 NetworkAcl Entry.
@@ -72,6 +73,7 @@ class EC2NetworkAclEntry(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EC2 NetworkAcl Entry.
@@ -19,7 +19,7 @@
 from cloudify.exceptions import NonRecoverableError
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -55,6 +55,7 @@ class EC2Route(EC2Base):
         '''
         return self.make_client_call('create_route', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS EC2 Route.
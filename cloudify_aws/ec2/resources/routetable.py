@@ -24,7 +24,7 @@ from cloudify.exceptions import OperationRetry
 
 # Cloudify
 from cloudify_aws.ec2 import EC2Base
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'EC2 Route Table'
@@ -77,6 +77,7 @@ class EC2RouteTable(EC2Base):
         '''
         return self.make_client_call('create_route_table', params)
 
+    @invalidates_properties
     def delete(self, params=None, recurse=True):
         '''
             Deletes an existing AWS EC2 Route Table.
@@ -100,6 +101,7 @@ class EC2RouteTable(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def attach(self, params):
         '''
             Attach an AWS EC2 Route Table to a Subnet.
@@ -110,6 +112,7 @@ class EC2RouteTable(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def detach(self, params):
         '''
             Detach an AWS EC2 Route Table from a Subnet.
@@ -21,7 +21,7 @@ from time import sleep
 
 # Cloudify
 from cloudify_aws.ec2 import EC2Base
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'EC2 Security Group'
@@ -77,6 +77,7 @@ class EC2SecurityGroup(EC2Base):
                           % (self.type_name, params))
         return self.make_client_call('delete_security_group', params)
 
+    @invalidates_properties
     def authorize_ingress(self, params):
         '''
             Authorize existing AWS EC2 Security Group ingress rules.
@@ -87,6 +88,7 @@ class EC2SecurityGroup(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def authorize_egress(self, params):
         '''
             Authorize existing AWS EC2 Security Group ingress rules.
@@ -97,6 +99,7 @@ class EC2SecurityGroup(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def revoke_ingress(self, params):
         '''
             Revoke existing AWS EC2 Security Group ingress rules.
@@ -107,6 +110,7 @@ class EC2SecurityGroup(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def revoke_egress(self, params):
         '''
             Revoke existing AWS EC2 Security Group ingress rules.
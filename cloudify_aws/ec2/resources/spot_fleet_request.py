@@ -30,7 +30,7 @@ from cloudify.exceptions import OperationRetry, NonRecoverableError
 
 # Local imports
 from cloudify_aws.ec2 import EC2Base
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 from cloudify_aws.ec2.resources.instances import (
     INSTANCE_ID,
     sort_devices,
@@ -75,6 +75,7 @@ class EC2SpotFleetRequest(EC2Base):
             return
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self._properties:
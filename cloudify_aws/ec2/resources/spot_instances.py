@@ -27,7 +27,7 @@ from cloudify_aws.ec2.resources.instances import (
     assign_nics_param,
     assign_subnet_param,
     assign_groups_param)
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 from cloudify.exceptions import (
     OperationRetry,
     NonRecoverableError)
@@ -61,6 +61,7 @@ class EC2SpotInstances(EC2Instances):
         return {REQUEST_IDS: params.get(REQUEST_ID, [self.resource_id])}
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self._properties:
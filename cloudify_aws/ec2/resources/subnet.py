@@ -17,8 +17,6 @@
     AWS EC2 Subnet interface
 '''
 
-from deepdiff import DeepDiff
-
 # Boto
 from botocore.exceptions import (
     ClientError,
@@ -29,8 +27,7 @@ from botocore.exceptions import (
 from cloudify.exceptions import NonRecoverableError, OperationRetry
 
 from cloudify_aws.ec2 import EC2Base
-from cloudify_aws.common import decorators, utils
-from cloudify_common_sdk.utils import get_client_config
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'EC2 Subnet'
@@ -73,6 +70,7 @@ class EC2Subnet(EC2Base):
         if 'AvailableIpAddressCount' in remote:
             del remote['AvailableIpAddressCount']
 
+        from deepdiff import DeepDiff
         result = DeepDiff(expected, remote)
         delta = utils.JsonCleanuper(result)
         return delta.to_dict()
@@ -98,6 +96,7 @@ class EC2Subnet(EC2Base):
                     self.resource_id))
             raise
 
+    @invalidates_properties
     def modify_subnet_attribute(self, params=None):
         '''
             Modifies an existing AWS EC2 Subnet Attribute.
@@ -109,6 +108,7 @@ class EC2Subnet(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def cleanup_subnet_enis(self, subnet=None):
         subnet = subnet or self.resource_id
         enis = self.client.describe_network_interfaces(
@@ -217,8 +217,7 @@ def _create(ctx, iface, params):
         if isinstance(e, NonRecoverableError) and \
                 'InvalidParameterValue' not in str(e):
             raise e
-        config_from_utils = get_client_config(
-            ctx_node=ctx.node, alternate_key='aws_config')
+        config_from_utils = utils.get_resolved_client_config(ctx.node)
         region_name = config_from_utils.get('region_name')
         use_available_zones = ctx.node.properties.get(
             'use_available_zones', False)
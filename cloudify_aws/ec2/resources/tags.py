@@ -18,7 +18,7 @@
 '''
 # Cloudify
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 from cloudify_aws.ec2 import EC2Base
 
 RESOURCE_TYPE = 'EC2 Tags'
@@ -36,6 +36,7 @@ class EC2Tags(EC2Base):
         self._type_key = TAGS
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -25,6 +25,7 @@ from cloudify.exceptions import NonRecoverableError, OperationRetry
 # Local imports
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common import constants, decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 
 RESOURCE_TYPE = 'EC2 Transit Gateway'
 TG = 'TransitGateway'
@@ -74,6 +75,7 @@ class EC2TransitGateway(EC2Base):
         '''
         return self.make_client_call('create_transit_gateway', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS EC2 Transit Gateway.
@@ -95,6 +97,7 @@ class EC2TransitGatewayAttachment(EC2Base):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         params = {TG_ATTACHMENT_IDS: [self.resource_id]}
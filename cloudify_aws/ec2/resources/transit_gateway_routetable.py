@@ -22,7 +22,7 @@ from botocore.exceptions import ClientError
 from cloudify.exceptions import NonRecoverableError, OperationRetry
 # Cloudify
 from cloudify_aws.ec2 import EC2Base
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 from cloudify_aws.ec2.resources.transit_gateway import (
     TG_ID,
@@ -54,6 +54,7 @@ class EC2TransitGatewayRouteTable(EC2Base):
         self._ids_key = ROUTETABLE_IDS
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -27,7 +27,7 @@ from cloudify.exceptions import NonRecoverableError, OperationRetry
 
 # Local imports
 from cloudify_aws.ec2 import EC2Base
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 
 RESOURCE_TYPE = 'EC2 Vpc'
 VPC = 'Vpc'
@@ -72,6 +72,7 @@ class EC2Vpc(EC2Base):
             if 'DependencyViolation' in str(e):
                 self.cleanup_vpc()
 
+    @invalidates_properties
     def cleanup_vpc_internet_gateways(self, vpc=None):
         vpc = vpc or self.resource_id
         igs = self.client.describe_internet_gateways(
@@ -80,6 +81,7 @@ class EC2Vpc(EC2Base):
             self.client.detach_internet_gateway(
                 InternetGatewayId=ig.get('InternetGatewayId'), VpcId=vpc)
 
+    @invalidates_properties
     def cleanup_vpc_route_tables(self, vpc=None):
         vpc = vpc or self.resource_id
         rts = self.client.describe_route_tables(
@@ -90,6 +92,7 @@ class EC2Vpc(EC2Base):
                     self.client.disassociate_route_table(
                         AssociationId=rta.get('RouteTableAssociationId'))
 
+    @invalidates_properties
     def cleanup_vpc_subnets(self, vpc=None):
         vpc = vpc or self.resource_id
         subnets = self.client.describe_subnets(
@@ -97,6 +100,7 @@ class EC2Vpc(EC2Base):
         for subnet in subnets.get('Subnets', []):
             self.client.delete_subnet(SubnetId=subnet.get('SubnetId'))
 
+    @invalidates_properties
     def cleanup_vpc_endpoints(self, vpc=None):
         vpc = vpc or self.resource_id
         eps = self.client.describe_vpc_endpoints(
@@ -105,6 +109,7 @@ class EC2Vpc(EC2Base):
             self.client.delete_vpc_endpoints(
                 VpcEndpointIds=ep.get('VpcEndpointId'))
 
+    @invalidates_properties
     def cleanup_vpc_security_groups(self, vpc=None):
         vpc = vpc or self.resource_id
         sgs = self.client.describe_security_groups(
@@ -114,6 +119,7 @@ class EC2Vpc(EC2Base):
                 continue
             self.client.delete_security_group(GroupId=g.get('GroupId'))
 
+    @invalidates_properties
     def clean_vpc_peering_connections(self, vpc=None):
         vpc = vpc or self.resource_id
         pcs = self.client.describe_vpc_peering_connections(
@@ -122,6 +128,7 @@ class EC2Vpc(EC2Base):
             self.client.delete_vpc_peering_connection(
                 VpcPeeringConnectionId=pc.get('VpcPeeringConnectionId'))
 
+    @invalidates_properties
     def cleanup_vpc_network_acls(self, vpc=None):
         vpc = vpc or self.resource_id
         alcs = self.client.describe_network_acls(
@@ -146,6 +153,7 @@ class EC2Vpc(EC2Base):
                 'Failed to delete VPC dependencies: {}.'.format(str(e)))
         raise OperationRetry('Retrying to delete vpc.')
 
+    @invalidates_properties
     def modify_vpc_attribute(self, params):
         '''
             Modify attribute of AWS EC2 VPC.
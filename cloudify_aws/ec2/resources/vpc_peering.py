@@ -20,7 +20,7 @@ from __future__ import unicode_literals
 
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common import constants
 
@@ -62,6 +62,7 @@ class EC2VpcPeering(EC2Base):
         """Create a new AWS EC2 Vpc Peering."""
         return self.make_client_call('create_vpc_peering_connection', params)
 
+    @invalidates_properties
     def update(self, params):
         """Updates a new AWS EC2 Vpc Peering."""
         self.logger.debug(
@@ -72,12 +73,14 @@ class EC2VpcPeering(EC2Base):
         self.logger.debug('Response: {}'.format(res))
         return res
 
+    @invalidates_properties
     def delete(self, params=None):
         """Deletes an existing AWS EC2 Vpc Peering."""
         res = self.client.delete_vpc_peering_connection(**params)
         self.logger.debug('Response: {}'.format(res))
         return res
 
+    @invalidates_properties
     def accept(self, params):
         """Updates a new AWS EC2 Vpc Peering."""
         self.logger.debug(
@@ -88,6 +91,7 @@ class EC2VpcPeering(EC2Base):
         self.logger.debug('Response: {}'.format(res))
         return res
 
+    @invalidates_properties
     def reject(self, params):
         """Rejects a new AWS EC2 Vpc Peering."""
         self.logger.debug(
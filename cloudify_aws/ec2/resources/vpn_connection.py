@@ -20,7 +20,7 @@ from __future__ import unicode_literals
 
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common import constants
 
@@ -71,6 +71,7 @@ class EC2VPNConnection(EC2Base):
         """Create a new AWS EC2 VPN Connection."""
         return self.make_client_call('create_vpn_connection', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """ Deletes an existing AWS EC2 VPN Connection."""
         self.client.delete_vpn_connection(**params)
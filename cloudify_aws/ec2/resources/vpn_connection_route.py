@@ -20,6 +20,7 @@ from __future__ import unicode_literals
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 
 
@@ -37,6 +38,7 @@ class EC2VPNConnectionRoute(EC2Base):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         pass
@@ -51,6 +53,7 @@ class EC2VPNConnectionRoute(EC2Base):
         return self.make_client_call(
             'create_vpn_connection_route', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """ Deletes an existing AWS EC2 VPN Connection Route."""
         self.client.delete_vpn_connection_route(**params)
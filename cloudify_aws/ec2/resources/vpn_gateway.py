@@ -17,7 +17,7 @@
     AWS EC2 VPN Gateway interface
 """
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.ec2 import EC2Base
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 from cloudify_aws.common.utils import handle_response
@@ -58,6 +58,7 @@ class EC2VPNGateway(EC2Base):
         """
         return self.make_client_call('create_vpn_gateway', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EC2 VPN Gateway.
@@ -68,6 +69,7 @@ class EC2VPNGateway(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def attach(self, params):
         '''
             Attach an AWS EC2 VPN Gateway to a VPC.
@@ -78,6 +80,7 @@ class EC2VPNGateway(EC2Base):
         self.logger.debug('Response: %s' % res)
         return res['VpcAttachment']
 
+    @invalidates_properties
     def detach(self, params):
         '''
             Detach an AWS EC2 VPN Gateway from a VPC.
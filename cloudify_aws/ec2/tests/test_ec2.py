@@ -43,7 +43,7 @@ class TestEC2Init(TestServiceBase):
             'foo': 'bar'
         }
         with mock.patch(
-            "cloudify_aws.ec2.Boto3Connection", boto_mock
+            "cloudify_aws.common.connection.Boto3Connection", boto_mock
         ):
             with self.assertRaises(NonRecoverableError):
                 EC2Base(ctx_node)
@@ -51,8 +51,10 @@ class TestEC2Init(TestServiceBase):
             ctx_node.properties[AWS_CONFIG_PROPERTY] = {
                 'region_name': 'aq-testzone-1'
             }
-            EC2Base(ctx_node)
-            boto_mock.assert_called_with(ctx_node)
+            iface = EC2Base(ctx_node)
+            boto_mock.assert_not_called()
+            self.assertEqual(iface.client, boto_client.client.return_value)
+            boto_mock.assert_called_with(ctx_node, None)
             boto_client.client.assert_called_with('ec2')
 
 
@@ -14,6 +14,12 @@
 
 # Standard imports
 import unittest
+from mock import MagicMock, patch
+
+# Third party imports
+import boto3
+from botocore.stub import Stubber
+from cloudify.exceptions import NonRecoverableError
 
 # Local imports
 from cloudify_aws.common.tests.test_base import TestServiceBase
@@ -27,6 +33,122 @@ class TestEC2Base(TestServiceBase):
         self.base = EC2Base("ctx_node", resource_id=True,
                             client=True, logger=None)
 
+    def _get_vpc_base(self):
+        client = MagicMock()
+        client.describe_vpcs.return_value = {
+            'Vpcs': [{'VpcId': 'vpc-1', 'State': 'pending'}]}
+        base = EC2Base('ctx_node', resource_id='vpc-1', client=client)
+        base.type_name = 'vpc'
+        base._describe_call = 'describe_vpcs'
+        base._ids_key = 'VpcIds'
+        base._type_key = 'Vpcs'
+        base._id_key = 'VpcId'
+        return base, client
+
+    def test_properties_memoized(self):
+        base, client = self._get_vpc_base()
+        self.assertEqual(base.status, 'pending')
+        self.assertEqual(base.properties['VpcId'], 'vpc-1')
+        client.describe_vpcs.assert_called_once_with(VpcIds=['vpc-1'])
+
+        # A mutating method or client call describes the resource again.
+        client.describe_vpcs.return_value = {
+            'Vpcs': [{'VpcId': 'vpc-1', 'State': 'available'}]}
+        base.tag({'Resources': ['vpc-1'], 'Tags': []})
+        self.assertEqual(base.status, 'available')
+        base.make_client_call('modify_vpc_attribute', {'VpcId': 'vpc-1'})
+        self.assertEqual(base.status, 'available')
+        base.make_client_call('describe_vpc_attribute', {'VpcId': 'vpc-1'})
+        self.assertEqual(base.status, 'available')
+        self.assertEqual(client.describe_vpcs.call_count, 3)
+
+    def test_properties_ttl(self):
+        base, client = self._get_vpc_base()
+        with patch('cloudify_aws.common.time.time', return_value=100.0):
+            self.assertEqual(base.status, 'pending')
+        client.describe_vpcs.return_value = {
+            'Vpcs': [{'VpcId': 'vpc-1', 'State': 'available'}]}
+        with patch('cloudify_aws.common.time.time', return_value=104.0):
+            self.assertEqual(base.status, 'pending')
+        with patch('cloudify_aws.common.time.time', return_value=105.0):
+            self.assertEqual(base.status, 'available')
+        self.assertEqual(client.describe_vpcs.call_count, 2)
+
+        # Missing resources are never reused.
+        client.describe_vpcs.return_value = {'Vpcs': []}
+        base.invalidate_properties()
+        self.assertEqual(base.properties, {})
+        self.assertEqual(base.properties, {})
+        self.assertEqual(client.describe_vpcs.call_count, 4)
+
+        # Without a time to live, each status describes the resource.
+        base.properties_ttl = 0
+        client.describe_vpcs.return_value = {
+            'Vpcs': [{'VpcId': 'vpc-1', 'State': 'available'}]}
+        self.assertEqual(base.status, 'available')
+        self.assertEqual(base.status, 'available')
+        self.assertEqual(client.describe_vpcs.call_count, 6)
+
+    def test_iter_client_call_paginator(self):
+        client = boto3.client('ec2', region_name='us-east-1',
+                              aws_access_key_id='xxx',
+                              aws_secret_access_key='yyy')
+        base = EC2Base('ctx_node', client=client)
+        base.type_name = 'vpc'
+        with Stubber(client) as stubber:
+            stubber.add_response(
+                'describe_vpcs',
+                {'Vpcs': [{'VpcId': 'vpc-1'}, {'VpcId': 'vpc-2'}],
+                 'NextToken': 'page2'},
+                {'MaxResults': 5})
+            stubber.add_response(
+                'describe_vpcs', {'Vpcs': [{'VpcId': 'vpc-3'}]},
+                {'MaxResults': 5, 'NextToken': 'page2'})
+            vpcs = base.iter_client_call(
+                'describe_vpcs', {'MaxResults': 5}, 'Vpcs')
+            self.assertEqual([vpc['VpcId'] for vpc in vpcs],
+                             ['vpc-1', 'vpc-2', 'vpc-3'])
+            stubber.assert_no_pending_responses()
+
+            stubber.add_response(
+                'describe_vpcs',
+                {'Vpcs': [{'VpcId': 'vpc-1'}, {'VpcId': 'vpc-2'}],
+                 'NextToken': 'page2'})
+            self.assertEqual(len(list(base.iter_client_call(
+                'describe_vpcs', result_key='Vpcs', max_items=2))), 2)
+            stubber.assert_no_pending_responses()
+
+            stubber.add_client_error('describe_vpcs', 'AuthFailure')
+            with self.assertRaises(NonRecoverableError):
+                list(base.iter_client_call('describe_vpcs'))
+
+    def test_iter_client_call_page_tokens(self):
+        client = MagicMock()
+        client.can_paginate.return_value = False
+        client.list_things.side_effect = [
+            {'Things': [1, 2], 'NextMarker': 'b'},
+            {'Things': [3], 'nextToken': 'c'},
+            {'Things': [4]},
+        ]
+        base = EC2Base('ctx_node', client=client)
+        base.type_name = 'thing'
+        pages = list(base.iter_client_call('list_things', {'Max': 2}))
+        self.assertEqual([page['Things'] for page in pages],
+                         [[1, 2], [3], [4]])
+        self.assertEqual(
+            [call[1] for call in client.list_things.call_args_list],
+            [{'Max': 2}, {'Max': 2, 'Marker': 'b'},
+             {'Max': 2, 'Marker': 'b', 'nextToken': 'c'}])
+
+        client.list_things.side_effect = None
+        client.list_things.return_value = {
+            'Things': [5], 'Marker': 'same'}
+        client.list_things.reset_mock()
+        self.assertEqual(
+            list(base.iter_client_call('list_things', None, 'Things')),
+            [5, 5])
+        self.assertEqual(client.list_things.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -23,6 +23,7 @@ from __future__ import unicode_literals
 from cloudify.exceptions import NonRecoverableError
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.ecs import ECSBase
 
 RESOURCE_TYPE = 'ECS Cluster'
@@ -43,6 +44,7 @@ class ECSCluster(ECSBase):
         self.describe_cluster_filter = {}
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self._properties:
@@ -69,6 +71,7 @@ class ECSCluster(ECSBase):
         """
         return self.make_client_call('create_cluster', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS ECS cluster.
@@ -26,6 +26,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.ecs import ECSBase
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -50,6 +51,7 @@ class ECSService(ECSBase):
         self.describe_service_filter = {}
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         try:
@@ -76,6 +78,7 @@ class ECSService(ECSBase):
         """
         return self.make_client_call('create_service', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS ECS Service.
@@ -90,6 +93,7 @@ class ECSService(ECSBase):
         self.logger.debug('Response: {}'.format(res))
         return res
 
+    @invalidates_properties
     def _update_service(self, params):
         """
         Updates an AWS ECS Service
@@ -26,6 +26,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.ecs import ECSBase
 
 from cloudify_aws.common import constants
@@ -48,6 +49,7 @@ class ECSTaskDefinition(ECSBase):
         self.describe_task_definition_filter = {}
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         try:
@@ -75,6 +77,7 @@ class ECSTaskDefinition(ECSBase):
         """
         return self.make_client_call('register_task_definition', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS ECS Task Definition.
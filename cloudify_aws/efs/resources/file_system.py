@@ -22,6 +22,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 # Local imports
 from cloudify_aws.efs import EFSBase
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 
 RESOURCE_TYPE = 'EFS File System'
 FILESYSTEM_ID = 'FileSystemId'
@@ -38,6 +39,7 @@ class EFSFileSystem(EFSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -63,6 +65,7 @@ class EFSFileSystem(EFSBase):
         """
         return self.make_client_call('create_file_system', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EFS File System.
@@ -18,6 +18,7 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 from cloudify_aws.efs import EFSBase
 # Boto
@@ -46,6 +47,7 @@ class EFSMountTarget(EFSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         params = {FILESYSTEM_ID: self.resource_id}
@@ -69,6 +71,7 @@ class EFSMountTarget(EFSBase):
         """
         return self.make_client_call('create_mount_target', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EFS Mount Target.
@@ -18,6 +18,7 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.efs import EFSBase
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 # Boto
@@ -38,6 +39,7 @@ class EFSFileSystemTags(EFSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -63,6 +65,7 @@ class EFSFileSystemTags(EFSBase):
         """
         return self.make_client_call('create_tags', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EFS File System Tags.
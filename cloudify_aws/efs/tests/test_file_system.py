@@ -23,7 +23,11 @@ from cloudify.exceptions import OperationRetry
 
 # Local imports
 from cloudify_aws.efs.resources import file_system
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 
@@ -103,7 +107,7 @@ class TestEFSFileSystem(TestBase):
         ):
             file_system.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('efs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('efs', **CLIENT_KWARGS)
 
         self.fake_client.create_file_system.assert_called_with(
             CreationToken='xxx-ccc'
@@ -121,7 +125,7 @@ class TestEFSFileSystem(TestBase):
 
         file_system.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('efs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('efs', **CLIENT_KWARGS)
 
         self.fake_client.delete_file_system.assert_called_with(
             FileSystemId='fs_id'
@@ -148,7 +152,7 @@ class TestEFSFileSystem(TestBase):
             resource_config={},
             iface=None)
 
-        self.fake_boto.assert_called_with('efs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('efs', **CLIENT_KWARGS)
 
         self.fake_client.delete_file_system.assert_called_with(
             FileSystemId='fs_id'
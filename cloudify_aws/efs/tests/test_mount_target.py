@@ -22,7 +22,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.efs.resources import mount_target
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 
@@ -137,7 +141,7 @@ class TestEFSMountTarget(TestBase):
 
         mount_target.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('efs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('efs', **CLIENT_KWARGS)
 
         self.fake_client.create_mount_target.assert_called_with(
             AutoScalingGroupName='test-autoscaling1',
@@ -163,7 +167,7 @@ class TestEFSMountTarget(TestBase):
 
         mount_target.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('efs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('efs', **CLIENT_KWARGS)
 
         self.fake_client.delete_mount_target.assert_called_with(
             MountTargetId='mount_id'
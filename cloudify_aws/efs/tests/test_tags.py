@@ -22,7 +22,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.efs.resources import tags
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 
@@ -104,7 +108,7 @@ class TestEFSFileSystemTagsTags(TestBase):
 
         tags.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('efs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('efs', **CLIENT_KWARGS)
 
         self.fake_client.create_tags.assert_called_with(
             FileSystemId='aws_net_id',
@@ -123,7 +127,7 @@ class TestEFSFileSystemTagsTags(TestBase):
 
         tags.delete(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('efs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('efs', **CLIENT_KWARGS)
 
         self.fake_client.delete_tags.assert_called_with(
             FileSystemId='aws_net_id', TagKeys=['Name']
@@ -16,9 +16,20 @@
     ~~~
     AWS EKS base interface
 """
+# Standard imports
+import time
+
 # Cloudify AWS
-from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify import ctx as _ctx
+from cloudify.exceptions import OperationRetry, NonRecoverableError
+from cloudify_aws.common import AWSResourceBase, memoized_properties
+from cloudify_aws.common.connection import ClientFactory
+
+# Runtime property with the waits in progress, by what they wait for.
+WAIT_PROGRESS = 'eks_wait'
+# Seconds that a wait may last in total, and between its checks.
+WAIT_TIMEOUT = 3600
+WAIT_INTERVAL = 30
 
 
 class EKSBase(AWSResourceBase):
@@ -31,10 +42,11 @@ class EKSBase(AWSResourceBase):
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         service = self.service_name
         AWSResourceBase.__init__(
-            self, client or Boto3Connection(ctx_node).client(service),
+            self, client or ClientFactory(ctx_node, service),
             resource_id=resource_id, logger=logger)
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self._properties:
@@ -50,6 +62,73 @@ class EKSBase(AWSResourceBase):
         """Gets the status of an external resource"""
         raise NotImplementedError()
 
+    @staticmethod
+    def _wait_progress(instance, target):
+        """The wait for target of this execution, see check_wait"""
+        waits = instance.runtime_properties.get(WAIT_PROGRESS) or {}
+        progress = waits.get(target)
+        # A wait left behind by another execution, e.g. one which was
+        # cancelled, is not continued.
+        if progress and progress.get('execution_id') == _ctx.execution_id:
+            return dict(progress)
+
+    def waiting(self, instance, target):
+        """Whether a wait for target is in progress, see check_wait"""
+        return bool(self._wait_progress(instance, target))
+
+    def check_wait(self, instance, target, status_good, status_failed=None,
+                   timeout=WAIT_TIMEOUT, interval=WAIT_INTERVAL):
+        """
+            Checks the status once, instead of blocking a worker until it
+            changes, and asks for the operation to be retried in interval
+            seconds while it is not good. The deadline and the number of
+            checks are kept in the runtime properties across retries of the
+            same execution.
+
+        :param instance: The node instance.
+        :param str target: What is waited for, e.g. cluster_active.
+        :param list status_good: The statuses which end the wait, None
+            for a resource which no longer exists.
+        :param list status_failed: The statuses which fail the wait.
+        :returns: The good status.
+        :raises: OperationRetry while waiting, NonRecoverableError on a
+            failed status or after timeout seconds.
+        """
+        waits = dict(instance.runtime_properties.get(WAIT_PROGRESS) or {})
+        progress = self._wait_progress(instance, target) or {
+            'deadline': time.time() + timeout, 'checks': 0,
+            'execution_id': _ctx.execution_id}
+        self.invalidate_properties()
+        status = self.status
+        progress['checks'] += 1
+        failed = status in (status_failed or [])
+        timed_out = time.time() >= progress['deadline']
+        if status in status_good or failed or timed_out:
+            waits.pop(target, None)
+            if waits:
+                instance.runtime_properties[WAIT_PROGRESS] = waits
+            else:
+                instance.runtime_properties.pop(WAIT_PROGRESS, None)
+        if status in status_good:
+            self.logger.info('{0} {1} reached {2} after {3} checks.'.format(
+                self.type_name, self.resource_id, target,
+                progress['checks']))
+            return status
+        if failed:
+            raise NonRecoverableError(
+                '{0} {1} is {2} while waiting for {3}.'.format(
+                    self.type_name, self.resource_id, status, target))
+        if timed_out:
+            raise NonRecoverableError(
+                'Timed out waiting for {0} {1} to reach {2}, it is {3}.'
+                .format(self.type_name, self.resource_id, target, status))
+        waits[target] = progress
+        instance.runtime_properties[WAIT_PROGRESS] = waits
+        raise OperationRetry(
+            '{0} {1} is {2}, waiting for {3}.'.format(
+                self.type_name, self.resource_id, status, target),
+            retry_after=interval)
+
     def create(self, params):
         """Creates a resource"""
         raise NotImplementedError()
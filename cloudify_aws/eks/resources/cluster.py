@@ -22,10 +22,11 @@ import json
 
 # Boto
 import boto3
-from botocore.exceptions import ClientError, ParamValidationError, WaiterError
+from botocore.exceptions import ClientError
 
 from cloudify.decorators import operation
-from cloudify.exceptions import OperationRetry, NonRecoverableError
+from cloudify.exceptions import NonRecoverableError
+from cloudify_common_sdk.utils import get_ctx_instance
 from cloudify_rest_client.exceptions import CloudifyClientError
 
 # Local imports
@@ -40,6 +41,9 @@ CLUSTER_NAME = 'name'
 CLUSTER_ARN = 'arn'
 CLUSTER = 'cluster'
 CLUSTERS = 'clusters'
+CLUSTER_ACTIVE = 'cluster_active'
+CLUSTER_DELETED = 'cluster_deleted'
+CLUSTER_FAILED = ['FAILED']
 
 CLUSTER_NAME_HEADER = 'x-k8s-aws-id'
 TOKEN_PREFIX = 'k8s-aws-v1.'
@@ -81,13 +85,11 @@ class EKSCluster(EKSBase):
         self.describe_param = {self._id_key: self.resource_id}
 
     def wait_for_status(self):
-        self.logger.info('Performing wait for cluster.')
-        try:
-            self.wait_for_cluster(
-                self.describe_params, 'cluster_active',
-                max_attempt=30)
-        except WaiterError:
-            raise OperationRetry('Waiting for nodegroup...')
+        # Retries while pending, the status_good path of the decorator
+        # runs once it is active.
+        self.check_wait(
+            get_ctx_instance(), CLUSTER_ACTIVE, ['ACTIVE'], CLUSTER_FAILED)
+        return False
 
     @property
     def status(self):
@@ -118,8 +120,9 @@ class EKSCluster(EKSBase):
             List AWS EKS clusters.
         """
         try:
-            return self.make_client_call('list_clusters', params)[CLUSTERS]
-        except (ParamValidationError, ClientError):
+            return list(self.iter_client_call(
+                'list_clusters', params, CLUSTERS))
+        except NonRecoverableError:
             return []
 
     def create(self, params):
@@ -132,30 +135,15 @@ class EKSCluster(EKSBase):
 
     @property
     def fargate_profiles(self):
-        return self.client.list_fargate_profiles(
-            clusterName=self.resource_id)['fargateProfileNames']
+        return list(self.iter_client_call(
+            'list_fargate_profiles', {'clusterName': self.resource_id},
+            'fargateProfileNames'))
 
     @property
     def nodegroups(self):
-        return self.client.list_nodegroups(
-            clusterName=self.resource_id)['nodegroups']
-
-    def wait_for_cluster(self, params, status, max_attempt=None):
-        """
-            wait for AWS EKS cluster.
-        """
-        max_attempt = max_attempt or 30
-        waiter = self.client.get_waiter(status)
-        try:
-            waiter.wait(
-                name=params.get(CLUSTER_NAME),
-                WaiterConfig={
-                    'Delay': 30,
-                    'MaxAttempts': max_attempt
-                }
-            )
-        except WaiterError:
-            raise OperationRetry('Waiting for cluster...')
+        return list(self.iter_client_call(
+            'list_nodegroups', {'clusterName': self.resource_id},
+            'nodegroups'))
 
     def get_kubeconf(self, client_config, params):
         """
@@ -275,9 +263,9 @@ def poststart(ctx, iface, resource_config, **_):
         'resource_id')
     if name:
         resource_config['name'] = name
-    # wait for cluster to be active
-    ctx.logger.info("Waiting for Cluster to become Active.")
-    iface.wait_for_cluster(resource_config, 'cluster_active')
+    # Check once whether the cluster is active, and retry until it is.
+    iface.check_wait(ctx.instance, CLUSTER_ACTIVE, ['ACTIVE'],
+                     CLUSTER_FAILED)
 
     store_kube_config_in_runtime = \
         ctx.node.properties['store_kube_config_in_runtime']
@@ -336,14 +324,14 @@ def poststart(ctx, iface, resource_config, **_):
 @decorators.aws_resource(EKSCluster, RESOURCE_TYPE, waits_for_status=False)
 def delete(ctx, iface, resource_config, **_):
     """Deletes an AWS EKS Cluster"""
-    utils.exit_on_substring(
-        iface,
-        'delete',
-        {CLUSTER_NAME: resource_config.get(CLUSTER_NAME)},
-        'ResourceNotFoundException')
-    # wait for cluster to be deleted
-    ctx.logger.info("Waiting for Cluster to be deleted")
-    iface.wait_for_cluster(resource_config, 'cluster_deleted')
+    # The cluster is only deleted once, the retries check whether it is gone.
+    if not iface.waiting(ctx.instance, CLUSTER_DELETED):
+        utils.exit_on_substring(
+            iface,
+            'delete',
+            {CLUSTER_NAME: resource_config.get(CLUSTER_NAME)},
+            'ResourceNotFoundException')
+    iface.check_wait(ctx.instance, CLUSTER_DELETED, [None], CLUSTER_FAILED)
 
 
 @operation
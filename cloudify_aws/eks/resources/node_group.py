@@ -21,18 +21,23 @@
 from __future__ import unicode_literals
 
 # Boto
-from botocore.exceptions import ClientError, WaiterError
+from botocore.exceptions import ClientError
 
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, invalidates_properties
 from cloudify_aws.eks import EKSBase
 from cloudify.exceptions import OperationRetry, NonRecoverableError
+from cloudify_common_sdk.utils import get_ctx_instance
 
 RESOURCE_TYPE = 'EKS Node Group'
 CLUSTER_NAME = 'clusterName'
 NODEGROUP_NAME = 'nodegroupName'
 NODEGROUP_ARN = 'nodegroupArn'
 NODEGROUP = 'nodegroup'
+NODEGROUP_ACTIVE = 'nodegroup_active'
+NODEGROUP_UPDATED = 'nodegroup_updated'
+NODEGROUP_DELETED = 'nodegroup_deleted'
+NODEGROUP_FAILED = ['CREATE_FAILED', 'DELETE_FAILED']
 
 
 class EKSNodeGroup(EKSBase):
@@ -85,16 +90,17 @@ class EKSNodeGroup(EKSBase):
         return self._describe_param
 
     @describe_param.setter
+    @invalidates_properties
     def describe_param(self, value):
         self._describe_param = value
 
     def wait_for_status(self):
-        try:
-            self.wait_for_nodegroup(
-                self.describe_param, 'nodegroup_active',
-                max_attempt=30)
-        except WaiterError:
-            raise OperationRetry('Waiting for nodegroup...')
+        # Retries while pending, the status_good path of the decorator
+        # runs once it is active.
+        self.check_wait(
+            get_ctx_instance(), NODEGROUP_ACTIVE, ['ACTIVE'],
+            NODEGROUP_FAILED)
+        return False
 
     # @property
     # def properties(self):
@@ -137,33 +143,13 @@ class EKSNodeGroup(EKSBase):
         params = params or self.describe_param
         return self.get_describe_result(params)
 
-    def wait_for_nodegroup(self, params, status, max_attempt=None):
-        """
-            wait for AWS EKS Node Group.
-        """
-
-        max_attempt = max_attempt or 30
-        waiter = self.client.get_waiter(status)
-        try:
-            waiter.wait(
-                clusterName=params.get(CLUSTER_NAME),
-                nodegroupName=params.get(NODEGROUP_NAME),
-                WaiterConfig={
-                    'Delay': 30,
-                    'MaxAttempts': max_attempt
-                }
-            )
-        except WaiterError:
-            self.logger.error('Timed out waiting {} {}'.format(
-                self.resource_id, self.status))
-            raise
-
     def start(self, params):
         """
             Updates the AWS EKS Node Group.
         """
         return self.make_client_call('update_nodegroup_config', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS EKS Node Group.
@@ -224,9 +210,7 @@ def create(ctx, iface, resource_config, **_):
             response.get(NODEGROUP).get("clusterName")
         ctx.instance.runtime_properties['create_response'] = \
             utils.JsonCleanuper(response).to_dict()
-    # wait for nodegroup to be active
-    ctx.logger.info("Waiting for NodeGroup to become Active")
-    iface.wait_for_nodegroup(resource_config, 'nodegroup_active')
+    # wait_for_status checks whether the nodegroup is active.
 
 
 @decorators.aws_resource(EKSNodeGroup, RESOURCE_TYPE, waits_for_status=False)
@@ -241,6 +225,11 @@ def start(ctx, iface, resource_config, **_):
         )
     utils.update_resource_id(ctx.instance, resource_id)
     iface = prepare_describe_node_group_filter(resource_config.copy(), iface)
+    # The update is only sent once, the retries check whether it is done.
+    if iface.waiting(ctx.instance, NODEGROUP_UPDATED):
+        iface.check_wait(ctx.instance, NODEGROUP_UPDATED, ['ACTIVE'],
+                         NODEGROUP_FAILED)
+        return
     valid_keys = [
         "clusterName", "nodegroupName", "labels", "taints",
         "scalingConfig", "updateConfig", "clientRequestToken"
@@ -255,19 +244,19 @@ def start(ctx, iface, resource_config, **_):
     if response and response.get(NODEGROUP):
         resource_arn = response.get(NODEGROUP).get(NODEGROUP_ARN)
         utils.update_resource_arn(ctx.instance, resource_arn)
-    # wait for nodegroup to be active
-    ctx.logger.info("Waiting for NodeGroup to become \"Active\".")
-    iface.wait_for_nodegroup(resource_config, 'nodegroup_active')
+    iface.check_wait(ctx.instance, NODEGROUP_UPDATED, ['ACTIVE'],
+                     NODEGROUP_FAILED)
 
 
 @decorators.aws_resource(EKSNodeGroup, RESOURCE_TYPE, waits_for_status=False)
 def delete(ctx, iface, resource_config, **_):
     """Deletes an AWS EKS Node Group"""
-
-    iface.delete(resource_config)
-    # wait for nodegroup to be deleted
-    ctx.logger.info("Waiting for NodeGroup to be deleted")
-    iface.wait_for_nodegroup(resource_config, 'nodegroup_deleted')
+    # The nodegroup is only deleted once, the retries check whether it is
+    # gone.
+    if not iface.waiting(ctx.instance, NODEGROUP_DELETED):
+        iface.delete(resource_config)
+    iface.check_wait(ctx.instance, NODEGROUP_DELETED, [None],
+                     NODEGROUP_FAILED)
 
 
 @decorators.aws_resource(class_decl=EKSNodeGroup,
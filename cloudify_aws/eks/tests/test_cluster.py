@@ -20,6 +20,7 @@ from mock import patch, MagicMock
 
 # Local imports
 from cloudify.state import current_ctx
+from cloudify.exceptions import OperationRetry, NonRecoverableError
 from cloudify_aws.common._compat import reload_module
 from cloudify_aws.common.tests.test_base import (
     TestBase,
@@ -159,8 +160,76 @@ class TestEKSCluster(TestBase):
     def test_delete(self):
         ctx = self.get_mock_ctx("Cluster")
         iface = MagicMock()
+        iface.waiting.return_value = False
         cluster.delete(ctx, iface, {})
         self.assertTrue(iface.delete.called)
+        iface.check_wait.assert_called_once_with(
+            ctx.instance, cluster.CLUSTER_DELETED, [None], ['FAILED'])
+
+        # A retry only checks whether the cluster is gone.
+        iface = MagicMock()
+        iface.waiting.return_value = True
+        cluster.delete(ctx, iface, {})
+        self.assertFalse(iface.delete.called)
+        self.assertTrue(iface.check_wait.called)
+
+    def test_check_wait(self):
+        ctx = self.get_mock_ctx("Cluster")
+        current_ctx.set(ctx)
+        iface = cluster.EKSCluster(ctx.node, 'test_cluster_name',
+                                   MagicMock(), MagicMock())
+        statuses = ['CREATING', 'CREATING', 'ACTIVE']
+        iface.client.describe_cluster.side_effect = lambda **_: {
+            'cluster': {'name': 'test_cluster_name',
+                        'status': statuses.pop(0)}}
+
+        for _ in range(2):
+            with self.assertRaises(OperationRetry) as retry:
+                iface.check_wait(ctx.instance, cluster.CLUSTER_ACTIVE,
+                                 ['ACTIVE'], ['FAILED'])
+            self.assertEqual(retry.exception.retry_after, 30)
+        progress = ctx.instance.runtime_properties['eks_wait']
+        self.assertEqual(progress['cluster_active']['checks'], 2)
+
+        self.assertEqual(
+            iface.check_wait(ctx.instance, cluster.CLUSTER_ACTIVE,
+                             ['ACTIVE'], ['FAILED']), 'ACTIVE')
+        self.assertNotIn('eks_wait', ctx.instance.runtime_properties)
+        self.assertEqual(iface.client.describe_cluster.call_count, 3)
+
+        # The deadline is kept across retries.
+        statuses = ['FAILED']
+        with self.assertRaises(NonRecoverableError):
+            iface.check_wait(ctx.instance, cluster.CLUSTER_ACTIVE,
+                             ['ACTIVE'], ['FAILED'])
+        statuses = ['DELETING']
+        ctx.instance.runtime_properties['eks_wait'] = {
+            cluster.CLUSTER_DELETED: {'deadline': 0, 'checks': 60,
+                                      'execution_id': ctx.execution_id}}
+        with self.assertRaises(NonRecoverableError):
+            iface.check_wait(ctx.instance, cluster.CLUSTER_DELETED, [None])
+
+    def test_check_wait_other_execution(self):
+        ctx = self.get_mock_ctx("Cluster")
+        ctx._execution_id = 'second_execution'
+        current_ctx.set(ctx)
+        iface = cluster.EKSCluster(ctx.node, 'test_cluster_name',
+                                   MagicMock(), MagicMock())
+        iface.client.describe_cluster.return_value = {
+            'cluster': {'name': 'test_cluster_name', 'status': 'DELETING'}}
+        # An expired wait left behind by a cancelled execution.
+        ctx.instance.runtime_properties['eks_wait'] = {
+            cluster.CLUSTER_DELETED: {'deadline': 0, 'checks': 60,
+                                      'execution_id': 'first_execution'}}
+        self.assertFalse(iface.waiting(ctx.instance, cluster.CLUSTER_DELETED))
+
+        with self.assertRaises(OperationRetry):
+            iface.check_wait(ctx.instance, cluster.CLUSTER_DELETED, [None])
+        progress = ctx.instance.runtime_properties['eks_wait'][
+            cluster.CLUSTER_DELETED]
+        self.assertEqual(progress['checks'], 1)
+        self.assertEqual(progress['execution_id'], 'second_execution')
+        self.assertTrue(iface.waiting(ctx.instance, cluster.CLUSTER_DELETED))
 
     @patch('cloudify_aws.eks.resources.cluster'
            '._store_kubeconfig_in_runtime_properties')
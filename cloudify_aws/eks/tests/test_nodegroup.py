@@ -20,6 +20,7 @@ from mock import patch, MagicMock
 
 # Local imports
 from cloudify.state import current_ctx
+from cloudify.exceptions import OperationRetry
 from cloudify_aws.common._compat import reload_module
 from cloudify_aws.common.tests.test_base import (
     TestBase,
@@ -27,7 +28,7 @@ from cloudify_aws.common.tests.test_base import (
 )
 from cloudify_aws.eks.resources.node_group import EKSNodeGroup
 from cloudify_aws.eks.resources import node_group
-from cloudify_aws.common import constants
+from cloudify_aws.common import constants, decorators
 
 
 class TestEKSNodeGroup(TestBase):
@@ -101,6 +102,18 @@ class TestEKSNodeGroup(TestBase):
             'test_node_group_name'
         )
 
+        # Another nodegroup is described once it is set.
+        self.node_group.describe_param = {
+            node_group.CLUSTER_NAME: 'test_cluster_name',
+            node_group.NODEGROUP_NAME: 'other_node_group_name'
+        }
+        self.node_group.properties
+        self.assertEqual(
+            self.node_group.client.describe_nodegroup.call_count, 2)
+        self.node_group.client.describe_nodegroup.assert_called_with(
+            clusterName='test_cluster_name',
+            nodegroupName='other_node_group_name')
+
     def test_class_status(self):
         response = {
             node_group.NODEGROUP: {
@@ -217,6 +230,44 @@ class TestEKSNodeGroup(TestBase):
             'test_node_group_name'
         )
 
+    def test_create_active(self):
+        ctx = self.get_mock_ctx(
+            "NodeGroup",
+            test_runtime_properties={
+                constants.EXTERNAL_RESOURCE_ID: 'test_node_group_name',
+                'create_response': {node_group.NODEGROUP: {
+                    'nodegroupName': 'test_node_group_name',
+                    'status': 'CREATING'}}},
+            ctx_operation_name='cloudify.interfaces.lifecycle.create')
+        ctx.operation._operation_context['retry_number'] = 1
+        current_ctx.set(ctx)
+        client = MagicMock()
+        client.describe_nodegroup.return_value = {
+            node_group.NODEGROUP: {
+                'nodegroupName': 'test_node_group_name',
+                'clusterName': 'test_cluster_name',
+                'status': 'ACTIVE'}}
+        iface = EKSNodeGroup(ctx.node, resource_id='test_node_group_name',
+                             client=client, logger=MagicMock())
+        iface.cluster_name = 'test_cluster_name'
+        iface.node_group_name = 'test_node_group_name'
+
+        function = MagicMock()
+        decorators._wait_for_status(
+            {'ctx': ctx, 'iface': iface, 'resource_config': {}},
+            ctx, ctx.operation, function,
+            status_pending=['CREATING', 'UPDATING'],
+            status_good=['ACTIVE', 'available'],
+            fail_on_missing=True)
+
+        function.assert_not_called()
+        self.assertEqual(
+            ctx.instance.runtime_properties['create_response']['status'],
+            'ACTIVE')
+        self.assertNotIn(node_group.NODEGROUP_ACTIVE,
+                         ctx.instance.runtime_properties.get(
+                             'eks_wait') or {})
+
     def test_start(self):
         ctx = self.get_mock_ctx("NodeGroup")
         valid_config = {
@@ -238,6 +289,7 @@ class TestEKSNodeGroup(TestBase):
             }
 
         iface.start = self.mock_return(response)
+        iface.waiting.return_value = False
         node_group.start(ctx, iface, extended_config)
         iface.start.assert_called_with(valid_config)
         self.assertEqual(
@@ -248,8 +300,61 @@ class TestEKSNodeGroup(TestBase):
     def test_delete(self):
         iface = MagicMock()
         ctx = self.get_mock_ctx("NodeGroup")
+        iface.waiting.return_value = False
         node_group.delete(ctx, iface, {})
         self.assertTrue(iface.delete.called)
+        iface.check_wait.assert_called_once_with(
+            ctx.instance, node_group.NODEGROUP_DELETED, [None],
+            node_group.NODEGROUP_FAILED)
+
+        iface = MagicMock()
+        iface.waiting.return_value = True
+        node_group.delete(ctx, iface, {})
+        self.assertFalse(iface.delete.called)
+
+    def test_start_and_delete_other_execution(self):
+        ctx = self.get_mock_ctx(
+            "NodeGroup",
+            test_runtime_properties={
+                constants.EXTERNAL_RESOURCE_ID: 'test_node_group_name'})
+        ctx._execution_id = 'second_execution'
+        current_ctx.set(ctx)
+        client = MagicMock()
+        client.describe_nodegroup.return_value = {
+            node_group.NODEGROUP: {
+                'nodegroupName': 'test_node_group_name',
+                'clusterName': 'test_cluster_name',
+                'status': 'UPDATING'}}
+        iface = EKSNodeGroup(ctx.node, resource_id='test_node_group_name',
+                             client=client, logger=MagicMock())
+        # Expired waits left behind by a cancelled execution.
+        stale = {'deadline': 0, 'checks': 120,
+                 'execution_id': 'first_execution'}
+        ctx.instance.runtime_properties['eks_wait'] = {
+            node_group.NODEGROUP_ACTIVE: dict(stale),
+            node_group.NODEGROUP_UPDATED: dict(stale),
+            node_group.NODEGROUP_DELETED: dict(stale)}
+        config = {node_group.CLUSTER_NAME: 'test_cluster_name',
+                  node_group.NODEGROUP_NAME: 'test_node_group_name'}
+
+        with self.assertRaises(OperationRetry):
+            node_group.start(ctx, iface, dict(config))
+        client.update_nodegroup_config.assert_called_once_with(**config)
+
+        client.describe_nodegroup.return_value[node_group.NODEGROUP][
+            'status'] = 'DELETING'
+        with self.assertRaises(OperationRetry):
+            node_group.delete(ctx, iface, dict(config))
+        client.delete_nodegroup.assert_called_once_with(**config)
+
+        waits = ctx.instance.runtime_properties['eks_wait']
+        for target in (node_group.NODEGROUP_UPDATED,
+                       node_group.NODEGROUP_DELETED):
+            self.assertEqual(waits[target]['checks'], 1)
+            self.assertEqual(waits[target]['execution_id'],
+                             'second_execution')
+        # The wait of the create hook is left alone.
+        self.assertEqual(waits[node_group.NODEGROUP_ACTIVE], stale)
 
     def test_check_drift(self):
         original_value = {
@@ -17,9 +17,9 @@
     AWS ELB classic health check interface
 """
 # Cloudify
-from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import decorators, utils, memoized_properties
 from cloudify_aws.elb import ELBBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'ELB classic health check'
@@ -36,11 +36,12 @@ class ELBClassicHealthCheck(ELBBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('elb'),
+            client or ClientFactory(ctx_node, 'elb'),
             logger)
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         return None
@@ -18,8 +18,9 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.elb import ELBBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'ELB classic Listener'
@@ -40,11 +41,12 @@ class ELBClassicListener(ELBBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('elb'),
+            client or ClientFactory(ctx_node, 'elb'),
             logger)
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         return None
@@ -67,6 +69,7 @@ class ELBClassicListener(ELBBase):
         """
         return self.make_client_call('create_load_balancer_listeners', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing ELB classic listener.
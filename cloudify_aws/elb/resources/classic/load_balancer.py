@@ -22,8 +22,9 @@ from botocore.exceptions import ClientError, ParamValidationError
 # Local imports
 from cloudify.exceptions import OperationRetry
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.elb import ELBBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'ELB Classic Load Balancer'
@@ -46,11 +47,12 @@ class ELBClassicLoadBalancer(ELBBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('elb'),
+            client or ClientFactory(ctx_node, 'elb'),
             logger)
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         try:
@@ -78,6 +80,7 @@ class ELBClassicLoadBalancer(ELBBase):
         """
         return self.make_client_call('create_load_balancer', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing ELB classic load balancer.
@@ -88,6 +91,7 @@ class ELBClassicLoadBalancer(ELBBase):
                           % (self.type_name, params))
         self.client.delete_load_balancer(**params)
 
+    @invalidates_properties
     def modify_attributes(self, params):
         """
             Modify a AWS ELB classic load balancer attributes.
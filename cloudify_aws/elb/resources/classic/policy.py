@@ -25,7 +25,8 @@ from cloudify.exceptions import OperationRetry
 from cloudify_aws.elb import ELBBase
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common import decorators, utils
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import memoized_properties, invalidates_properties
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'ELB classic policy'
@@ -46,11 +47,12 @@ class ELBClassicPolicy(ELBBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('elb'),
+            client or ClientFactory(ctx_node, 'elb'),
             logger)
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         return None
@@ -68,6 +70,7 @@ class ELBClassicPolicy(ELBBase):
         """
         return self.make_client_call('create_load_balancer_policy', params)
 
+    @invalidates_properties
     def create_sticky(self, params):
         """
             Create a new AWS ELB classic policy.
@@ -81,6 +84,7 @@ class ELBClassicPolicy(ELBBase):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def start(self, params):
         """
             Refresh the AWS ELB classic policies.
@@ -93,6 +97,7 @@ class ELBClassicPolicy(ELBBase):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing ELB classic policy.
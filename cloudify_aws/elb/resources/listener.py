@@ -24,8 +24,9 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.elb import ELBBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ARN
 
 
@@ -48,12 +49,13 @@ class ELBListener(ELBBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('elbv2'),
+            client or ClientFactory(ctx_node, 'elbv2'),
             logger)
         self._properties = {}
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -84,6 +86,7 @@ class ELBListener(ELBBase):
         '''
         return self.make_client_call('create_listener', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing ELB listener.
@@ -22,8 +22,9 @@ from cloudify.exceptions import NonRecoverableError
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.elb import ELBBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import (
     EXTERNAL_RESOURCE_ARN,
     EXTERNAL_RESOURCE_ID
@@ -50,13 +51,14 @@ class ELBLoadBalancer(ELBBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('elbv2'),
+            client or ClientFactory(ctx_node, 'elbv2'),
             logger)
         self.type_name = RESOURCE_TYPE
         self._properties = {}
         self._describe_call = 'describe_load_balancers'
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -90,6 +92,7 @@ class ELBLoadBalancer(ELBBase):
         '''
         return self.make_client_call('create_load_balancer', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing ELB load balancer.
@@ -100,6 +103,7 @@ class ELBLoadBalancer(ELBBase):
                           % (self.type_name, params))
         self.client.delete_load_balancer(**params)
 
+    @invalidates_properties
     def modify_attribute(self, params):
         '''
             Modify a AWS ELB load balancer attributes.
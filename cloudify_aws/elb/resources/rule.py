@@ -24,8 +24,9 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Local imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.elb import ELBBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ARN
 
 RESOURCE_TYPE = 'ELB Rule'
@@ -47,12 +48,13 @@ class ELBRule(ELBBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('elbv2'),
+            client or ClientFactory(ctx_node, 'elbv2'),
             logger)
         self._properties = {}
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -83,6 +85,7 @@ class ELBRule(ELBBase):
         '''
         return self.make_client_call('create_rule', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing ELB Rule.
@@ -21,8 +21,9 @@ from cloudify.exceptions import NonRecoverableError
 
 # Local imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.elb import ELBBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common.connection import ClientFactory
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'ELB Target Group'
@@ -42,12 +43,13 @@ class ELBTargetGroup(ELBBase):
             self,
             ctx_node,
             resource_id,
-            client or Boto3Connection(ctx_node).client('elbv2'),
+            client or ClientFactory(ctx_node, 'elbv2'),
             logger)
         self.type_name = RESOURCE_TYPE
         self._properties = {}
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self._properties:
@@ -82,6 +84,7 @@ class ELBTargetGroup(ELBBase):
         '''
         return self.make_client_call('create_target_group', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing ELB Target Group.
@@ -94,6 +97,7 @@ class ELBTargetGroup(ELBBase):
                           % (self.type_name, params))
         self.client.delete_target_group(**params)
 
+    @invalidates_properties
     def modify_attribute(self, params):
         '''
             Modify a AWS ELB Target Group attributes.
@@ -24,7 +24,11 @@ from cloudify.exceptions import OperationRetry
 # Local imports
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 from cloudify_aws.elb.resources.classic import load_balancer
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 from cloudify_aws.elb.resources.classic.load_balancer import (
@@ -224,7 +228,7 @@ class TestELBClassicLoadBalancer(TestBase):
         load_balancer.create(ctx=_ctx, resource_config=None, iface=None,
                              params=None)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.create_load_balancer.assert_called_with(
             LoadBalancerName='aws_resource', SecurityGroups=[], Subnets=[])
@@ -258,7 +262,7 @@ class TestELBClassicLoadBalancer(TestBase):
         iface.status = None
         load_balancer.start(ctx=_ctx, resource_config={'a': 'b'}, iface=iface)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.modify_load_balancer_attributes.assert_called_with(
             LoadBalancerName='aws_resource', a='b'
@@ -289,7 +293,7 @@ class TestELBClassicLoadBalancer(TestBase):
         # should be used resource config from inputs
         load_balancer.start(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.modify_load_balancer_attributes.assert_not_called()
 
@@ -317,7 +321,7 @@ class TestELBClassicLoadBalancer(TestBase):
         iface.status = None
         load_balancer.delete(ctx=_ctx, resource_config=None, iface=iface)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.delete_load_balancer.assert_called_with(
             LoadBalancerName='aws_resource'
@@ -348,7 +352,7 @@ class TestELBClassicLoadBalancer(TestBase):
 
         load_balancer.assoc(ctx=_ctx)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.register_instances_with_load_balancer.\
             assert_called_with(Instances=[{'InstanceId': 'ext_id'}],
@@ -381,7 +385,7 @@ class TestELBClassicLoadBalancer(TestBase):
         with self.assertRaises(OperationRetry):
             load_balancer.assoc(ctx=_ctx)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.register_instances_with_load_balancer.\
             assert_called_with(Instances=[{'InstanceId': 'ext_id'}],
@@ -412,7 +416,7 @@ class TestELBClassicLoadBalancer(TestBase):
 
         load_balancer.disassoc(ctx=_ctx)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.deregister_instances_from_load_balancer.\
             assert_called_with(Instances=[{'InstanceId': 'ext_id'}],
@@ -446,7 +450,7 @@ class TestELBClassicLoadBalancer(TestBase):
         with self.assertRaises(OperationRetry):
             load_balancer.disassoc(ctx=_ctx)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.deregister_instances_from_load_balancer.\
             assert_called_with(Instances=[{'InstanceId': 'ext_id'}],
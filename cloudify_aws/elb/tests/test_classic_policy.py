@@ -23,7 +23,11 @@ from cloudify.state import current_ctx
 # Local imports
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 from cloudify_aws.elb.resources.classic import policy
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 from cloudify_aws.elb.resources.classic.policy import (
@@ -155,7 +159,7 @@ class TestELBClassicPolicy(TestBase):
         policy.create(ctx=_ctx, resource_config=None, iface=None,
                       params=None)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.create_load_balancer_policy.assert_called_with(
             LoadBalancerName='ext_id', PolicyName='aws_resource')
@@ -186,7 +190,7 @@ class TestELBClassicPolicy(TestBase):
         policy.create_sticky(ctx=_ctx, resource_config=None, iface=None,
                              params=None)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.create_lb_cookie_stickiness_policy.assert_called_with(
             LoadBalancerName='ext_id', PolicyName='policy')
@@ -220,7 +224,7 @@ class TestELBClassicPolicy(TestBase):
 
         policy.start_sticky(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.set_load_balancer_policies_of_listener.\
             assert_called_with(LoadBalancerName='ext_id',
@@ -244,7 +248,7 @@ class TestELBClassicPolicy(TestBase):
 
         policy.delete(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('elb', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elb', **CLIENT_KWARGS)
 
         self.fake_client.delete_load_balancer_policy.assert_called_with(
             LoadBalancerName='aws_resource', PolicyName='policy'
@@ -24,7 +24,11 @@ from cloudify.exceptions import NonRecoverableError
 # Local imports
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 from cloudify_aws.elb.resources import load_balancer
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 from cloudify_aws.elb.resources.load_balancer import (
@@ -224,7 +228,7 @@ class TestELBLoadBalancer(TestBase):
         load_balancer.create(ctx=_ctx, resource_config=None, iface=None,
                              params=None)
 
-        self.fake_boto.assert_called_with('elbv2', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elbv2', **CLIENT_KWARGS)
 
         self.fake_client.create_load_balancer.assert_called_with(
             LoadBalancerArn='load_balancer', LoadBalancerName='loadbalancer',
@@ -313,7 +317,7 @@ class TestELBLoadBalancer(TestBase):
         load_balancer.modify(ctx=_ctx, resource_config=None, iface=None,
                              params=None)
 
-        self.fake_boto.assert_called_with('elbv2', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elbv2', **CLIENT_KWARGS)
 
         self.fake_client.modify_load_balancer_attributes.assert_not_called()
         self.assertNotIn(
@@ -345,7 +349,7 @@ class TestELBLoadBalancer(TestBase):
         load_balancer.modify(ctx=_ctx, resource_config=None, iface=None,
                              params=None)
 
-        self.fake_boto.assert_called_with('elbv2', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elbv2', **CLIENT_KWARGS)
 
         self.fake_client.modify_load_balancer_attributes.assert_not_called()
         self.assertNotIn(
@@ -378,7 +382,7 @@ class TestELBLoadBalancer(TestBase):
         load_balancer.modify(ctx=_ctx, resource_config=None, iface=None,
                              params=None)
 
-        self.fake_boto.assert_called_with('elbv2', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elbv2', **CLIENT_KWARGS)
 
         self.fake_client.modify_load_balancer_attributes.assert_called_with(
             Attributes='attr', LoadBalancerArn='def'
@@ -412,7 +416,7 @@ class TestELBLoadBalancer(TestBase):
 
         load_balancer.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('elbv2', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('elbv2', **CLIENT_KWARGS)
 
         self.fake_client.delete_load_balancer.assert_called_with(
             LoadBalancerArn='def'
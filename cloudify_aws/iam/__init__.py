@@ -17,8 +17,8 @@
     AWS IAM base interface
 '''
 # Cloudify AWS
-from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import AWSResourceBase, memoized_properties
+from cloudify_aws.common.connection import ClientFactory, Boto3Connection
 from cloudify_aws.common import utils
 from cloudify import ctx
 
@@ -34,20 +34,33 @@ class IAMBase(AWSResourceBase):
     '''
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         AWSResourceBase.__init__(
-            self, client or Boto3Connection(ctx_node).client('iam'),
+            self, client or ClientFactory(ctx_node, 'iam'),
             resource_id=resource_id, logger=logger)
+        self.ctx_node = ctx_node
+        self._account_id = None
 
-        if IAM_ACCESS in ctx_node.type_hierarchy:
+    @property
+    def account_id(self):
+        '''Gets the account ID, calling STS only on first use'''
+        if self._account_id:
+            return self._account_id
+        if IAM_ACCESS in self.ctx_node.type_hierarchy:
             if (ctx.operation.name == ACCESS_KEY_CONFIGURE):
                 targ = utils.find_rel_by_node_type(ctx.instance, IAM_USER)
                 aws_config = targ.target.node.properties.get('client_config')
-                boto3_connection = Boto3Connection(ctx_node,
+                boto3_connection = Boto3Connection(self.ctx_node,
                                                    aws_config=aws_config)
-                self.account_id = boto3_connection.get_account_id()
+                self._account_id = boto3_connection.get_account_id()
         else:
-            self.account_id = Boto3Connection(ctx_node).get_account_id()
+            self._account_id = Boto3Connection(self.ctx_node).get_account_id()
+        return self._account_id
+
+    @account_id.setter
+    def account_id(self, value):
+        self._account_id = value
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         raise NotImplementedError()
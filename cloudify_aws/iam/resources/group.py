@@ -21,6 +21,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.iam import IAMBase
 
 RESOURCE_TYPE = 'IAM Group'
@@ -36,6 +37,7 @@ class IAMGroup(IAMBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -56,6 +58,7 @@ class IAMGroup(IAMBase):
             return 'available'
         return None
 
+    @invalidates_properties
     def create(self, params):
         '''
             Create a new AWS IAM Group.
@@ -67,6 +70,7 @@ class IAMGroup(IAMBase):
         self.update_resource_id(res['Group'][RESOURCE_NAME])
         return self.resource_id, res['Group']['Arn']
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS IAM Group.
@@ -77,6 +81,7 @@ class IAMGroup(IAMBase):
                           % (self.type_name, params))
         self.client.delete_group(**params)
 
+    @invalidates_properties
     def attach_user(self, params=None):
         '''
             Attaches a User to a Group
@@ -88,6 +93,7 @@ class IAMGroup(IAMBase):
                           % (self.type_name, params))
         self.client.add_user_to_group(**params)
 
+    @invalidates_properties
     def detach_user(self, params=None):
         '''
             Detaches a User from a Group
@@ -99,6 +105,7 @@ class IAMGroup(IAMBase):
                           % (self.type_name, params))
         self.client.remove_user_from_group(**params)
 
+    @invalidates_properties
     def attach_policy(self, params=None):
         '''
             Attaches a Policy to a Group
@@ -110,6 +117,7 @@ class IAMGroup(IAMBase):
                           % (self.type_name, params))
         self.client.attach_group_policy(**params)
 
+    @invalidates_properties
     def detach_policy(self, params=None):
         '''
             Detaches a Policy from a Group
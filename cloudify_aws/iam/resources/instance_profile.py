@@ -22,6 +22,7 @@ from botocore.exceptions import ClientError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.iam import IAMBase
 
 RESOURCE_TYPE = 'IAM Instance Profile'
@@ -38,6 +39,7 @@ class IAMInstanceProfile(IAMBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -62,6 +64,7 @@ class IAMInstanceProfile(IAMBase):
         '''
         return self.make_client_call('create_instance_profile', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS IAM Profile.
@@ -70,6 +73,7 @@ class IAMInstanceProfile(IAMBase):
                           % (self.type_name, params))
         self.client.delete_instance_profile(**params)
 
+    @invalidates_properties
     def add_role_to_instance_profile(self, params=None):
         '''
             Adds a role to an AWS IAM Profile.
@@ -78,6 +82,7 @@ class IAMInstanceProfile(IAMBase):
                           % (self.type_name, params))
         self.client.add_role_to_instance_profile(**params)
 
+    @invalidates_properties
     def remove_role_from_instance_profile(self, params=None):
         '''
             Remove a role from an AWS IAM Profile.
@@ -25,6 +25,7 @@ from cloudify.exceptions import NonRecoverableError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.iam import IAMBase
 
 RESOURCE_TYPE = 'IAM Policy'
@@ -40,6 +41,7 @@ class IAMPolicy(IAMBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -66,6 +68,7 @@ class IAMPolicy(IAMBase):
         '''
         return self.make_client_call('create_policy', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS IAM Policy.
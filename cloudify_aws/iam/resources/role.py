@@ -24,6 +24,7 @@ from cloudify.exceptions import NonRecoverableError
 # Cloudify
 from cloudify_aws.iam import IAMBase
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 
 RESOURCE_TYPE = 'IAM Role'
 RESOURCE_NAME = 'RoleName'
@@ -38,6 +39,7 @@ class IAMRole(IAMBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         if not self.resource_id:
             return
@@ -65,6 +67,7 @@ class IAMRole(IAMBase):
         '''
         return self.make_client_call('create_role', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS IAM Role.
@@ -77,10 +80,8 @@ class IAMRole(IAMBase):
             self.client.delete_role(**params)
         except ClientError as e:
             if 'DeleteConflict' in str(e):
-                instance_profiles_list = self.client.list_instance_profiles()
-                instance_profiles = instance_profiles_list.get(
-                    'InstanceProfiles')
-                for instance_profile in instance_profiles:
+                for instance_profile in self.iter_client_call(
+                        'list_instance_profiles', None, 'InstanceProfiles'):
                     for role in instance_profile.get('Roles', []):
                         if self.resource_id in role.get('RoleName'):
                             pm = {
@@ -91,6 +92,7 @@ class IAMRole(IAMBase):
                             self.client.remove_role_from_instance_profile(**pm)
         self._properties = {}
 
+    @invalidates_properties
     def attach_policy(self, params):
         '''
             Attaches an IAM Policy to an IAM Role
@@ -101,6 +103,7 @@ class IAMRole(IAMBase):
         params.update(dict(RoleName=self.resource_id))
         self.client.attach_role_policy(**params)
 
+    @invalidates_properties
     def detach_policy(self, params):
         '''
             Detaches an IAM Policy from an IAM Role
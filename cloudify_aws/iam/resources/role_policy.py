@@ -20,6 +20,7 @@ from json import dumps as json_dumps
 
 # Cloudify
 from cloudify_aws.common import decorators, utils, constants as CTS
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.iam import IAMBase
 
 RESOURCE_TYPE = 'IAM Role Policy'
@@ -37,6 +38,7 @@ class IAMRolePolicy(IAMBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         return None
@@ -52,6 +54,7 @@ class IAMRolePolicy(IAMBase):
         '''
         return self.make_client_call('put_role_policy', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS IAM Role Policy.
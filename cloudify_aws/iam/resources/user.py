@@ -21,6 +21,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.iam import IAMBase
 from cloudify_aws.iam.resources.group import IAMGroup
 
@@ -37,6 +38,7 @@ class IAMUser(IAMBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
 
@@ -64,6 +66,7 @@ class IAMUser(IAMBase):
         '''
         return self.make_client_call('create_user', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS IAM User.
@@ -74,6 +77,7 @@ class IAMUser(IAMBase):
                           % (self.type_name, params))
         self.client.delete_user(**params)
 
+    @invalidates_properties
     def create_login_profile(self, params=None):
         '''
             Creates, or updates, a User Login Profile
@@ -95,6 +99,7 @@ class IAMUser(IAMBase):
                               % (self.type_name, params))
             self.client.create_login_profile(**params)
 
+    @invalidates_properties
     def delete_login_profile(self, params=None):
         '''
             Deletes a User Login Profile
@@ -106,6 +111,7 @@ class IAMUser(IAMBase):
                           % (self.type_name, params))
         self.client.delete_login_profile(**params)
 
+    @invalidates_properties
     def create_access_key(self, params=None):
         '''
             Creates, or updates, a User Access Key
@@ -119,6 +125,7 @@ class IAMUser(IAMBase):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def delete_access_key(self, params=None):
         '''
             Deletes a User Access Key
@@ -130,6 +137,7 @@ class IAMUser(IAMBase):
                           % (self.type_name, params))
         self.client.delete_access_key(**params)
 
+    @invalidates_properties
     def attach_policy(self, params=None):
         '''
             Attaches a Policy to a User
@@ -141,6 +149,7 @@ class IAMUser(IAMBase):
                           % (self.type_name, params))
         self.client.attach_user_policy(**params)
 
+    @invalidates_properties
     def detach_policy(self, params=None):
         '''
             Detaches a Policy from a User
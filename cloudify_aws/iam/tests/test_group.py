@@ -16,7 +16,7 @@
 import unittest
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 
 from cloudify.state import current_ctx
 
@@ -84,7 +84,8 @@ class TestIAMGroup(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
     def test_create(self, *_):
         _ctx = self.get_mock_ctx(
@@ -120,7 +121,8 @@ class TestIAMGroup(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.create_group.assert_called_with(
             GroupName='group_name_id', Path='some_path'
@@ -158,7 +160,8 @@ class TestIAMGroup(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.delete_group.assert_called_with(
             GroupName='group_name_id'
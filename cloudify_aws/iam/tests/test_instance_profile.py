@@ -49,7 +49,7 @@ class TestIAMInstanceProfile(TestBase):
         self.mock_patch.start()
         with patch('cloudify_aws.common.connection.'
                    'Boto3Connection.get_account_id'):
-            with patch('cloudify_aws.common.connection.'
+            with patch('cloudify_aws.common.utils.'
                        'get_client_config'):
                 self.instance_profile = instance_profile.IAMInstanceProfile(
                     ctx_node,
@@ -17,7 +17,7 @@ import json
 import unittest
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 
 from cloudify.state import current_ctx
 
@@ -125,7 +125,8 @@ class TestIAMPolicy(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1'
+            region_name='aq-testzone-1',
+            config=ANY
         )
 
     def test_create(self, *_):
@@ -156,7 +157,8 @@ class TestIAMPolicy(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.assertEqual(
             _ctx.instance.runtime_properties,
@@ -191,7 +193,8 @@ class TestIAMPolicy(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.create_policy.assert_called_with(
             Description='Grants access to EC2 network components',
@@ -228,7 +231,8 @@ class TestIAMPolicy(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.delete_policy.assert_called_with(
             PolicyArn='arn_id'
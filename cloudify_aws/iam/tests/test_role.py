@@ -18,7 +18,7 @@ import unittest
 import collections
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 from botocore.exceptions import UnknownServiceError
 from cloudify.state import current_ctx
 
@@ -172,7 +172,8 @@ class TestIAMRole(TestBase):
                 type_name,
                 aws_access_key_id='xxx',
                 aws_secret_access_key='yyy',
-                region_name='aq-testzone-1'
+                region_name='aq-testzone-1',
+                config=ANY
             )
 
     def test_create(self, *_):
@@ -215,7 +216,8 @@ class TestIAMRole(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.create_role.assert_called_with(
             AssumeRolePolicyDocument=ASSUME_STR,
@@ -273,7 +275,8 @@ class TestIAMRole(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.create_role.assert_called_with(
             AssumeRolePolicyDocument=ASSUME_STR,
@@ -319,7 +322,8 @@ class TestIAMRole(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.delete_role.assert_called_with(
             RoleName='role_name_id'
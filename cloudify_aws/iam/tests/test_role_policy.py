@@ -16,7 +16,7 @@ import unittest
 import collections
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 
 from cloudify.state import current_ctx
 
@@ -173,7 +173,8 @@ class TestIAMRolePolicy(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
     def test_create(self, *_):
         _ctx = self.get_mock_ctx(
@@ -209,7 +210,8 @@ class TestIAMRolePolicy(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.put_role_policy.assert_called_with(
             PolicyName='aws_resource', RoleName='subnet_id',
@@ -256,7 +258,8 @@ class TestIAMRolePolicy(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.delete_role_policy.assert_called_with(
             PolicyName='aws_resource', RoleName='subnet_id')
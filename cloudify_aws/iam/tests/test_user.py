@@ -16,7 +16,7 @@
 import unittest
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 
 from cloudify.state import current_ctx
 
@@ -83,7 +83,8 @@ class TestIAMUser(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
     def test_create(self, *_):
 
@@ -117,7 +118,8 @@ class TestIAMUser(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.create_user.assert_called_with(
             Path='user_path', UserName='user_name_id'
@@ -155,7 +157,8 @@ class TestIAMUser(TestBase):
             'iam',
             aws_access_key_id='xxx',
             aws_secret_access_key='yyy',
-            region_name='aq-testzone-1')
+            region_name='aq-testzone-1',
+            config=ANY)
 
         self.fake_client.delete_user.assert_called_with(
             UserName='user_name_id'
@@ -18,6 +18,7 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.kms.resources.key import KMSKey
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -36,6 +37,7 @@ class KMSKeyAlias(KMSKey):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         return None
 
@@ -56,6 +58,7 @@ class KMSKeyAlias(KMSKey):
     def disable(self, params):
         return None
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS KMS Key Alias.
@@ -18,6 +18,7 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.kms import KMSBase
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 # Boto
@@ -39,6 +40,7 @@ class KMSKeyGrant(KMSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         return None
 
@@ -53,6 +55,7 @@ class KMSKeyGrant(KMSBase):
         """
         return self.make_client_call('create_grant', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS KMS Key Grant.
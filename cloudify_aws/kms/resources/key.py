@@ -18,6 +18,7 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.kms import KMSBase
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 # Boto
@@ -38,6 +39,7 @@ class KMSKey(KMSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -63,6 +65,7 @@ class KMSKey(KMSBase):
         """
         return self.make_client_call('create_key', params)
 
+    @invalidates_properties
     def enable(self, params):
         """
             Enables an AWS KMS Key.
@@ -73,6 +76,7 @@ class KMSKey(KMSBase):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def disable(self, params):
         """
             Disables an AWS KMS Key.
@@ -83,6 +87,7 @@ class KMSKey(KMSBase):
         self.logger.debug('Response: %s' % res)
         return res
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS KMS Key.
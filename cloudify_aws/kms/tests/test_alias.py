@@ -23,7 +23,7 @@ from botocore.exceptions import UnknownServiceError
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
-from cloudify_aws.common.tests.test_base import CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import CLIENT_CONFIG, CLIENT_KWARGS
 from cloudify_aws.kms.tests.test_kms import TestKMS
 from cloudify_aws.kms.resources import alias
 
@@ -68,7 +68,7 @@ class TestKMSAlias(TestKMS):
             "Unknown service: 'kms'. Valid service names are: ['rds']"
         )
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
     def test_create(self):
         _ctx = self._prepare_context(ALIAS_TH, NODE_PROPERTIES)
@@ -78,7 +78,7 @@ class TestKMSAlias(TestKMS):
 
         alias.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
         self.fake_client.create_alias.assert_called_with(
             AliasName='alias/test_key', TargetKeyId='a'
@@ -97,7 +97,7 @@ class TestKMSAlias(TestKMS):
 
         alias.delete(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
         self.fake_client.delete_alias.assert_called_with(
             AliasName='alias/test_key'
@@ -120,7 +120,7 @@ class TestKMSAlias(TestKMS):
 
         alias.delete(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
         self.fake_client.delete_alias.assert_called_with(
             AliasName='aws_resource'
@@ -23,7 +23,7 @@ from cloudify_aws.common._compat import text_type
 
 
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
-from cloudify_aws.common.tests.test_base import CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import CLIENT_CONFIG, CLIENT_KWARGS
 from cloudify_aws.kms.tests.test_kms import TestKMS
 from cloudify_aws.kms.resources import grant
 
@@ -93,7 +93,7 @@ class TestKMSGrant(TestKMS):
             "Unknown service: 'kms'. Valid service names are: ['rds']"
         )
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
     def test_create(self):
         _ctx = self._prepare_context(
@@ -107,7 +107,7 @@ class TestKMSGrant(TestKMS):
         })
 
         grant.create(ctx=_ctx, resource_config=None, iface=None)
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
         self.fake_client.create_grant.assert_called_with(
             GranteePrincipal='ami_arn', KeyId='a', Name='TestGrant',
@@ -129,7 +129,7 @@ class TestKMSGrant(TestKMS):
 
         grant.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
         self.fake_client.revoke_grant.assert_called_with(
             GrantId='grant_id', KeyId='a'
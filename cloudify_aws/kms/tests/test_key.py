@@ -19,7 +19,7 @@ import unittest
 from mock import MagicMock
 
 # Local imports
-from cloudify_aws.common.tests.test_base import CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import CLIENT_CONFIG, CLIENT_KWARGS
 from cloudify_aws.kms.tests.test_kms import TestKMS
 from cloudify_aws.kms.resources import key
 
@@ -83,7 +83,7 @@ class TestKMSKey(TestKMS):
 
         key.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
         self.fake_client.create_key.assert_called_with(
             Description='An example CMK.',
@@ -104,7 +104,8 @@ class TestKMSKey(TestKMS):
 
         key.enable(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        # Nothing is sent to AWS, so no client is built.
+        self.fake_boto.assert_not_called()
 
         self.assertEqual(
             _ctx.instance.runtime_properties,
@@ -120,7 +121,8 @@ class TestKMSKey(TestKMS):
 
         key.disable(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        # Nothing is sent to AWS, so no client is built.
+        self.fake_boto.assert_not_called()
 
         self.assertEqual(
             _ctx.instance.runtime_properties,
@@ -136,7 +138,7 @@ class TestKMSKey(TestKMS):
 
         key.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('kms', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('kms', **CLIENT_KWARGS)
 
         self.fake_client.schedule_key_deletion.assert_called_with(
             KeyId='key_id'
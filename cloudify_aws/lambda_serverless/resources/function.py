@@ -27,6 +27,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.lambda_serverless import LambdaBase
 
 RESOURCE_ID = 'FunctionName'
@@ -52,6 +53,7 @@ class LambdaFunction(LambdaBase):
         self.resource_encoding = resource_encoding
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -78,6 +80,7 @@ class LambdaFunction(LambdaBase):
         '''
         return self.make_client_call('create_function', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS Lambda Function.
@@ -88,6 +91,7 @@ class LambdaFunction(LambdaBase):
                           % (self.type_name, params))
         self.client.delete_function(**params)
 
+    @invalidates_properties
     def invoke(self, params):
         '''
             Invokes an AWS Lambda Function.
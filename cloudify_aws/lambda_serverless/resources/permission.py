@@ -23,6 +23,7 @@ from uuid import uuid4
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.lambda_serverless import LambdaBase
 
 RESOURCE_TYPE = 'Lambda Permission'
@@ -40,6 +41,7 @@ class LambdaPermission(LambdaBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         raise NotImplementedError('permission')
@@ -55,6 +57,7 @@ class LambdaPermission(LambdaBase):
         '''
         return self.make_client_call('add_permission', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS Lambda Permission.
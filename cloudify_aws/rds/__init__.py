@@ -17,10 +17,12 @@
     AWS RDS base interface
 '''
 # Cloudify AWS
-from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.utils import check_region_name
-from cloudify_common_sdk.utils import get_client_config
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import AWSResourceBase, memoized_properties
+from cloudify_aws.common.utils import (
+    check_region_name,
+    get_resolved_client_config
+)
+from cloudify_aws.common.connection import ClientFactory
 
 
 class RDSBase(AWSResourceBase):
@@ -29,15 +31,15 @@ class RDSBase(AWSResourceBase):
     '''
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         if not client:
-            config_from_utils = get_client_config(
-                ctx_node=ctx_node, alternate_key='aws_config')
+            config_from_utils = get_resolved_client_config(ctx_node)
             check_region_name(config_from_utils.get('region_name'))
 
         AWSResourceBase.__init__(
-            self, client or Boto3Connection(ctx_node).client('rds'),
+            self, client or ClientFactory(ctx_node, 'rds'),
             resource_id=resource_id, logger=logger)
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         raise NotImplementedError()
@@ -26,6 +26,7 @@ from botocore.exceptions import ClientError
 from cloudify_aws.common._compat import text_type
 from cloudify.exceptions import NonRecoverableError
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.rds import RDSBase
 
 RESOURCE_TYPE = 'RDS DB Instance'
@@ -35,12 +36,14 @@ class DBInstance(RDSBase):
     '''
         AWS RDS DB Instance interface
     '''
+    status_waiters = {'available': 'db_instance_available'}
 
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         RDSBase.__init__(self, ctx_node, resource_id, client, logger)
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -63,6 +66,9 @@ class DBInstance(RDSBase):
             return None
         return props['DBInstanceStatus']
 
+    def get_waiter_args(self):
+        return dict(DBInstanceIdentifier=self.resource_id)
+
     def create(self, params):
         '''
             Create a new AWS RDS DB instance.
@@ -71,6 +77,7 @@ class DBInstance(RDSBase):
         '''
         return self.make_client_call('create_db_instance', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS RDS DB instance.
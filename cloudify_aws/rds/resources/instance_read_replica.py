@@ -19,6 +19,7 @@
 # Cloudify
 from cloudify.exceptions import NonRecoverableError
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.rds import RDSBase
 # Boto
 from botocore.exceptions import ClientError, ParamValidationError
@@ -36,6 +37,7 @@ class DBInstanceReadReplica(RDSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -64,6 +66,7 @@ class DBInstanceReadReplica(RDSBase):
         '''
         return self.make_client_call('create_db_instance_read_replica', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS RDS DB Instance Read Replica.
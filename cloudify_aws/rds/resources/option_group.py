@@ -19,6 +19,7 @@
 # Cloudify
 from cloudify.exceptions import OperationRetry
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.rds import RDSBase
 # Boto
 from botocore.exceptions import ClientError, ParamValidationError
@@ -35,6 +36,7 @@ class OptionGroup(RDSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -56,6 +58,7 @@ class OptionGroup(RDSBase):
             return 'available'
         return None
 
+    @invalidates_properties
     def include_option(self, option):
         '''Adds an option to an AWS RDS option group'''
         self.logger.debug('Including option in option group: %s' % option)
@@ -64,6 +67,7 @@ class OptionGroup(RDSBase):
             OptionsToInclude=[option],
             ApplyImmediately=True))['OptionGroup']
 
+    @invalidates_properties
     def remove_option(self, option_id):
         '''Removes an option from an AWS RDS option group'''
         self.logger.debug('Removing option from option group: %s' % option_id)
@@ -80,6 +84,7 @@ class OptionGroup(RDSBase):
         '''
         return self.make_client_call('create_option_group', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS RDS option group.
@@ -18,6 +18,7 @@
 '''
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.rds import RDSBase
 # Boto
 from botocore.exceptions import ClientError, ParamValidationError
@@ -34,6 +35,7 @@ class ParameterGroup(RDSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -59,6 +61,7 @@ class ParameterGroup(RDSBase):
         '''Adds a parameter to an AWS RDS parameter group'''
         return self.update(dict(Parameters=[param]))
 
+    @invalidates_properties
     def update(self, params):
         '''Updates an existing AWS RDS parameter group'''
         params['DBParameterGroupName'] = self.resource_id
@@ -73,6 +76,7 @@ class ParameterGroup(RDSBase):
         '''
         return self.make_client_call('create_db_parameter_group', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS RDS parameter group.
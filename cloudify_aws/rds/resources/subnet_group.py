@@ -18,6 +18,7 @@
 '''
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.rds import RDSBase
 from cloudify.exceptions import NonRecoverableError
 
@@ -36,6 +37,7 @@ class SubnetGroup(RDSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -66,6 +68,7 @@ class SubnetGroup(RDSBase):
         '''
         return self.make_client_call('create_db_subnet_group', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS RDS subnet group.
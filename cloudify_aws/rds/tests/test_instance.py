@@ -16,7 +16,7 @@
 import unittest
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 from botocore.exceptions import UnknownServiceError
 
 from cloudify.state import current_ctx
@@ -25,7 +25,11 @@ from cloudify.exceptions import NonRecoverableError
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.rds.resources import instance
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 # Constants
@@ -115,7 +119,8 @@ class TestRDSInstance(TestBase):
 
         self.fake_boto.assert_called_with('rds', aws_access_key_id='xxx',
                                           aws_secret_access_key='yyy',
-                                          region_name='aq-testzone-1')
+                                          region_name='aq-testzone-1',
+                                          config=ANY)
 
     def test_create(self):
         _test_name = 'test_create'
@@ -146,7 +151,7 @@ class TestRDSInstance(TestBase):
         )
 
         self.fake_boto.assert_called_with(
-            'rds', **CLIENT_CONFIG
+            'rds', **CLIENT_KWARGS
         )
         self.fake_client.create_db_instance.assert_called_with(
             AllocatedStorage='10', AvailabilityZone='aq-testzone-1a',
@@ -199,7 +204,7 @@ class TestRDSInstance(TestBase):
         )
 
         self.fake_boto.assert_called_with(
-            'rds', **CLIENT_CONFIG
+            'rds', **CLIENT_KWARGS
         )
         self.fake_client.delete_db_instance.assert_called_with(
             DBInstanceIdentifier='devdbinstance', SkipFinalSnapshot=True
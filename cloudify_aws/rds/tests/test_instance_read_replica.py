@@ -25,7 +25,11 @@ from cloudify.exceptions import NonRecoverableError
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.rds.resources import instance_read_replica
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 # Constants
@@ -102,7 +106,7 @@ class TestRDSInstanceReadReplica(TestBase):
             "Unknown service: 'rds'. Valid service names are: ['rds']"
         )
 
-        self.fake_boto.assert_called_with('rds', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('rds', **CLIENT_KWARGS)
 
     def test_create(self):
         _test_name = 'test_create'
@@ -135,7 +139,7 @@ class TestRDSInstanceReadReplica(TestBase):
         )
 
         self.fake_boto.assert_called_with(
-            'rds', **CLIENT_CONFIG
+            'rds', **CLIENT_KWARGS
         )
         self.fake_client.create_db_instance_read_replica.assert_called_with(
             AvailabilityZone='aq-testzone-1a',
@@ -184,7 +188,7 @@ class TestRDSInstanceReadReplica(TestBase):
         )
 
         self.fake_boto.assert_called_with(
-            'rds', **CLIENT_CONFIG
+            'rds', **CLIENT_KWARGS
         )
         self.fake_client.delete_db_instance.assert_called_with(
             DBInstanceIdentifier='devdbinstance', SkipFinalSnapshot=True
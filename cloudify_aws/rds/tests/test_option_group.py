@@ -16,7 +16,7 @@
 import unittest
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 from botocore.exceptions import UnknownServiceError, ClientError
 
 from cloudify.state import current_ctx
@@ -25,7 +25,11 @@ from cloudify.exceptions import OperationRetry
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.rds.resources import option_group
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 
 # Constants
 OPTION_GROUP_TH = ['cloudify.nodes.Root',
@@ -97,7 +101,8 @@ class TestRDSOptionGroup(TestBase):
 
         self.fake_boto.assert_called_with('rds', aws_access_key_id='xxx',
                                           aws_secret_access_key='yyy',
-                                          region_name='aq-testzone-1')
+                                          region_name='aq-testzone-1',
+                                          config=ANY)
 
     def test_create(self):
         _test_name = 'test_create'
@@ -122,7 +127,7 @@ class TestRDSOptionGroup(TestBase):
             ctx=_ctx, resource_config=None, iface=None
         )
         self.fake_boto.assert_called_with(
-            'rds', **CLIENT_CONFIG
+            'rds', **CLIENT_KWARGS
         )
         self.fake_client.create_option_group.assert_called_with(
             EngineName='mysql',
@@ -156,7 +161,7 @@ class TestRDSOptionGroup(TestBase):
             ctx=_ctx, resource_config=None, iface=iface
         )
         self.fake_boto.assert_called_with(
-            'rds', **CLIENT_CONFIG
+            'rds', **CLIENT_KWARGS
         )
         self.fake_client.delete_option_group.assert_called_with(
             OptionGroupName='dev-db-option-group'
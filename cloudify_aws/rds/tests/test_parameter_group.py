@@ -16,7 +16,7 @@
 import unittest
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 from botocore.exceptions import UnknownServiceError
 
 from cloudify.exceptions import OperationRetry
@@ -96,7 +96,8 @@ class TestRDSParameterGroup(TestBase):
 
         self.fake_boto.assert_called_with('rds', aws_access_key_id='xxx',
                                           aws_secret_access_key='yyy',
-                                          region_name='aq-testzone-1')
+                                          region_name='aq-testzone-1',
+                                          config=ANY)
 
     def test_configure_empty(self):
         _test_name = 'test_configure'
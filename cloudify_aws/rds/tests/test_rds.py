@@ -43,7 +43,7 @@ class TestRDSInit(TestServiceBase):
             'foo': 'bar'
         }
         with mock.patch(
-            "cloudify_aws.rds.Boto3Connection", boto_mock
+            "cloudify_aws.common.connection.Boto3Connection", boto_mock
         ):
             with self.assertRaises(NonRecoverableError):
                 RDSBase(ctx_node)
@@ -51,8 +51,10 @@ class TestRDSInit(TestServiceBase):
             ctx_node.properties[AWS_CONFIG_PROPERTY] = {
                 'region_name': 'aq-testzone-1'
             }
-            RDSBase(ctx_node)
-            boto_mock.assert_called_with(ctx_node)
+            iface = RDSBase(ctx_node)
+            boto_mock.assert_not_called()
+            self.assertEqual(iface.client, boto_client.client.return_value)
+            boto_mock.assert_called_with(ctx_node, None)
             boto_client.client.assert_called_with('rds')
 
 
@@ -16,7 +16,7 @@
 import unittest
 
 # Third party imports
-from mock import patch, MagicMock
+from mock import patch, MagicMock, ANY
 from botocore.exceptions import UnknownServiceError
 
 from cloudify.state import current_ctx
@@ -24,7 +24,11 @@ from cloudify.state import current_ctx
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.rds.resources import subnet_group
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 
 # Constants
@@ -93,7 +97,8 @@ class TestRDSSubnetGroup(TestBase):
 
         self.fake_boto.assert_called_with('rds', aws_access_key_id='xxx',
                                           aws_secret_access_key='yyy',
-                                          region_name='aq-testzone-1')
+                                          region_name='aq-testzone-1',
+                                          config=ANY)
 
     def test_create(self):
         _ctx = self.get_mock_ctx(
@@ -153,7 +158,7 @@ class TestRDSSubnetGroup(TestBase):
                             iface=None)
 
         self.fake_boto.assert_called_with(
-            'rds', **CLIENT_CONFIG
+            'rds', **CLIENT_KWARGS
         )
         self.fake_client.create_db_subnet_group.assert_called_with(
             DBSubnetGroupDescription='MySQL5.7 Subnet Group',
@@ -16,12 +16,63 @@
     ~~~~~~~
     AWS Route53 base interface
 '''
+# Standard imports
+import time
+import random
+
+# Third party imports
+from botocore.exceptions import ClientError, WaiterError
+
 # Cloudify AWS
 from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import memoized_properties, invalidates_properties
+from cloudify_aws.common.connection import ClientFactory
+from cloudify_aws.common.constants import THROTTLING_ERROR_CODES
+from cloudify_aws.common.decorators import get_wait_policy
 
 # pylint: disable=R0903
 
+# A ChangeBatch holds at most 1000 ResourceRecord elements and 32000
+# characters of values, with UPSERT changes counting twice.
+MAX_BATCH_RECORDS = 1000
+MAX_BATCH_CHARACTERS = 32000
+# Throttled ChangeBatches are sent again after an exponential backoff.
+CHANGE_MAX_ATTEMPTS = 8
+CHANGE_BACKOFF_BASE = 1
+CHANGE_BACKOFF_CAP = 30
+
+
+def change_size(change):
+    '''The records and value characters a change counts for in a batch'''
+    record_set = change['ResourceRecordSet']
+    values = [record.get('Value', '')
+              for record in record_set.get('ResourceRecords', [])]
+    weight = 2 if change['Action'] == 'UPSERT' else 1
+    return weight * max(len(values), 1), weight * sum(map(len, values))
+
+
+def batch_changes(changes):
+    '''
+        Packs changes, in order, into as few ChangeBatches as the
+        Route53 limits allow.
+    '''
+    batch = []
+    records = characters = 0
+    for change in changes:
+        change_records, change_characters = change_size(change)
+        too_many_records = records + change_records > MAX_BATCH_RECORDS
+        too_many_characters = \
+            characters + change_characters > MAX_BATCH_CHARACTERS
+        if batch and (too_many_records or too_many_characters):
+            yield batch
+            batch = []
+            records = characters = 0
+        batch.append(change)
+        records += change_records
+        characters += change_characters
+    if batch:
+        yield batch
+
 
 class Route53Base(AWSResourceBase):
     '''
@@ -29,10 +80,12 @@ class Route53Base(AWSResourceBase):
     '''
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         AWSResourceBase.__init__(
-            self, client or Boto3Connection(ctx_node).client('route53'),
+            self, client or ClientFactory(ctx_node, 'route53'),
             resource_id=resource_id, logger=logger)
+        self.ctx_node = ctx_node
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         raise NotImplementedError()
@@ -49,3 +102,67 @@ class Route53Base(AWSResourceBase):
     def delete(self, params=None):
         '''Deletes a resource'''
         raise NotImplementedError()
+
+    @invalidates_properties
+    def _change_with_backoff(self, params):
+        for attempt in range(CHANGE_MAX_ATTEMPTS):
+            try:
+                return self.client.change_resource_record_sets(
+                    **params)['ChangeInfo']
+            except ClientError as error:
+                code = error.response.get('Error', {}).get('Code')
+                if code not in THROTTLING_ERROR_CODES or \
+                        attempt == CHANGE_MAX_ATTEMPTS - 1:
+                    raise
+                delay = random.uniform(0, min(
+                    CHANGE_BACKOFF_CAP, CHANGE_BACKOFF_BASE * 2 ** attempt))
+                self.logger.debug(
+                    'ChangeBatch throttled ({0}), sending it again in '
+                    '{1:.1f} seconds.'.format(code, delay))
+                time.sleep(delay)
+
+    def wait_for_change(self, change_info):
+        '''
+            Waits for a change to be INSYNC, for no longer than the
+            in-process wait budget of the node.
+
+        :param dict change_info: The ChangeInfo of the change.
+        :returns: Whether the change is INSYNC.
+        '''
+        policy = get_wait_policy(self.ctx_node)
+        delay = max(int(policy['max_delay']), 1)
+        try:
+            self.client.get_waiter('resource_record_sets_changed').wait(
+                Id=change_info['Id'],
+                WaiterConfig=dict(
+                    Delay=delay,
+                    MaxAttempts=max(int(policy['budget'] // delay), 1)))
+        except WaiterError as error:
+            self.logger.debug('Change {0} is not INSYNC yet: {1}'.format(
+                change_info['Id'], error))
+            return False
+        return True
+
+    def submit_changes(self, hosted_zone_id, changes, wait=False):
+        '''
+            Sends changes in as few ChangeBatches as the limits allow,
+            backing off while they are throttled, and optionally waits
+            once for the last one to be INSYNC.
+
+        :param str hosted_zone_id: The hosted zone.
+        :param changes: An iterable of Change dicts.
+        :param bool wait: Whether to wait for the changes to propagate,
+            see wait_for_change.
+        :returns: The ChangeInfo of the last batch, or None without
+            changes.
+        '''
+        change_info = None
+        for batch in batch_changes(changes):
+            change_info = self._change_with_backoff(dict(
+                HostedZoneId=hosted_zone_id,
+                ChangeBatch=dict(Changes=batch)))
+            self.logger.debug('Sent {0} changes to {1}: {2}'.format(
+                len(batch), hosted_zone_id, change_info))
+        if change_info and wait:
+            self.wait_for_change(change_info)
+        return change_info
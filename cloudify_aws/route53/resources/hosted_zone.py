@@ -16,9 +16,6 @@
     ~~~~~~~~~~~~~~~~~~
     AWS Route53 Hosted Zone interface
 '''
-# Standard Imports
-from time import sleep
-
 # Third party imports
 from botocore.exceptions import ClientError, ParamValidationError
 
@@ -26,12 +23,38 @@ from cloudify_aws.common._compat import text_type
 
 # Local imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.common.connection import Boto3Connection
 from cloudify_aws.route53 import Route53Base
 
 RESOURCE_TYPE = 'Route53 Hosted Zone'
 
 
+def _record_name(name):
+    '''A record name as Route53 lists it'''
+    return name.lower().rstrip('.').replace('*', '\\052') + '.'
+
+
+def _record_key(record):
+    return (_record_name(record['Name']), record['Type'],
+            record.get('SetIdentifier'))
+
+
+def _normalize_record(record):
+    '''A record in the form in which it compares equal to the listed one'''
+    record = dict(record, Name=_record_name(record['Name']))
+    if 'TTL' in record:
+        record['TTL'] = int(record['TTL'])
+    if 'ResourceRecords' in record:
+        record['ResourceRecords'] = sorted(
+            record['ResourceRecords'], key=lambda value: value['Value'])
+    if 'AliasTarget' in record:
+        record['AliasTarget'] = dict(
+            record['AliasTarget'],
+            DNSName=_record_name(record['AliasTarget']['DNSName']))
+    return record
+
+
 class Route53HostedZone(Route53Base):
     '''
         AWS Route53 Hosted Zone interface
@@ -41,6 +64,7 @@ class Route53HostedZone(Route53Base):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         '''Gets the properties of an external resource'''
         if not self.resource_id:
@@ -61,6 +85,7 @@ class Route53HostedZone(Route53Base):
         '''
         return self.make_client_call('create_hosted_zone', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         '''
             Deletes an existing AWS Route53 Hosted Zone.
@@ -71,6 +96,7 @@ class Route53HostedZone(Route53Base):
                           % (self.type_name, params))
         return self.client.delete_hosted_zone(**params)
 
+    @invalidates_properties
     def change_resource_record_sets(self, params):
         '''
             Changes an AWS Route53 Resource Record Set.
@@ -89,9 +115,84 @@ class Route53HostedZone(Route53Base):
         self.logger.debug(
             'Listing Route53 Resource Record Sets in %s with parameters: %s'
             % (self.type_name, params))
-        res = self.client.list_resource_record_sets(**params)
-        self.logger.debug('Response: %s' % res)
-        return res['ResourceRecordSets']
+        return list(self.iter_client_call(
+            'list_resource_record_sets', params, 'ResourceRecordSets'))
+
+    def get_resource_record_sets(self, hosted_zone_id, names):
+        '''
+            Gets the current Resource Record Sets of some names, paging
+            from each name only until the listing moves past it.
+
+        :returns: A dict of (Name, Type, SetIdentifier) to record set.
+        '''
+        records = {}
+        for name in sorted(set(map(_record_name, names))):
+            for record in self.iter_client_call(
+                    'list_resource_record_sets',
+                    dict(HostedZoneId=hosted_zone_id, StartRecordName=name),
+                    'ResourceRecordSets'):
+                if _record_name(record['Name']) != name:
+                    break
+                records[_record_key(record)] = record
+        return records
+
+    def reconcile_resource_record_sets(self, hosted_zone_id, changes,
+                                       wait=False):
+        '''
+            Sends only the changes needed for the zone to match the
+            requested ones: CREATE for a missing record set, UPSERT for a
+            different one, DELETE for one which exists, and nothing for
+            a record set which is already as requested.
+
+        :param str hosted_zone_id: The hosted zone.
+        :param list changes: Change dicts, as for ChangeBatch.
+        :param bool wait: Whether to wait for the changes to propagate.
+        :returns: The changes sent.
+        '''
+        current = self.get_resource_record_sets(
+            hosted_zone_id,
+            [change['ResourceRecordSet']['Name'] for change in changes])
+        needed = []
+        for change in changes:
+            record = change['ResourceRecordSet']
+            key = _record_key(record)
+            existing = current.get(key)
+            if change.get('Action', '').upper() == 'DELETE':
+                # A DELETE must match the current record set exactly.
+                if existing:
+                    needed.append(dict(Action='DELETE',
+                                       ResourceRecordSet=existing))
+                current[key] = None
+                continue
+            if not existing:
+                needed.append(dict(Action='CREATE', ResourceRecordSet=record))
+            elif _normalize_record(existing) != _normalize_record(record):
+                needed.append(dict(Action='UPSERT', ResourceRecordSet=record))
+            current[key] = record
+        self.logger.debug('Sending {0} of {1} changes to {2}.'.format(
+            len(needed), len(changes), hosted_zone_id))
+        self.submit_changes(hosted_zone_id, needed, wait)
+        return needed
+
+    def purge_resource_record_sets(self):
+        '''
+            Deletes every Resource Record Set of the zone but its own SOA
+            and NS records, in batches.
+
+        :returns: The number of Resource Record Sets deleted.
+        '''
+        records = self.list_resource_record_sets(
+            dict(HostedZoneId=self.resource_id))
+        apex = [record['Name'] for record in records
+                if record['Type'] == 'SOA']
+        # The SOA and NS records of the apex cannot be deleted.
+        required = [(record_type, name) for name in apex
+                    for record_type in ['NS', 'SOA']]
+        changes = [dict(Action='DELETE', ResourceRecordSet=record)
+                   for record in records
+                   if (record['Type'], record['Name']) not in required]
+        self.submit_changes(self.resource_id, changes)
+        return len(changes)
 
 
 @decorators.aws_resource(Route53HostedZone, RESOURCE_TYPE)
@@ -148,22 +249,10 @@ def delete(ctx, iface, resource_config, resource_type,
         ctx.logger.warn(
             'Attempting to purge all Resource Record Sets from the %s'
             % resource_type)
-        # Iterate over all Record Sets
-        for record in iface.list_resource_record_sets(dict(
-                HostedZoneId=iface.resource_id,
-                MaxItems='100')):
-            # Skip default record types
-            if record['Type'] in ['NS', 'SOA']:
-                continue
-            # Delete the Record Set
-            iface.change_resource_record_sets(dict(
-                HostedZoneId=iface.resource_id,
-                ChangeBatch=dict(
-                    Changes=[dict(
-                        Action='DELETE',
-                        ResourceRecordSet=record)])))
-            # Sleep to avoid hitting AWS throttling / limits
-            sleep(1)
+        deleted = iface.purge_resource_record_sets()
+        ctx.logger.info(
+            'Deleted %s Resource Record Sets from the %s'
+            % (deleted, resource_type))
     iface.delete(resource_config)
 
 
@@ -205,6 +294,33 @@ def detect_vpc_region(client, vpc_id):
     return zones['AvailabilityZones'][0]['RegionName']
 
 
+def find_vpc_region(connection, vpc_id):
+    '''
+        Detects which AWS Region a VPC is associated with, first from its
+        subnets in the region of the connection, then by looking the VPC
+        up in all regions concurrently.
+    '''
+    client = connection.client('ec2')
+    region = detect_vpc_region(client, vpc_id)
+    if region:
+        return region
+    regions = [r['RegionName'] for r in
+               client.describe_regions().get('Regions', [])]
+
+    def vpc_exists(regional_client, _):
+        # A region which is not enabled for the account, or which is not
+        # reachable, does not fail the lookup in the other regions.
+        try:
+            vpcs = regional_client.describe_vpcs(
+                Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])
+        except ClientError:
+            return False
+        return bool(vpcs.get('Vpcs'))
+
+    found = connection.map_regions('ec2', regions, vpc_exists)
+    return next((r for r, exists in found.items() if exists), None)
+
+
 def associate(ctx_target, ctx_source, resource_config):
     vpc_id = utils.get_resource_id(
         node=ctx_target.node,
@@ -214,7 +330,7 @@ def associate(ctx_target, ctx_source, resource_config):
     vpccfg = resource_config.get('VPC', dict())
     vpccfg['VPCId'] = vpc_id
     if not vpccfg.get('VPCRegion'):
-        vpccfg['VPCRegion'] = detect_vpc_region(Boto3Connection(
-            ctx_source.node).client('ec2'), vpc_id)
+        vpccfg['VPCRegion'] = find_vpc_region(
+            Boto3Connection(ctx_source.node), vpc_id)
         resource_config['VPC'] = vpccfg
     return resource_config
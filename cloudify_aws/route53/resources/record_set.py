@@ -22,6 +22,7 @@ from cloudify_aws.common import decorators, utils
 from cloudify_aws.route53.resources.hosted_zone import Route53HostedZone
 
 RESOURCE_TYPE = 'Route53 Resource Record Set'
+RECONCILE = 'reconcile'
 
 
 @decorators.aws_resource(Route53HostedZone, RESOURCE_TYPE)
@@ -65,7 +66,11 @@ def create(ctx, iface, resource_config, **_):
         HostedZoneId=master_resource_config.get('HostedZoneId'),
         ChangeBatch=master_resource_config.get('ChangeBatch'),
     )
-    iface.change_resource_record_sets(payload)
+    if ctx.node.properties.get(RECONCILE):
+        iface.reconcile_resource_record_sets(
+            payload['HostedZoneId'], payload['ChangeBatch']['Changes'])
+    else:
+        iface.change_resource_record_sets(payload)
 
 
 @decorators.aws_resource(Route53HostedZone, RESOURCE_TYPE)
@@ -79,6 +84,15 @@ def delete(ctx, iface, resource_config, resource_type, **_):
         raise NonRecoverableError(
             'Missing required runtime properties to delete %s'
             % resource_type)
+    if ctx.node.properties.get(RECONCILE):
+        # Deletes whichever of the record sets still exist.
+        iface.reconcile_resource_record_sets(
+            params['HostedZoneId'],
+            [dict(Action='DELETE',
+                  ResourceRecordSet=change['ResourceRecordSet'])
+             for change in params['ChangeBatch']['Changes']
+             if change.get('Action', '').upper() != 'DELETE'])
+        return
     change = params['ChangeBatch']['Changes'][0]
     if change.get('Action', '').upper() == 'DELETE':
         ctx.logger.warn('%s was initially set to by deleted. Skipping...'
@@ -18,6 +18,7 @@ import unittest
 
 # Third party imports
 from mock import patch, MagicMock
+from botocore.exceptions import ClientError
 
 # Local imports
 from cloudify_aws.common._compat import reload_module
@@ -139,13 +140,65 @@ class TestHostedZone(TestBase):
 
     def test_class_list_resource(self):
         res_id = "test_resource"
-        params = {'ResourceRecordSets': 'listed'}
+        params = {'ResourceRecordSets': ['listed']}
         client = self.make_client_function("list_resource_record_sets",
                                            return_value=params)
         route = hosted_zone.Route53HostedZone(None, res_id, client,
                                               MagicMock())
         res = route.list_resource_record_sets(params)
-        self.assertEqual(res, "listed")
+        self.assertEqual(res, ["listed"])
+
+    def test_class_reconcile_resource_record_sets(self):
+        def record(name, value, ttl=300):
+            return {'Name': name, 'Type': 'A', 'TTL': ttl,
+                    'ResourceRecords': [{'Value': value}]}
+        current = [record('\\052.example.com.', '10.0.0.4'),
+                   record('a.example.com.', '10.0.0.1'),
+                   record('b.example.com.', '10.0.0.2'),
+                   record('c.example.com.', '10.0.0.3')]
+
+        def list_resource_record_sets(StartRecordName, **_):
+            return {'ResourceRecordSets': [
+                r for r in current if r['Name'] >= StartRecordName]}
+        client = self.make_client_function(
+            'list_resource_record_sets',
+            side_effect=list_resource_record_sets)
+        client.change_resource_record_sets = MagicMock(
+            return_value={'ChangeInfo': {'Id': 'change'}})
+        route = hosted_zone.Route53HostedZone(None, 'zone', client,
+                                              MagicMock())
+
+        sent = route.reconcile_resource_record_sets('zone', [
+            {'Action': 'UPSERT',
+             'ResourceRecordSet': record('A.example.com', '10.0.0.1', '300')},
+            {'Action': 'CREATE',
+             'ResourceRecordSet': record('*.example.com', '10.0.0.4')},
+            {'Action': 'CREATE',
+             'ResourceRecordSet': record('b.example.com', '10.0.1.2')},
+            {'Action': 'CREATE',
+             'ResourceRecordSet': record('d.example.com', '10.0.0.5')},
+            {'Action': 'DELETE',
+             'ResourceRecordSet': record('c.example.com', 'any')},
+            {'Action': 'DELETE',
+             'ResourceRecordSet': record('e.example.com', '10.0.0.6')}])
+
+        self.assertEqual(sent, [
+            {'Action': 'UPSERT',
+             'ResourceRecordSet': record('b.example.com', '10.0.1.2')},
+            {'Action': 'CREATE',
+             'ResourceRecordSet': record('d.example.com', '10.0.0.5')},
+            {'Action': 'DELETE', 'ResourceRecordSet': current[3]}])
+        client.change_resource_record_sets.assert_called_once_with(
+            HostedZoneId='zone', ChangeBatch={'Changes': sent})
+        self.assertEqual(client.list_resource_record_sets.call_count, 6)
+
+        # Nothing is sent once the zone matches.
+        client.change_resource_record_sets.reset_mock()
+        self.assertEqual(route.reconcile_resource_record_sets('zone', [
+            {'Action': 'CREATE',
+             'ResourceRecordSet': record('a.example.com', '10.0.0.1')}]),
+            [])
+        self.assertFalse(client.change_resource_record_sets.called)
 
     def test_prepare(self):
         ctx = self._get_ctx()
@@ -171,20 +224,36 @@ class TestHostedZone(TestBase):
         hosted_zone.delete(ctx, iface, resource_config, 'rest_type', False)
         self.assertTrue(iface.delete.called)
 
-        # default types skiped
-        iface.list_resource_record_sets = self.mock_return([{'Type': 'NS'}])
+        iface.purge_resource_record_sets = self.mock_return(3)
         hosted_zone.delete(ctx, iface, resource_config, 'rest_type', True)
-        self.assertTrue(iface.delete.called)
+        self.assertTrue(iface.purge_resource_record_sets.called)
+        self.assertEqual(iface.delete.call_count, 2)
 
-        iface.list_resource_record_sets = self.mock_return([{'Type': 'SOA'}])
-        hosted_zone.delete(ctx, iface, resource_config, 'rest_type', True)
-        self.assertTrue(iface.delete.called)
+    def test_class_purge_resource_record_sets(self):
+        records = [
+            {'Name': 'example.com.', 'Type': 'SOA'},
+            {'Name': 'example.com.', 'Type': 'NS'},
+            {'Name': 'sub.example.com.', 'Type': 'NS'}] + [
+            {'Name': 'host{0}.example.com.'.format(i), 'Type': 'A',
+             'ResourceRecords': [{'Value': '10.0.0.1'}]}
+            for i in range(1500)]
+        client = self.make_client_function(
+            'list_resource_record_sets',
+            return_value={'ResourceRecordSets': records})
+        client.change_resource_record_sets = MagicMock(
+            return_value={'ChangeInfo': {'Id': 'change'}})
+        route = hosted_zone.Route53HostedZone(None, 'zone', client,
+                                              MagicMock())
 
-        # non default
-        iface.list_resource_record_sets = self.mock_return([{'Type': None}])
-        hosted_zone.delete(ctx, iface, resource_config, 'rest_type', True)
-        self.assertTrue(iface.delete.called)
-        self.assertTrue(iface.change_resource_record_sets.called)
+        self.assertEqual(route.purge_resource_record_sets(), 1501)
+
+        batches = [kwargs['ChangeBatch']['Changes'] for _, kwargs in
+                   client.change_resource_record_sets.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [1000, 501])
+        self.assertEqual(batches[0][0], {
+            'Action': 'DELETE', 'ResourceRecordSet': records[2]})
+        # The zone is deleted next, so its changes are not waited for.
+        self.assertFalse(client.get_waiter.called)
 
     def test_prepare_assoc(self):
         ctx = self._get_relationship_context()
@@ -226,6 +295,42 @@ class TestHostedZone(TestBase):
         res = hosted_zone.detect_vpc_region(client, 'vpc_id')
         self.assertEqual(res, 'regname')
 
+    def test_find_vpc_region(self):
+        connection = MagicMock()
+        connection.client().describe_subnets = self.mock_return([])
+        connection.client().describe_regions = self.mock_return(
+            {'Regions': [{'RegionName': 'reg1'}, {'RegionName': 'reg2'}]})
+        connection.map_regions = MagicMock(
+            return_value={'reg1': False, 'reg2': True})
+        res = hosted_zone.find_vpc_region(connection, 'vpc_id')
+        self.assertEqual(res, 'reg2')
+        self.assertEqual(
+            connection.map_regions.call_args[0][:2], ('ec2', ['reg1', 'reg2']))
+
+        vpc_exists = connection.map_regions.call_args[0][2]
+        client = MagicMock()
+        client.describe_vpcs = self.mock_return({'Vpcs': []})
+        self.assertFalse(vpc_exists(client, 'reg1'))
+
+    def test_find_vpc_region_region_error(self):
+        connection = MagicMock()
+        connection.client().describe_subnets = self.mock_return([])
+        connection.client().describe_regions = self.mock_return(
+            {'Regions': [{'RegionName': 'reg1'}, {'RegionName': 'reg2'}]})
+        clients = {'reg1': MagicMock(), 'reg2': MagicMock()}
+        clients['reg1'].describe_vpcs.side_effect = ClientError(
+            {'Error': {'Code': 'AuthFailure', 'Message': 'disabled'}},
+            'DescribeVpcs')
+        clients['reg2'].describe_vpcs.return_value = {
+            'Vpcs': [{'VpcId': 'vpc_id'}]}
+        connection.map_regions.side_effect = \
+            lambda service_name, regions, function: dict(
+                (region, function(clients[region], region))
+                for region in regions)
+
+        res = hosted_zone.find_vpc_region(connection, 'vpc_id')
+        self.assertEqual(res, 'reg2')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -113,6 +113,30 @@ class TestRecordSet(TestBase):
             record_set.delete(ctx, zone, {}, 'res_type')
             self.assertTrue(zone.change_resource_record_sets.called)
 
+    def test_reconcile(self):
+        ctx = self.get_mock_ctx(
+            'test_properties', {'use_external_resource': False,
+                                'reconcile': True},
+            {'resource_config': False}, None)
+        changes = [{'Action': 'CREATE', 'ResourceRecordSet': 'rec_set'},
+                   {'Action': 'DELETE', 'ResourceRecordSet': 'old_set'}]
+        iface = MagicMock()
+        with patch(PATCH_PREFIX + 'utils') as utils:
+            utils.find_rels_by_type.return_value = []
+            utils.find_rel_by_node_type.return_value = None
+            record_set.create(ctx, iface, {
+                'HostedZoneId': 'zid', 'ChangeBatch': {'Changes': changes}})
+        iface.reconcile_resource_record_sets.assert_called_once_with(
+            'zid', changes)
+        self.assertFalse(iface.change_resource_record_sets.called)
+
+        iface = MagicMock()
+        ctx.instance.runtime_properties['resource_config'] = {
+            'HostedZoneId': 'zid', 'ChangeBatch': {'Changes': changes}}
+        record_set.delete(ctx, iface, {}, 'res_type')
+        iface.reconcile_resource_record_sets.assert_called_once_with(
+            'zid', [{'Action': 'DELETE', 'ResourceRecordSet': 'rec_set'}])
+
     def test_prepare_assoc(self):
         ctx = self._get_relationship_context()
         ctx.source.instance.runtime_properties['resource_config'] = {'VPC': {}}
@@ -15,9 +15,13 @@
 # Standard imports
 import unittest
 
+# Third party imports
+from mock import patch, MagicMock
+from botocore.exceptions import ClientError, WaiterError
+
 # Local imports
 from cloudify_aws.common.tests.test_base import TestServiceBase
-from cloudify_aws.route53 import Route53Base
+from cloudify_aws.route53 import Route53Base, batch_changes
 
 
 class TestRoute53Base(TestServiceBase):
@@ -27,6 +31,65 @@ class TestRoute53Base(TestServiceBase):
         self.base = Route53Base("ctx_node", resource_id=True,
                                 client=True, logger=None)
 
+    def test_batch_changes(self):
+        def change(action, values):
+            return {'Action': action, 'ResourceRecordSet': {
+                'ResourceRecords': [{'Value': value} for value in values]}}
+
+        # UPSERT changes count twice.
+        batches = list(batch_changes([change('UPSERT', ['a'])] * 600))
+        self.assertEqual([len(batch) for batch in batches], [500, 100])
+        # So do the characters of their values.
+        batches = list(batch_changes(
+            [change('DELETE', ['x' * 10000])] * 4))
+        self.assertEqual([len(batch) for batch in batches], [3, 1])
+        self.assertEqual(list(batch_changes([])), [])
+
+    def test_submit_changes_backoff(self):
+        throttled = ClientError(
+            {'Error': {'Code': 'PriorRequestNotComplete'}},
+            'ChangeResourceRecordSets')
+        client = MagicMock()
+        client.change_resource_record_sets.side_effect = [
+            throttled, throttled, {'ChangeInfo': {'Id': 'change'}}]
+        base = Route53Base("ctx_node", client=client, logger=MagicMock())
+        changes = [{'Action': 'DELETE', 'ResourceRecordSet': {}}]
+
+        with patch('cloudify_aws.route53.time.sleep') as sleep:
+            self.assertEqual(base.submit_changes('zone', changes, False),
+                             {'Id': 'change'})
+        self.assertEqual(sleep.call_count, 2)
+        self.assertFalse(client.get_waiter.called)
+
+        client.change_resource_record_sets.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidChangeBatch'}},
+            'ChangeResourceRecordSets')
+        with self.assertRaises(ClientError):
+            base.submit_changes('zone', changes)
+
+    def test_submit_changes_wait(self):
+        client = MagicMock()
+        client.change_resource_record_sets.return_value = {
+            'ChangeInfo': {'Id': 'change'}}
+        base = Route53Base(None, client=client, logger=MagicMock())
+        changes = [{'Action': 'DELETE', 'ResourceRecordSet': {}}]
+
+        base.submit_changes('zone', changes)
+        self.assertFalse(client.get_waiter.called)
+
+        # The wait is bounded by the in-process wait budget.
+        base.submit_changes('zone', changes, wait=True)
+        client.get_waiter.assert_called_once_with(
+            'resource_record_sets_changed')
+        client.get_waiter.return_value.wait.assert_called_once_with(
+            Id='change', WaiterConfig={'Delay': 15, 'MaxAttempts': 2})
+
+        client.get_waiter.return_value.wait.side_effect = WaiterError(
+            'resource_record_sets_changed', 'Max attempts exceeded', {})
+        self.assertEqual(base.submit_changes('zone', changes, wait=True),
+                         {'Id': 'change'})
+        self.assertFalse(base.wait_for_change({'Id': 'change'}))
+
 
 if __name__ == '__main__':
     unittest.main()
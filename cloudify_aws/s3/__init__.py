@@ -16,9 +16,24 @@
     ~~~
     AWS S3 base interface
 """
+# Standard Imports
+import os
+import time
+from itertools import islice
+
 # Cloudify AWS
+from cloudify.exceptions import NonRecoverableError
 from cloudify_aws.common import AWSResourceBase
-from cloudify_aws.common.connection import Boto3Connection
+from cloudify_aws.common import memoized_properties, invalidates_properties
+from cloudify_aws.common.connection import ClientFactory, run_concurrently
+from cloudify_aws.common.constants import (
+    MAX_CONCURRENCY,
+    MAX_CONCURRENCY_ENV
+)
+
+# delete_objects accepts at most 1000 keys per request.
+DELETE_BATCH_SIZE = 1000
+RETRYABLE_DELETE_ERRORS = ['InternalError', 'ServiceUnavailable', 'SlowDown']
 
 
 class S3Base(AWSResourceBase):
@@ -30,13 +45,11 @@ class S3Base(AWSResourceBase):
 
         AWSResourceBase.__init__(
             self,
-            client or Boto3Connection(
-                ctx_node,
-                aws_config
-            ).client('s3'),
+            client or ClientFactory(ctx_node, 's3', aws_config),
             resource_id=resource_id, logger=logger)
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         raise NotImplementedError()
@@ -53,3 +66,61 @@ class S3Base(AWSResourceBase):
     def delete(self, params=None):
         """Deletes a resource"""
         raise NotImplementedError()
+
+    @invalidates_properties
+    def _delete_batch(self, bucket, objects):
+        response = self.client.delete_objects(
+            Bucket=bucket, Delete={'Objects': objects, 'Quiet': True})
+        return len(objects), response.get('Errors') or []
+
+    def delete_keys(self, bucket, objects, max_workers=None, deadline=None):
+        """
+            Deletes keys, sending delete_objects requests of up to 1000
+            keys from a bounded pool of threads while objects is consumed.
+
+        :param str bucket: The bucket name.
+        :param objects: An iterable of dicts with a Key and an optional
+            VersionId.
+        :param int max_workers: The number of concurrent requests.
+        :param float deadline: A time.time() after which no more requests
+            are sent, once the first ones were.
+        :returns: The number of keys deleted and whether all of them were.
+        """
+        if max_workers is None:
+            max_workers = int(os.environ.get(
+                MAX_CONCURRENCY_ENV, MAX_CONCURRENCY))
+        max_workers = max(max_workers, 1)
+        objects = iter(objects)
+        deleted = 0
+        retryable = False
+        started = False
+        while True:
+            # Only the keys of the requests in flight are held in memory.
+            batches = []
+            for _ in range(max_workers):
+                batch = list(islice(objects, DELETE_BATCH_SIZE))
+                if not batch:
+                    break
+                batches.append((bucket, batch))
+            if not batches:
+                return deleted, not retryable
+            if started and deadline and time.time() >= deadline:
+                # There are keys left, they are listed again on retry.
+                return deleted, False
+            started = True
+            failed = []
+            for count, errors in run_concurrently(
+                    self._delete_batch, batches, max_workers):
+                deleted += count - len(errors)
+                failed.extend(errors)
+            self.logger.info(
+                'Deleted {0} keys from bucket {1}.'.format(deleted, bucket))
+            fatal = [error for error in failed
+                     if error.get('Code') not in RETRYABLE_DELETE_ERRORS]
+            if fatal:
+                raise NonRecoverableError(
+                    'Failed to delete {0} keys from bucket {1}, e.g. {2}: '
+                    '{3}.'.format(len(fatal), bucket, fatal[0].get('Key'),
+                                  fatal[0].get('Message')))
+            # Keys which failed for a while are listed again on retry.
+            retryable = retryable or bool(failed)
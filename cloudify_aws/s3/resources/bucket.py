@@ -16,10 +16,16 @@
     ~~~~~~~~~~~~~~
     AWS S3 Bucket interface
 """
+# Standard imports
+import time
+from collections import OrderedDict
+
 # Cloudify
 from cloudify_aws.s3 import S3Base
 from cloudify_aws.common import decorators
-from cloudify.exceptions import NonRecoverableError
+from cloudify_aws.common import memoized_properties, invalidates_properties
+from cloudify_aws.common.connection import run_concurrently
+from cloudify.exceptions import NonRecoverableError, OperationRetry
 
 # Boto
 from botocore.exceptions import ClientError, ParamValidationError
@@ -27,6 +33,14 @@ from botocore.exceptions import ClientError, ParamValidationError
 RESOURCE_TYPE = 'S3 Bucket'
 RESOURCE_NAME = 'Bucket'
 LOCATION = 'Location'
+BUCKET_REGION = 'BucketRegion'
+REGION_HEADER = 'x-amz-bucket-region'
+NOT_FOUND_CODES = ['404', 'NoSuchBucket', 'NotFound']
+FORBIDDEN_CODES = ['403', 'AccessDenied', 'Forbidden']
+# Seconds a delete operation empties a bucket for before it saves its
+# progress and retries.
+PURGE_TIME_BUDGET = 300
+PURGE_PROGRESS = 'purge_progress'
 
 
 class S3Bucket(S3Base):
@@ -40,25 +54,60 @@ class S3Bucket(S3Base):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
+        if not self.resource_id:
+            return None
         try:
-            resources = self.client.list_buckets()
+            response = self.client.head_bucket(Bucket=self.resource_id)
+            region = response.get(BUCKET_REGION) or response.get(
+                'ResponseMetadata', {}).get('HTTPHeaders', {}).get(
+                    REGION_HEADER)
+            if not region:
+                location = self.client.get_bucket_location(
+                    Bucket=self.resource_id)
+                # Buckets in us-east-1 have no location constraint.
+                region = location.get('LocationConstraint') or 'us-east-1'
         except (ParamValidationError, ClientError):
-            pass
-        else:
-            for resource in resources:
-                if resource.get(RESOURCE_NAME) is self.resource_id:
-                    return resource
             return None
+        return {RESOURCE_NAME: self.resource_id, BUCKET_REGION: region}
 
     @property
     def status(self):
         """Gets the status of an external resource"""
-        props = self.properties
-        if not props:
+        if not self.properties:
             return None
-        return props['Status']
+        return 'available'
+
+    def bucket_exists(self, bucket):
+        """
+            Checks whether a bucket name is taken, also by another account.
+        """
+        try:
+            self.client.head_bucket(Bucket=bucket)
+        except ClientError as error:
+            code = error.response.get('Error', {}).get('Code')
+            if code in NOT_FOUND_CODES:
+                return False
+            if code in FORBIDDEN_CODES:
+                return True
+            raise
+        return True
+
+    def buckets_exist(self, buckets, max_workers=None):
+        """
+            Checks many bucket names at once, in parallel.
+
+        :param list buckets: Bucket names.
+        :param int max_workers: The maximum number of concurrent checks.
+        :returns: An OrderedDict of bucket name to whether it exists.
+        """
+        buckets = list(OrderedDict.fromkeys(buckets))
+        results = run_concurrently(
+            self.bucket_exists, [(bucket,) for bucket in buckets],
+            max_workers=max_workers)
+        return OrderedDict(zip(buckets, results))
 
     def create(self, params):
         """
@@ -66,6 +115,7 @@ class S3Bucket(S3Base):
         """
         return self.make_client_call('create_bucket', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS S3 Bucket.
@@ -74,6 +124,7 @@ class S3Bucket(S3Base):
                           % (self.type_name, params))
         self.client.delete_bucket(**params)
 
+    @invalidates_properties
     def put_public_access_block(self, params):
         """
             put PublicAccessBlock configuration.
@@ -88,19 +139,42 @@ class S3Bucket(S3Base):
             }
         )
 
-    def delete_objects(self, bucket):
-        list_objects = self.client.list_objects(Bucket=bucket)
-        for object in list_objects.get('Contents', []):
-            key = object.get('Key')
-            if key:
-                self.logger.debug(
-                    'Deleting object {0} from bucket {1}.'
-                    .format(key, bucket))
-                delete_object = \
-                    self.client.delete_object(
-                        Bucket=bucket, Key=key)
-                self.logger.debug(
-                    'Response {0}'.format(delete_object))
+    def iter_object_versions(self, bucket):
+        """
+            Yields the Key and VersionId of every object version and delete
+            marker of a bucket, or only the Key of every object where the
+            endpoint does not implement versioning.
+        """
+        try:
+            for page in self.iter_client_call(
+                    'list_object_versions', {'Bucket': bucket},
+                    fatal_handled_exceptions=(ParamValidationError,)):
+                for version in (page.get('Versions') or []) + \
+                        (page.get('DeleteMarkers') or []):
+                    yield {'Key': version['Key'],
+                           'VersionId': version['VersionId']}
+        except ClientError as error:
+            if error.response.get('Error', {}).get('Code') != \
+                    'NotImplemented':
+                raise
+            for content in self.iter_client_call(
+                    'list_objects', {'Bucket': bucket}, 'Contents'):
+                yield {'Key': content['Key']}
+
+    def delete_objects(self, bucket, max_workers=None, deadline=None):
+        """
+            Empties a bucket, deleting its object versions in batches while
+            paging through them, see delete_keys.
+
+        :param str bucket: The bucket name.
+        :param int max_workers: The number of concurrent requests.
+        :param float deadline: A time.time() after which no more requests
+            are sent.
+        :returns: The number of keys deleted and whether the bucket is now
+            empty.
+        """
+        return self.delete_keys(bucket, self.iter_object_versions(bucket),
+                                max_workers, deadline)
 
 
 @decorators.aws_resource(S3Bucket, RESOURCE_TYPE)
@@ -151,6 +225,17 @@ def delete(ctx, iface, resource_config, **_):
         bucket = iface.resource_id
         resource_config.update({RESOURCE_NAME: bucket})
 
+    # Empty the bucket first, resuming the progress of previous retries.
+    progress = ctx.instance.runtime_properties.get(PURGE_PROGRESS, {})
+    deleted, empty = iface.delete_objects(
+        bucket, deadline=time.time() + PURGE_TIME_BUDGET)
+    progress['deleted'] = progress.get('deleted', 0) + deleted
+    if not empty:
+        ctx.instance.runtime_properties[PURGE_PROGRESS] = progress
+        raise OperationRetry(
+            'Deleted {0} keys from bucket {1} so far.'.format(
+                progress['deleted'], bucket))
+    ctx.instance.runtime_properties.pop(PURGE_PROGRESS, None)
+
     # Actually delete the resource
-    iface.delete_objects(bucket)
     iface.delete(resource_config)
@@ -19,7 +19,12 @@
 # Standard Imports
 import os
 import sys
+import shutil
+import hashlib
+import tarfile
+import zipfile
 import tempfile
+import mimetypes
 
 # Third Party Imports
 from botocore.exceptions import ClientError, ParamValidationError
@@ -34,7 +39,9 @@ from cloudify.exceptions import (
 
 # Local Imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.s3 import S3Base
+from cloudify_aws.common.connection import run_concurrently
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
 RESOURCE_TYPE = 'S3 Bucket Object'
@@ -48,6 +55,24 @@ OBJECT_SOURCE_TYPE = 'source_type'
 OBJECT_LOCAL_SOURCE = 'local'
 OBJECT_REMOTE_SOURCE = 'remote'
 OBJECT_BYTES_SOURCE = 'bytes'
+OBJECT_DIRECTORY_SOURCE = 'directory'
+OBJECT_TRANSFER_CONFIG = 'transfer_config'
+OBJECT_DELETE_STALE = 'delete_stale'
+SYNC_SUMMARY = 'sync_summary'
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2',
+                      '.tbz2', '.tar.xz', '.txz')
+# Defaults of the boto3 TransferConfig used for local and remote sources,
+# overridden by the transfer_config node property.
+TRANSFER_CONFIG = {
+    'multipart_threshold': 8 * 1024 * 1024,
+    'multipart_chunksize': 16 * 1024 * 1024,
+    'max_concurrency': 10,
+    'io_chunksize': 1024 * 1024,
+}
+# The parts of each file of a directory source are sent by fewer threads,
+# as the files themselves are uploaded concurrently.
+SYNC_MAX_CONCURRENCY = 2
+CHECKSUM_ALGORITHM = 'checksum_algorithm'
 
 
 class S3BucketObject(S3Base):
@@ -79,6 +104,7 @@ class S3BucketObject(S3Base):
         self._bucket_name = value
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -107,6 +133,148 @@ class S3BucketObject(S3Base):
         """
         return self.make_client_call('put_object', params)
 
+    def _transfer_args(self, params, transfer_config):
+        # s3transfer is only imported by operations which upload files.
+        from boto3.s3.transfer import S3Transfer, TransferConfig
+        transfer_config = dict(TRANSFER_CONFIG, **(transfer_config or {}))
+        extra_args = dict(
+            (key, value) for key, value in params.items()
+            if key not in [BUCKET, OBJECT_KEY, BUCKET_OBJECT_BODY])
+        checksum = transfer_config.pop(CHECKSUM_ALGORITHM, None)
+        if checksum:
+            # Flexible checksums need s3transfer 0.6.0 (boto3 1.24.0), the
+            # Python 3.6 requirements are older.
+            if 'ChecksumAlgorithm' not in S3Transfer.ALLOWED_UPLOAD_ARGS:
+                import s3transfer
+                raise NonRecoverableError(
+                    '{0} is not supported by the installed s3transfer {1}, '
+                    'it requires s3transfer 0.6.0 or later.'.format(
+                        CHECKSUM_ALGORITHM, s3transfer.__version__))
+            extra_args.setdefault('ChecksumAlgorithm', checksum)
+        unsupported = sorted(
+            set(extra_args) - set(S3Transfer.ALLOWED_UPLOAD_ARGS))
+        if unsupported:
+            raise NonRecoverableError(
+                'Parameters {0} are not supported when uploading a {1} or '
+                '{2} source.'.format(unsupported, OBJECT_LOCAL_SOURCE,
+                                     OBJECT_REMOTE_SOURCE))
+        return dict(Bucket=params[BUCKET],
+                    Key=params[OBJECT_KEY],
+                    ExtraArgs=extra_args,
+                    Config=TransferConfig(**transfer_config))
+
+    @invalidates_properties
+    def upload(self, source, params, transfer_config=None):
+        """
+            Uploads a local file or a readable stream through the boto3
+            transfer manager, in parallel parts above multipart_threshold.
+
+        :param source: A file path, or a file object which is read once.
+        :param dict params: The put_object parameters, Bucket and Key
+            included.
+        :param dict transfer_config: Overrides of TRANSFER_CONFIG and an
+            optional checksum_algorithm.
+        """
+        kwargs = self._transfer_args(params, transfer_config)
+        self.logger.debug('Uploading {0} to {1}/{2}.'.format(
+            source, kwargs['Bucket'], kwargs['Key']))
+        # Imported with boto3.s3.transfer by _transfer_args.
+        from boto3.exceptions import S3UploadFailedError
+        try:
+            if hasattr(source, 'read'):
+                self.client.upload_fileobj(source, **kwargs)
+            else:
+                self.client.upload_file(source, **kwargs)
+        except (ClientError, S3UploadFailedError) as error:
+            _, _, tb = sys.exc_info()
+            raise NonRecoverableError(
+                'Failed to upload {0}: {1}'.format(source, error),
+                causes=[exception_to_error_cause(error, tb)])
+        finally:
+            self.invalidate_properties()
+
+    def list_prefix(self, bucket, prefix):
+        """
+            Lists the keys under a prefix once.
+
+        :returns: A dict of key to ETag.
+        """
+        return dict(
+            (content['Key'], content.get('ETag', '').strip('"'))
+            for content in self.iter_client_call(
+                'list_objects_v2', {BUCKET: bucket, 'Prefix': prefix},
+                'Contents'))
+
+    def sync_directory(self, directory, params, transfer_config=None,
+                       delete_stale=False, max_workers=None):
+        """
+            Uploads the files of a directory under the Key prefix, skipping
+            those whose ETag is already the one S3 has for their key.
+
+        :param str directory: The local directory.
+        :param dict params: The put_object parameters, Bucket and Key
+            included. Key is the prefix.
+        :param dict transfer_config: Overrides of TRANSFER_CONFIG, with
+            max_concurrency defaulting to SYNC_MAX_CONCURRENCY.
+        :param bool delete_stale: Whether keys under the prefix without a
+            local file are deleted.
+        :param int max_workers: The number of concurrent uploads.
+        :returns: A dict with the uploaded, unchanged and deleted counts.
+        """
+        bucket = params[BUCKET]
+        prefix = sync_prefix(params[OBJECT_KEY])
+        transfer_config = dict(transfer_config or {})
+        transfer_config.setdefault('max_concurrency', SYNC_MAX_CONCURRENCY)
+        config = dict(TRANSFER_CONFIG, **transfer_config)
+        remote = self.list_prefix(bucket, prefix)
+        files = [(relative_path, os.path.join(directory, relative_path))
+                 for relative_path in _walk_files(directory)]
+        etags = run_concurrently(
+            file_etag,
+            [(path, config['multipart_threshold'],
+              config['multipart_chunksize']) for _, path in files],
+            max_workers)
+        uploads = []
+        for (relative_path, path), etag in zip(files, etags):
+            key = prefix + relative_path.replace(os.sep, '/')
+            if remote.pop(key, None) == etag:
+                continue
+            object_params = dict(params, Key=key)
+            if 'ContentType' not in params:
+                content_type, _ = mimetypes.guess_type(path)
+                if content_type:
+                    object_params['ContentType'] = content_type
+            uploads.append((path, object_params, transfer_config))
+        self.logger.info(
+            'Uploading {0} of {1} files to {2}/{3}.'.format(
+                len(uploads), len(files), bucket, prefix))
+        # Each upload sends its parts from a pool of its own, of at most
+        # max_concurrency threads, for max_workers * max_concurrency in all.
+        run_concurrently(self.upload, uploads, max_workers)
+        deleted = 0
+        if delete_stale and remote:
+            deleted, _ = self.delete_keys(
+                bucket, [{OBJECT_KEY: key} for key in sorted(remote)],
+                max_workers)
+        return {'uploaded': len(uploads),
+                'unchanged': len(files) - len(uploads),
+                'deleted': deleted}
+
+    def delete_prefix(self, bucket, prefix, max_workers=None):
+        """
+            Deletes every key under the Key prefix in bulk.
+        """
+        prefix = sync_prefix(prefix)
+        deleted, _ = self.delete_keys(
+            bucket,
+            ({OBJECT_KEY: content['Key']}
+             for content in self.iter_client_call(
+                'list_objects_v2', {BUCKET: bucket, 'Prefix': prefix},
+                'Contents')),
+            max_workers)
+        return deleted
+
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS S3 Bucket Object.
@@ -116,37 +284,135 @@ class S3BucketObject(S3Base):
         self.client.delete_object(**params)
 
 
-def _read_file_chunks(file_object, chunk_size=1024):
-    while True:
-        response = file_object.read(chunk_size)
-        if not response:
-            break
-        yield response
+def sync_prefix(key):
+    """The prefix which the files of a directory source are synced under."""
+    return key.rstrip('/') + '/'
 
 
-def _download_remote_file(file_url):
+def file_etag(path, multipart_threshold, multipart_chunksize):
     """
-    Try to download the file provided by the blueprint so because
-    execution directory on a manager is not the blueprint root and want to
-    make sure file is accessible by manager context
+    Computes the ETag which S3 gives a file uploaded by the transfer
+    manager: the MD5 of the file below multipart_threshold, and from
+    multipart_threshold on the MD5 of the MD5s of its parts followed by
+    the number of parts.
 
-    :param file_url: ``str``: file path under blueprint root,
-    :return: file path which can be accessed by cloudify manager
+    :param path: ``str``: local file path
+    :return: ``str``: the ETag without quotes
+    """
+    size = os.path.getsize(path)
+    if size >= multipart_threshold:
+        # The transfer manager adjusts the part size to the S3 limits.
+        from s3transfer.utils import ChunksizeAdjuster
+        multipart_chunksize = ChunksizeAdjuster().adjust_chunksize(
+            multipart_chunksize, size)
+    else:
+        multipart_chunksize = max(size, 1)
+    whole = hashlib.md5()
+    parts = []
+    with open(path, 'rb') as source:
+        for chunk in iter(lambda: source.read(multipart_chunksize), b''):
+            whole.update(chunk)
+            parts.append(hashlib.md5(chunk).digest())
+    if size < multipart_threshold:
+        return whole.hexdigest()
+    return '{0}-{1}'.format(
+        hashlib.md5(b''.join(parts)).hexdigest(), len(parts))
+
+
+def _walk_files(directory):
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            yield os.path.relpath(os.path.join(root, name), directory)
+
+
+def _extract_archive(archive, target):
+    """
+    Extracts a zip or tar archive, leaving out links and members which
+    would be written outside of the target directory.
 
+    :param archive: ``str``: archive file path
+    :param target: ``str``: directory to extract to
     """
-    # Make temp file to write file to
-    _, file_path = tempfile.mkstemp()
+    target = os.path.realpath(target)
+
+    def inside(name):
+        path = os.path.realpath(os.path.join(target, name))
+        return path.startswith(target + os.sep)
+
+    if zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as source:
+            source.extractall(
+                target, [name for name in source.namelist() if inside(name)])
+    elif tarfile.is_tarfile(archive):
+        with tarfile.open(archive) as source:
+            # Links and devices are skipped.
+            members = [member for member in source.getmembers()
+                       if member.isfile() or member.isdir()]
+            source.extractall(
+                target, [member for member in members
+                         if inside(member.name)])
+    else:
+        raise NonRecoverableError(
+            '{0} is not a zip or tar archive.'.format(archive))
 
-    # Try to download and read file url
-    target_file = urlopen(file_url)
 
-    # Open "file_path" for write
-    with open(file_path, 'wb') as fh:
-        for output in _read_file_chunks(target_file):
-            fh.write(output)
+def _download_directory(path):
+    """
+    Gets a directory of the blueprint, a local directory, or a local or
+    remote archive which is extracted to a temporary directory.
+
+    :param path: ``str``: directory or archive path or url
+    :return: the local directory and the temporary directory to remove
+    afterwards, if any
+    """
+    remote = path.startswith(('http://', 'https://'))
+    if not remote and not path.endswith(ARCHIVE_EXTENSIONS):
+        try:
+            directory = ctx.download_directory(path)
+            return directory, directory
+        except HttpException as error:
+            if os.path.isdir(path):
+                return path, None
+            _, _, tb = sys.exc_info()
+            raise NonRecoverableError(
+                '{} directory does not exist.'.format(path),
+                causes=[exception_to_error_cause(error, tb)])
+    temporary = tempfile.mkdtemp()
+    directory = os.path.join(temporary, 'files')
+    try:
+        if remote:
+            archive = os.path.join(temporary, 'archive')
+            source = _open_remote_file(path)
+            try:
+                with open(archive, 'wb') as destination:
+                    shutil.copyfileobj(source, destination, 1024 * 1024)
+            finally:
+                source.close()
+        else:
+            archive = _download_local_file(path)
+        _extract_archive(archive, directory)
+    except Exception:
+        shutil.rmtree(temporary, ignore_errors=True)
+        raise
+    return directory, temporary
+
+
+def _open_remote_file(file_url):
+    """
+    Opens the file provided by the blueprint as a stream, which is
+    uploaded while it is downloaded, without a temporary file.
+
+    :param file_url: ``str``: file url
+    :return: a file object
 
-    # Return file_path to be uploaded
-    return file_path
+    """
+    try:
+        return urlopen(file_url)
+    except (IOError, ValueError) as error:
+        _, _, tb = sys.exc_info()
+        raise NonRecoverableError(
+            'Failed to open file {0}: {1}'.format(file_url, error),
+            causes=[exception_to_error_cause(error, tb)])
 
 
 def _download_local_file(local_path):
@@ -189,39 +455,28 @@ def create(ctx, iface, resource_config, **_):
     utils.update_resource_id(ctx.instance, object_key)
     source_type = ctx.node.properties.get(OBJECT_SOURCE_TYPE)
 
-    cloudify_path = None
-    object_body = None
+    path = None
 
-    # If "source_type" is either local or remote then we need to download
-    # the file from remote or local directory and then parse the data as
-    # bytes and prepared it to be sent on the "Body" param for "put_object"
-    # method
+    # If "source_type" is either local or remote then the file is uploaded
+    # through the transfer manager, in parts sent in parallel, streaming
+    # remote files as they are downloaded.
     if source_type in [OBJECT_LOCAL_SOURCE, OBJECT_REMOTE_SOURCE]:
         path = ctx.node.properties.get(OBJECT_PATH)
         if not path:
             raise NonRecoverableError(
                 'path param must be provided when '
                 'source_type is selected as remote or local')
-
         if source_type == OBJECT_LOCAL_SOURCE:
-            cloudify_path = _download_local_file(path)
+            path = _download_local_file(path)
 
-        elif source_type == OBJECT_REMOTE_SOURCE:
-            cloudify_path = _download_remote_file(path)
-
-        try:
-            object_body = open(cloudify_path, 'rb')
-        except IOError as error:
-            _, _, tb = sys.exc_info()
+    # If "source_type" is "directory" then the files of a directory or an
+    # archive are synced under the "Key" prefix.
+    elif source_type == OBJECT_DIRECTORY_SOURCE:
+        path = ctx.node.properties.get(OBJECT_PATH)
+        if not path:
             raise NonRecoverableError(
-                'Failed to open file {}, with error message {}'.format(
-                    path,
-                    error.strerror),
-                causes=[exception_to_error_cause(error, tb)])
-
-        # Set the updated path url so that it can
-        # be uploaded to the AWS S3 bucket
-        resource_config[BUCKET_OBJECT_BODY] = object_body
+                'path param must be provided when '
+                'source_type is selected as directory')
 
     # If the "source_type" is "bytes" then the body should provided from the
     #  blueprint and follow the boto3 API documents
@@ -246,9 +501,35 @@ def create(ctx, iface, resource_config, **_):
     iface.bucket_name = bucket_name
     ctx.instance.runtime_properties[BUCKET] = bucket_name
 
+    def upload():
+        if source_type == OBJECT_LOCAL_SOURCE:
+            iface.upload(path, resource_config,
+                         ctx.node.properties.get(OBJECT_TRANSFER_CONFIG))
+        elif source_type == OBJECT_REMOTE_SOURCE:
+            # A stream is read once, so every attempt opens it again.
+            source = _open_remote_file(path)
+            try:
+                iface.upload(source, resource_config,
+                             ctx.node.properties.get(OBJECT_TRANSFER_CONFIG))
+            finally:
+                source.close()
+        elif source_type == OBJECT_DIRECTORY_SOURCE:
+            directory, temporary = _download_directory(path)
+            try:
+                summary = iface.sync_directory(
+                    directory, resource_config,
+                    ctx.node.properties.get(OBJECT_TRANSFER_CONFIG),
+                    ctx.node.properties.get(OBJECT_DELETE_STALE))
+            finally:
+                if temporary:
+                    shutil.rmtree(temporary, ignore_errors=True)
+            ctx.instance.runtime_properties[SYNC_SUMMARY] = summary
+        else:
+            iface.create(resource_config)
+
     # Actually create the resource
     try:
-        iface.create(resource_config)
+        upload()
     except NonRecoverableError as e:
         acl = resource_config.pop('ACL', '')
         if 'AccessControlListNotSupported' not in str(e) \
@@ -257,7 +538,7 @@ def create(ctx, iface, resource_config, **_):
             raise e
         ctx.logger.error('Deprecation warning, the AWS API has changed and \
                          ACL-public is no longer valid.')
-        iface.create(resource_config)
+        upload()
 
 
 @decorators.check_swift_resource
@@ -278,5 +559,9 @@ def delete(ctx, iface, resource_config, **_):
 
     iface.bucket_name = bucket_name
 
-    # Actually delete the resource
-    iface.delete(resource_config)
+    # Actually delete the resource, or every key of a synced directory.
+    if ctx.node.properties.get(OBJECT_SOURCE_TYPE) == \
+            OBJECT_DIRECTORY_SOURCE:
+        iface.delete_prefix(bucket_name, resource_config[OBJECT_KEY])
+    else:
+        iface.delete(resource_config)
@@ -26,6 +26,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.s3 import S3Base
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -47,6 +48,7 @@ class S3BucketPolicy(S3Base):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -79,6 +81,7 @@ class S3BucketPolicy(S3Base):
             params,
             fatal_handled_exceptions=ParamValidationError)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS S3 Bucket Policy.
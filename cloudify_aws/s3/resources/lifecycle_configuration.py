@@ -21,6 +21,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Local imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.s3 import S3Base
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 
@@ -43,6 +44,7 @@ class S3BucketLifecycleConfiguration(S3Base):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -77,6 +79,7 @@ class S3BucketLifecycleConfiguration(S3Base):
             params,
             fatal_handled_exceptions=ParamValidationError)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS Bucket Lifecycle Configuration Policy.
@@ -18,6 +18,7 @@
 """
 # Cloudify
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.s3 import S3Base
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ID
 # Boto
@@ -41,6 +42,7 @@ class S3BucketTagging(S3Base):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         if not self.resource_id:
@@ -68,6 +70,7 @@ class S3BucketTagging(S3Base):
             params,
             fatal_handled_exceptions=[ParamValidationError])
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS Bucket Tagging.
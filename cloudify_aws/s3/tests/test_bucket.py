@@ -13,15 +13,28 @@
 # limitations under the License.
 
 import unittest
-from mock import patch
+from mock import patch, MagicMock
+from botocore.exceptions import ClientError
 from cloudify.state import current_ctx
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify.exceptions import NonRecoverableError, OperationRetry
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DEFAULT_RUNTIME_PROPERTIES
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
-from cloudify_aws.s3.resources.bucket import S3Bucket, RESOURCE_NAME, LOCATION
+from cloudify_aws.common.constants import MAX_CONCURRENCY_ENV
+from cloudify_aws.s3.resources.bucket import (
+    S3Bucket,
+    RESOURCE_NAME,
+    LOCATION,
+    PURGE_PROGRESS
+)
 from cloudify_aws.s3.resources import bucket
 
 # Constants
+PATCH_PREFIX = 'cloudify_aws.s3.resources.bucket.'
 BUCKET_TYPE = 'cloudify.nodes.aws.s3.Bucket'
 BUCKET_TH = ['cloudify.nodes.Root',
              'cloudify.nodes.aws.s3.BaseBucket',
@@ -60,41 +73,140 @@ class TestS3Bucket(TestBase):
 
     def test_class_properties(self):
         effect = self.get_client_error_exception(name='S3 Bucket')
-        self.bucket.client = self.make_client_function('list_buckets',
+        self.bucket.client = self.make_client_function('head_bucket',
                                                        side_effect=effect)
         res = self.bucket.properties
         self.assertIsNone(res)
 
-        value = [{'Bucket': 'test_name'}]
-        self.bucket.client = self.make_client_function('list_buckets',
-                                                       return_value=value)
+        self.bucket.client = self.make_client_function(
+            'head_bucket', return_value={'BucketRegion': 'eu-west-1'})
+        self.bucket.resource_id = 'test_name'
         res = self.bucket.properties
-        self.assertIsNone(res)
+        self.assertEqual(res, {'Bucket': 'test_name',
+                               'BucketRegion': 'eu-west-1'})
+        self.bucket.client.head_bucket.assert_called_once_with(
+            Bucket='test_name')
+        self.bucket.client.get_bucket_location.assert_not_called()
 
-        self.bucket.resource_id = 'test_name'
+        self.bucket.client = self.make_client_function(
+            'head_bucket', return_value={})
+        self.make_client_function(
+            'get_bucket_location', return_value={'LocationConstraint': None},
+            client=self.bucket.client)
         res = self.bucket.properties
-        self.assertEqual(res['Bucket'], 'test_name')
+        self.assertEqual(res['BucketRegion'], 'us-east-1')
 
     def test_class_status(self):
-        value = [{'Bucket': 'test_name', 'Status': 'ok'}]
-        self.bucket.client = self.make_client_function('list_buckets',
-                                                       return_value=value)
-        res = self.bucket.status
-        self.assertIsNone(res)
-
+        self.bucket.client = self.make_client_function(
+            'head_bucket', return_value={'BucketRegion': 'eu-west-1'})
         self.bucket.resource_id = 'test_name'
-        res = self.bucket.status
-        self.assertEqual(res, 'ok')
+        self.assertEqual(self.bucket.status, 'available')
+        self.assertEqual(self.bucket.properties['Bucket'], 'test_name')
+        self.assertEqual(self.bucket.client.head_bucket.call_count, 1)
+
+        effect = self.get_client_error_exception(name='S3 Bucket')
+        self.bucket.client = self.make_client_function('head_bucket',
+                                                       side_effect=effect)
+        self.assertIsNone(self.bucket.status)
+
+    def test_class_buckets_exist(self):
+        def head_bucket(Bucket):
+            if Bucket == 'other_account':
+                raise ClientError(
+                    {'Error': {'Code': '403'}}, 'HeadBucket')
+            elif Bucket == 'missing':
+                raise ClientError(
+                    {'Error': {'Code': '404'}}, 'HeadBucket')
+            elif Bucket == 'broken':
+                raise ClientError(
+                    {'Error': {'Code': '500'}}, 'HeadBucket')
+            return {}
+
+        self.bucket.client = self.make_client_function(
+            'head_bucket', side_effect=head_bucket)
+        res = self.bucket.buckets_exist(
+            ['mine', 'other_account', 'missing', 'mine'], max_workers=3)
+        self.assertEqual(list(res.items()), [
+            ('mine', True), ('other_account', True), ('missing', False)])
+        self.assertEqual(self.bucket.client.head_bucket.call_count, 3)
+        with self.assertRaises(ClientError):
+            self.bucket.buckets_exist(['broken'])
+
+    def _versions_client(self, count):
+        versions = [{'Key': 'key{0}'.format(i), 'VersionId': 'v1'}
+                    for i in range(count)]
+        paginator = MagicMock()
+        paginator.paginate.return_value = iter([
+            {'Versions': versions[:1500]},
+            {'Versions': versions[1500:],
+             'DeleteMarkers': [{'Key': 'key0', 'VersionId': 'v2'}]}])
+        client = self.make_client_function('get_paginator',
+                                           return_value=paginator)
+        client.can_paginate.return_value = True
+        self.make_client_function('delete_objects', return_value={},
+                                  client=client)
+        return client
 
     def test_class_delete_objects(self):
-        value = {'Contents': [{'Key': 'key_id'}]}
-        self.bucket.client = self.make_client_function('list_objects',
-                                                       return_value=value)
+        self.bucket.client = self._versions_client(2500)
+        self.assertEqual(
+            self.bucket.delete_objects('bucket_name', max_workers=2),
+            (2501, True))
+
+        client = self.bucket.client
+        client.get_paginator.assert_called_once_with('list_object_versions')
+        client.get_paginator().paginate.assert_called_once_with(
+            Bucket='bucket_name')
+        batches = [call[1]['Delete']['Objects']
+                   for call in client.delete_objects.call_args_list]
+        self.assertEqual([len(batch) for batch in batches],
+                         [1000, 1000, 501])
+        self.assertEqual(batches[2][-1], {'Key': 'key0', 'VersionId': 'v2'})
+        self.assertTrue(client.delete_objects.call_args[1]['Delete']['Quiet'])
+
+    def test_class_delete_objects_errors(self):
+        self.bucket.client = self._versions_client(10)
+        self.bucket.client.delete_objects.return_value = {
+            'Errors': [{'Key': 'key1', 'Code': 'SlowDown'}]}
+        self.assertEqual(self.bucket.delete_objects('bucket_name'),
+                         (10, False))
+
+        self.bucket.client = self._versions_client(10)
+        self.bucket.client.delete_objects.return_value = {
+            'Errors': [{'Key': 'key1', 'Code': 'AccessDenied',
+                        'Message': 'Access Denied'}]}
+        with self.assertRaises(NonRecoverableError):
+            self.bucket.delete_objects('bucket_name')
+
+        # Stops between requests once past the deadline.
+        self.bucket.client = self._versions_client(2500)
+        self.assertEqual(
+            self.bucket.delete_objects('bucket_name', max_workers=1,
+                                       deadline=1),
+            (1000, False))
+        self.assertEqual(self.bucket.client.delete_objects.call_count, 1)
+        # Only keys which are left make the deletion incomplete.
+        self.bucket.client = self._versions_client(999)
+        self.assertEqual(
+            self.bucket.delete_objects('bucket_name', max_workers=1,
+                                       deadline=1),
+            (1000, True))
+
+    def test_class_delete_objects_unversioned(self):
         self.bucket.client = self.make_client_function(
-            'delete_object', return_value={}, client=self.bucket.client
-        )
-        self.bucket.resource_id = 'test_name'
-        self.bucket.delete_objects('bucket_name')
+            'list_object_versions',
+            side_effect=ClientError(
+                {'Error': {'Code': 'NotImplemented'}}, 'ListObjectVersions'))
+        self.make_client_function(
+            'list_objects', return_value={'Contents': [{'Key': 'key_id'}]},
+            client=self.bucket.client)
+        self.make_client_function(
+            'delete_objects', return_value={}, client=self.bucket.client)
+        self.assertEqual(self.bucket.delete_objects('bucket_name'),
+                         (1, True))
+        self.bucket.client.delete_objects.assert_called_once_with(
+            Bucket='bucket_name',
+            Delete={'Objects': [{'Key': 'key_id'}], 'Quiet': True})
 
     def test_class_create(self):
         value = {'Location': 'test'}
@@ -154,7 +266,7 @@ class TestS3Bucket(TestBase):
 
         bucket.create(ctx=_ctx, resource_config=None, iface=None, params=None)
 
-        self.fake_boto.assert_called_with('s3', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('s3', **CLIENT_KWARGS)
 
         self.fake_client.create_bucket.assert_called_with(Bucket='bucket')
 
@@ -177,14 +289,48 @@ class TestS3Bucket(TestBase):
 
         self.fake_client.delete_bucket = self.mock_return(DELETE_RESPONSE)
 
+        self.fake_client.list_object_versions = self.mock_return({})
         bucket.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('s3', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('s3', **CLIENT_KWARGS)
 
         self.fake_client.delete_bucket.assert_called_with(
             Bucket='bucket'
         )
 
+    def test_delete_resumes(self):
+        _ctx = self.get_mock_ctx(
+            'test_delete',
+            test_properties=NODE_PROPERTIES,
+            test_runtime_properties=dict(RUNTIME_PROPERTIES_AFTER_CREATE),
+            type_hierarchy=BUCKET_TH,
+            type_node=BUCKET_TYPE,
+            ctx_operation_name='cloudify.interfaces.lifecycle.delete'
+        )
+        current_ctx.set(_ctx)
+        self.fake_client.list_object_versions = self.mock_return(
+            {'Versions': [{'Key': 'key', 'VersionId': 'v1'},
+                          {'Key': 'key', 'VersionId': 'v2'}]})
+        self.fake_client.delete_objects = self.mock_return({})
+        self.fake_client.delete_bucket = self.mock_return(DELETE_RESPONSE)
+
+        # One key per request, so the second one is left past the budget.
+        with patch(PATCH_PREFIX + 'PURGE_TIME_BUDGET', -1):
+            with patch('cloudify_aws.s3.DELETE_BATCH_SIZE', 1):
+                with patch.dict('os.environ',
+                                {MAX_CONCURRENCY_ENV: '1'}):
+                    with self.assertRaises(OperationRetry):
+                        bucket.delete(ctx=_ctx, resource_config={},
+                                      iface=None)
+        self.assertEqual(
+            _ctx.instance.runtime_properties[PURGE_PROGRESS], {'deleted': 1})
+        self.fake_client.delete_bucket.assert_not_called()
+
+        self.fake_client.list_object_versions = self.mock_return({})
+        bucket.delete(ctx=_ctx, resource_config={}, iface=None)
+        self.assertNotIn(PURGE_PROGRESS, _ctx.instance.runtime_properties)
+        self.fake_client.delete_bucket.assert_called_with(Bucket='bucket')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,15 +13,25 @@
 # limitations under the License.
 
 # Standard Imports
+import io
+import os
 import json
+import shutil
+import hashlib
+import tarfile
 import unittest
 import datetime
 import tempfile
 
 
 # Third Party Imports
-from mock import patch, MagicMock
+import boto3
+from mock import patch, MagicMock, ANY
+from botocore.stub import Stubber
+from boto3.s3.transfer import S3Transfer
 from dateutil.tz import tzutc
+from botocore.exceptions import ClientError
+from cloudify.exceptions import NonRecoverableError
 
 # Local Imports
 from cloudify_aws.common._compat import reload_module
@@ -181,6 +191,122 @@ class TestS3BucketObject(TestBase):
         res = self.bucket_object.create(bucket_object_request)
         self.assertIsNone(res)
 
+    def test_class_upload_checksum(self):
+        client = boto3.client('s3', region_name='us-east-1',
+                              aws_access_key_id='xxx',
+                              aws_secret_access_key='yyy')
+        self.bucket_object.client = client
+        source = io.BytesIO(b'data')
+        params = {'Bucket': 'test_bucket', 'Key': 'test-object.txt'}
+        with Stubber(client) as stubber:
+            stubber.add_response(
+                'put_object', {},
+                {'Bucket': 'test_bucket', 'Key': 'test-object.txt',
+                 'Body': ANY, 'ChecksumAlgorithm': 'SHA256'})
+            self.bucket_object.upload(
+                source, params, {'checksum_algorithm': 'SHA256'})
+            stubber.assert_no_pending_responses()
+
+        # The s3transfer of the Python 3.6 requirements has no checksums.
+        allowed = [arg for arg in S3Transfer.ALLOWED_UPLOAD_ARGS
+                   if arg != 'ChecksumAlgorithm']
+        with patch.object(S3Transfer, 'ALLOWED_UPLOAD_ARGS', allowed):
+            with self.assertRaises(NonRecoverableError) as error:
+                self.bucket_object.upload(
+                    source, params, {'checksum_algorithm': 'SHA256'})
+        self.assertIn('s3transfer 0.6.0', str(error.exception))
+
+    def test_class_upload(self):
+        self.bucket_object.client = self.make_client_function('upload_file')
+        params = {'Bucket': 'test_bucket', 'Key': 'test-object.txt',
+                  'ContentType': 'text/plain'}
+        self.bucket_object.upload(
+            '/tmp/test-object.txt', params,
+            {'max_concurrency': 4, 'checksum_algorithm': 'SHA256'})
+
+        _, kwargs = self.bucket_object.client.upload_file.call_args
+        self.assertEqual(
+            self.bucket_object.client.upload_file.call_args[0],
+            ('/tmp/test-object.txt',))
+        self.assertEqual(kwargs['Bucket'], 'test_bucket')
+        self.assertEqual(kwargs['Key'], 'test-object.txt')
+        self.assertEqual(kwargs['ExtraArgs'], {
+            'ContentType': 'text/plain', 'ChecksumAlgorithm': 'SHA256'})
+        self.assertEqual(kwargs['Config'].max_concurrency, 4)
+        self.assertEqual(kwargs['Config'].multipart_chunksize,
+                         16 * 1024 * 1024)
+        self.assertEqual(kwargs['Config'].io_chunksize, 1024 * 1024)
+
+        stream = MagicMock()
+        self.bucket_object.client = self.make_client_function(
+            'upload_fileobj',
+            side_effect=ClientError({'Error': {}}, 'PutObject'))
+        with self.assertRaises(NonRecoverableError):
+            self.bucket_object.upload(stream, params)
+        self.assertIs(
+            self.bucket_object.client.upload_fileobj.call_args[0][0], stream)
+
+        with self.assertRaises(NonRecoverableError):
+            self.bucket_object.upload(stream, dict(params, ContentMD5='x'))
+
+    def test_file_etag(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'object')
+        with open(path, 'wb') as destination:
+            destination.write(b'a' * 10)
+        self.assertEqual(bucket_object.file_etag(path, 11, 4),
+                         hashlib.md5(b'a' * 10).hexdigest())
+        # ChunksizeAdjuster raises parts to the 5 MB minimum.
+        parts = hashlib.md5(b'a' * 10).digest()
+        self.assertEqual(bucket_object.file_etag(path, 10, 4),
+                         hashlib.md5(parts).hexdigest() + '-1')
+
+    def test_class_sync_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.mkdir(os.path.join(directory, 'css'))
+        for name, body in [('index.html', b'index'),
+                           (os.path.join('css', 'site.css'), b'site')]:
+            with open(os.path.join(directory, name), 'wb') as destination:
+                destination.write(body)
+        self.bucket_object.client = self.make_client_function(
+            'list_objects_v2', return_value={'Contents': [
+                {'Key': 'site/index.html',
+                 'ETag': '"{0}"'.format(hashlib.md5(b'index').hexdigest())},
+                {'Key': 'site/css/site.css', 'ETag': '"changed"'},
+                {'Key': 'site/old.html', 'ETag': '"old"'}]})
+        self.bucket_object.client.delete_objects = self.mock_return({})
+        self.bucket_object.upload = MagicMock()
+
+        summary = self.bucket_object.sync_directory(
+            directory, {'Bucket': 'test_bucket', 'Key': 'site'},
+            delete_stale=True, max_workers=1)
+
+        self.assertEqual(summary,
+                         {'uploaded': 1, 'unchanged': 1, 'deleted': 1})
+        self.bucket_object.client.list_objects_v2.assert_called_once_with(
+            Bucket='test_bucket', Prefix='site/')
+        self.bucket_object.upload.assert_called_once_with(
+            os.path.join(directory, 'css', 'site.css'),
+            {'Bucket': 'test_bucket', 'Key': 'site/css/site.css',
+             'ContentType': 'text/css'},
+            {'max_concurrency': bucket_object.SYNC_MAX_CONCURRENCY})
+        self.bucket_object.client.delete_objects.assert_called_once_with(
+            Bucket='test_bucket',
+            Delete={'Objects': [{'Key': 'site/old.html'}], 'Quiet': True})
+
+    def test_class_delete_prefix(self):
+        self.bucket_object.client = self.make_client_function(
+            'list_objects_v2', return_value={'Contents': [
+                {'Key': 'site/{0}'.format(i)} for i in range(1500)]})
+        self.bucket_object.client.delete_objects = self.mock_return({})
+
+        self.assertEqual(self.bucket_object.delete_prefix(
+            'test_bucket', 'site/', max_workers=2), 1500)
+        self.assertEqual(
+            self.bucket_object.client.delete_objects.call_count, 2)
+
     def test_class_delete(self):
         params = {
             'Bucket': 'test_bucket',
@@ -225,6 +351,81 @@ class TestS3BucketObject(TestBase):
             self.ctx.instance.runtime_properties[EXTERNAL_RESOURCE_ID],
             'test-object.txt')
 
+    def test_create_remote(self):
+        config = {'Bucket': 'test_bucket', 'Key': 'test-object.txt',
+                  'ACL': 'public-read'}
+        ctx = self.get_mock_ctx(
+            "Backet", test_properties=dict(
+                self.resource_config, source_type='remote',
+                path='http://example.com/artifact.tgz',
+                transfer_config={'multipart_chunksize': 8388608}))
+        iface = MagicMock()
+        iface.upload.side_effect = [
+            NonRecoverableError('AccessControlListNotSupported'), None]
+
+        with patch(PATCH_PREFIX + 'urlopen') as urlopen:
+            bucket_object.create(ctx=ctx, iface=iface,
+                                 resource_config=config)
+
+        # The stream is opened again for the second attempt.
+        self.assertEqual(urlopen.call_count, 2)
+        urlopen.assert_called_with('http://example.com/artifact.tgz')
+        self.assertEqual(urlopen.return_value.close.call_count, 2)
+        iface.upload.assert_called_with(
+            urlopen.return_value,
+            {'Bucket': 'test_bucket', 'Key': 'test-object.txt'},
+            {'multipart_chunksize': 8388608})
+        iface.create.assert_not_called()
+
+    def test_create_directory(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with open(os.path.join(directory, 'index.html'), 'wb') as source:
+            source.write(b'index')
+        archive = os.path.join(directory, 'site.tar.gz')
+        with tarfile.open(archive, 'w:gz') as destination:
+            destination.add(os.path.join(directory, 'index.html'),
+                            'index.html')
+            destination.add(os.path.join(directory, 'index.html'),
+                            '../escaped.html')
+        ctx = self.get_mock_ctx(
+            "Backet", test_properties=dict(
+                self.resource_config, source_type='directory',
+                path=archive, delete_stale=True))
+        iface = MagicMock()
+        synced = {}
+
+        def sync_directory(path, *_):
+            synced['files'] = sorted(os.listdir(path))
+            synced['path'] = path
+            return {'uploaded': 1, 'unchanged': 0, 'deleted': 0}
+        iface.sync_directory.side_effect = sync_directory
+
+        with patch(PATCH_PREFIX + '_download_local_file',
+                   return_value=archive):
+            bucket_object.create(
+                ctx=ctx, iface=iface,
+                resource_config={'Bucket': 'test_bucket', 'Key': 'site'})
+
+        self.assertEqual(synced['files'], ['index.html'])
+        self.assertFalse(os.path.exists(synced['path']))
+        self.assertEqual(iface.sync_directory.call_args[0][1:],
+                         ({'Bucket': 'test_bucket', 'Key': 'site'},
+                          None, True))
+        self.assertEqual(
+            ctx.instance.runtime_properties['sync_summary']['uploaded'], 1)
+
+    def test_delete_directory(self):
+        iface = MagicMock()
+        iface.resource_id = 'site'
+        ctx = self.get_mock_ctx(
+            "Backet", test_properties=dict(
+                self.resource_config, source_type='directory'))
+        ctx.instance.runtime_properties[BUCKET] = 'test_bucket'
+        bucket_object.delete(ctx=ctx, iface=iface, resource_config={})
+        iface.delete_prefix.assert_called_once_with('test_bucket', 'site')
+        iface.delete.assert_not_called()
+
     def test_delete(self):
         iface = MagicMock()
         iface.resource_id = 'test-object.txt'
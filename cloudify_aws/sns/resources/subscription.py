@@ -22,6 +22,7 @@ from botocore.exceptions import ClientError, ParamValidationError
 # Local imports
 from cloudify.exceptions import NonRecoverableError, OperationRetry
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.sns import SNSBase
 from cloudify_aws.common.constants import EXTERNAL_RESOURCE_ARN
 from .topic import SNSTopic
@@ -43,6 +44,7 @@ class SNSSubscription(SNSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
         try:
@@ -79,6 +81,7 @@ class SNSSubscription(SNSBase):
         self.logger.debug('Response: %s' % res)
         return res['Attributes']
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS SNS Subscription.
@@ -21,12 +21,14 @@ from botocore.exceptions import ClientError, ParamValidationError
 
 # Local imports
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.sns import SNSBase
 
 RESOURCE_TYPE = 'SNS Topic'
 SUB_ARN = 'SubscriptionArn'
 TOPIC_ARN = 'TopicArn'
 RESOURCE_NAME = 'Name'
+ATTRIBUTES = 'Attributes'
 
 
 class SNSTopic(SNSBase):
@@ -38,19 +40,25 @@ class SNSTopic(SNSBase):
         self.type_name = RESOURCE_TYPE
 
     @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
+        if not self.resource_id:
+            return None
         try:
-            resources = \
-                self.client.list_topics()
+            resource = self.client.get_topic_attributes(
+                TopicArn=self.resource_id)
         except (ParamValidationError, ClientError):
-            pass
-        else:
-            for resource in resources:
-                resource_arn = resource.get('TopicArn')
-                if self.resource_id == resource_arn:
-                    return resource_arn
             return None
+        return resource.get(ATTRIBUTES)
+
+    def iter_topics(self):
+        """
+            Yields the ARNs of all of the topics of the account, one
+            page of list_topics at a time.
+        """
+        for topic in self.iter_client_call('list_topics', {}, 'Topics'):
+            yield topic[TOPIC_ARN]
 
     @property
     def status(self):
@@ -59,6 +67,7 @@ class SNSTopic(SNSBase):
             return 'available'
         return None
 
+    @invalidates_properties
     def create(self, params):
         """
             Create a new AWS SNS Topic.
@@ -69,6 +78,7 @@ class SNSTopic(SNSBase):
         self.logger.debug('Response: %s' % res)
         return res['TopicArn']
 
+    @invalidates_properties
     def subscribe(self, params):
         """
             Subscribing to AWS SNS Topic.
@@ -79,6 +89,7 @@ class SNSTopic(SNSBase):
         self.logger.debug('Response: %s' % res)
         return res[SUB_ARN]
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS SNS Topic.
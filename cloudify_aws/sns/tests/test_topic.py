@@ -17,8 +17,10 @@ import unittest
 
 # Third party imports
 from mock import patch, MagicMock
+from botocore.exceptions import ClientError
 
 from cloudify.state import current_ctx
+from cloudify.exceptions import NonRecoverableError
 
 # Local imports
 from cloudify_aws.common._compat import reload_module
@@ -52,37 +54,63 @@ class TestSNSTopic(TestBase):
     def test_class_properties(self):
         effect = self.get_client_error_exception(name='S3 SNS')
         self.topic.client = self.make_client_function(
-            'list_topics',
+            'get_topic_attributes',
             side_effect=effect)
         res = self.topic.properties
         self.assertIsNone(res)
 
+        value = {'Attributes': {TOPIC_ARN: 'arn'}}
         self.topic.client = self.make_client_function(
-            'list_topics',
-            return_value={})
-        res = self.topic.properties
-        self.assertIsNone(res)
-
-        value = [{TOPIC_ARN: 'arn'}]
-        self.topic.client = self.make_client_function(
-            'list_topics',
+            'get_topic_attributes',
             return_value=value)
         self.topic.resource_id = 'arn'
         res = self.topic.properties
-        self.assertEqual(res, 'arn')
+        self.assertEqual(res, {TOPIC_ARN: 'arn'})
+        self.topic.client.get_topic_attributes.assert_called_once_with(
+            TopicArn='arn')
 
     def test_class_status(self):
+        self.topic.client = self.make_client_function(
+            'get_topic_attributes',
+            side_effect=self.get_client_error_exception(name='S3 SNS'))
         res = self.topic.status
         self.assertIsNone(res)
 
-        value = [{TOPIC_ARN: 'arn'}]
+        value = {'Attributes': {TOPIC_ARN: 'arn'}}
         self.topic.client = self.make_client_function(
-            'list_topics',
+            'get_topic_attributes',
             return_value=value)
         self.topic.resource_id = 'arn'
         res = self.topic.status
         self.assertEqual(res, 'available')
 
+    def test_class_iter_topics(self):
+        paginator = MagicMock()
+        paginator.paginate.return_value = iter([
+            {'Topics': [{TOPIC_ARN: 'arn1'}, {TOPIC_ARN: 'arn2'}]},
+            {'Topics': [{TOPIC_ARN: 'arn3'}]}])
+        self.topic.client = self.make_client_function(
+            'get_paginator', return_value=paginator)
+        self.topic.client.can_paginate.return_value = True
+        self.assertEqual(list(self.topic.iter_topics()),
+                         ['arn1', 'arn2', 'arn3'])
+        self.topic.client.get_paginator.assert_called_once_with(
+            'list_topics')
+
+    def test_class_iter_topics_error(self):
+        def pages():
+            raise ClientError(
+                {'Error': {'Code': 'AuthorizationError'}}, 'ListTopics')
+            yield
+
+        paginator = MagicMock()
+        paginator.paginate.return_value = pages()
+        self.topic.client = self.make_client_function(
+            'get_paginator', return_value=paginator)
+        self.topic.client.can_paginate.return_value = True
+        with self.assertRaises(NonRecoverableError):
+            list(self.topic.iter_topics())
+
     def test_class_create(self):
         value = {TOPIC_ARN: 'arn'}
         self.topic.client = self.make_client_function(
@@ -25,14 +25,17 @@ from botocore.exceptions import ClientError, ParamValidationError
 # Local imports
 from cloudify_aws.common._compat import text_type
 from cloudify_aws.common import decorators, utils
+from cloudify_aws.common import memoized_properties, invalidates_properties
 from cloudify_aws.sqs import SQSBase
 
 RESOURCE_TYPE = 'SQS Queue'
 RESOURCE_NAME = 'QueueName'
 QUEUE_URL = 'QueueUrl'
 QUEUE_URLS = 'QueueUrls'
+QUEUE_NAME_PREFIX = 'QueueNamePrefix'
 QUEUE_ARN = 'QueueArn'
 POLICY = 'Policy'
+ATTRIBUTES = 'Attributes'
 
 
 class SQSQueue(SQSBase):
@@ -42,21 +45,46 @@ class SQSQueue(SQSBase):
     def __init__(self, ctx_node, resource_id=None, client=None, logger=None):
         SQSBase.__init__(self, ctx_node, resource_id, client, logger)
         self.type_name = RESOURCE_TYPE
+        self._queue_urls = {}
 
     @property
+    def queue_url(self):
+        """The URL of the queue, the resource ID is its name until create
+        replaces it with the URL."""
+        if not self.resource_id:
+            return None
+        if self.resource_id.startswith(('https://', 'http://')):
+            return self.resource_id
+        if self.resource_id not in self._queue_urls:
+            self._queue_urls[self.resource_id] = self.client.get_queue_url(
+                QueueName=self.resource_id)[QUEUE_URL]
+        return self._queue_urls[self.resource_id]
+
+    @property
+    @memoized_properties
     def properties(self):
         """Gets the properties of an external resource"""
-        if not self.resource_id:
-            return
         try:
-            resource = \
-                self.client.list_queues(
-                    QueueNamePrefix=self.resource_id)
+            queue_url = self.queue_url
+            if not queue_url:
+                return None
+            resource = self.client.get_queue_attributes(
+                QueueUrl=queue_url, AttributeNames=['All'])
         except (ParamValidationError, ClientError):
-            pass
-        else:
-            return resource.get(QUEUE_URLS, [None])[0]
-        return None
+            return None
+        properties = dict(resource.get(ATTRIBUTES, {}))
+        properties[QUEUE_URL] = queue_url
+        return properties
+
+    def iter_queues(self, prefix=None):
+        """
+            Yields the URLs of the queues of the account, optionally only
+            those whose name starts with prefix, one page at a time.
+        """
+        params = {QUEUE_NAME_PREFIX: prefix} if prefix else {}
+        for queue_url in self.iter_client_call(
+                'list_queues', params, QUEUE_URLS):
+            yield queue_url
 
     @property
     def status(self):
@@ -69,6 +97,7 @@ class SQSQueue(SQSBase):
         """
         return self.make_client_call('create_queue', params)
 
+    @invalidates_properties
     def delete(self, params=None):
         """
             Deletes an existing AWS SQS Queue.
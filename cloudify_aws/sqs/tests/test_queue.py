@@ -26,7 +26,11 @@ from cloudify.state import current_ctx
 
 # Local imports
 from cloudify_aws.common._compat import text_type
-from cloudify_aws.common.tests.test_base import TestBase, CLIENT_CONFIG
+from cloudify_aws.common.tests.test_base import (
+    TestBase,
+    CLIENT_CONFIG,
+    CLIENT_KWARGS
+)
 from cloudify_aws.common.tests.test_base import DELETE_RESPONSE
 from cloudify_aws.sqs.resources import queue
 
@@ -135,7 +139,7 @@ class TestSQSQueue(TestBase):
             "Unknown service: 'sqs'. Valid service names are: ['rds']"
         )
 
-        self.fake_boto.assert_called_with('sqs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('sqs', **CLIENT_KWARGS)
 
     def test_create(self):
         _ctx = self.get_mock_ctx(
@@ -153,7 +157,7 @@ class TestSQSQueue(TestBase):
 
         queue.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('sqs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('sqs', **CLIENT_KWARGS)
 
         self.fake_client.get_queue_attributes.assert_called_with(
             AttributeNames=['QueueArn'], QueueUrl='fake_QueueUrl'
@@ -204,7 +208,7 @@ class TestSQSQueue(TestBase):
         })
         queue.create(ctx=_ctx, resource_config=None, iface=None)
 
-        self.fake_boto.assert_called_with('sqs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('sqs', **CLIENT_KWARGS)
 
         self.fake_client.create_queue.assert_called_with(
             Attributes={
@@ -239,7 +243,7 @@ class TestSQSQueue(TestBase):
 
         queue.delete(ctx=_ctx, resource_config={}, iface=None)
 
-        self.fake_boto.assert_called_with('sqs', **CLIENT_CONFIG)
+        self.fake_boto.assert_called_with('sqs', **CLIENT_KWARGS)
 
         self.fake_client.delete_queue.assert_called_with(
             QueueUrl='fake_QueueUrl'
@@ -259,6 +263,8 @@ class TestSQSQueue(TestBase):
         self.assertEqual(test_instance.status, None)
 
     def test_SQSQueueClass_properties(self):
+        self.fake_client.get_queue_url = MagicMock(
+            side_effect=self.get_client_error_exception('GetQueueUrl'))
         test_instance = queue.SQSQueue(
             "ctx_node", resource_id='queue_id', client=self.fake_client,
             logger=None
@@ -266,27 +272,58 @@ class TestSQSQueue(TestBase):
 
         self.assertEqual(test_instance.properties, None)
 
-        self.fake_client.list_queues.assert_called_with(
-            QueueNamePrefix='queue_id'
+        self.fake_client.get_queue_url.assert_called_with(
+            QueueName='queue_id'
         )
 
-    def test_SQSQueueClass_properties_list_queue(self):
-        self.fake_client.list_queues = MagicMock(
-            return_value={
-                'QueueUrls': ['c']
-            }
-        )
+    def test_SQSQueueClass_properties_get_queue_url(self):
+        self.fake_client.get_queue_url = MagicMock(
+            return_value={'QueueUrl': 'https://queue/queue_id'})
+        self.fake_client.get_queue_attributes = MagicMock(
+            return_value={'Attributes': {'QueueArn': 'arn'}})
 
         test_instance = queue.SQSQueue(
             "ctx_node", resource_id='queue_id', client=self.fake_client,
             logger=None
         )
 
-        self.assertEqual(test_instance.properties, 'c')
+        self.assertEqual(test_instance.properties, {
+            'QueueArn': 'arn',
+            'QueueUrl': 'https://queue/queue_id'
+        })
+        test_instance.invalidate_properties()
+        self.assertTrue(test_instance.properties)
 
-        self.fake_client.list_queues.assert_called_with(
-            QueueNamePrefix='queue_id'
+        self.fake_client.get_queue_url.assert_called_once_with(
+            QueueName='queue_id'
         )
+        self.fake_client.get_queue_attributes.assert_called_with(
+            QueueUrl='https://queue/queue_id', AttributeNames=['All']
+        )
+
+        # Once created, the resource ID is the URL of the queue.
+        test_instance.resource_id = 'https://queue/other'
+        test_instance.invalidate_properties()
+        self.assertEqual(test_instance.properties['QueueUrl'],
+                         'https://queue/other')
+        self.assertEqual(self.fake_client.get_queue_url.call_count, 1)
+
+    def test_SQSQueueClass_iter_queues(self):
+        paginator = MagicMock()
+        paginator.paginate.return_value = iter([
+            {'QueueUrls': ['a', 'b']}, {}, {'QueueUrls': ['c']}])
+        self.fake_client.get_paginator = MagicMock(return_value=paginator)
+        self.fake_client.can_paginate = MagicMock(return_value=True)
+
+        test_instance = queue.SQSQueue(
+            "ctx_node", client=self.fake_client, logger=None
+        )
+
+        self.assertEqual(list(test_instance.iter_queues('q')),
+                         ['a', 'b', 'c'])
+        self.fake_client.get_paginator.assert_called_once_with(
+            'list_queues')
+        paginator.paginate.assert_called_once_with(QueueNamePrefix='q')
 
 
 if __name__ == '__main__':
@@ -1,16 +1,26 @@
+from importlib import import_module
+
 from cloudify import ctx as _ctx
 from cloudify.decorators import operation
 from cloudify.exceptions import NonRecoverableError
 
 from ..common import utils
-from ..eks.resources import cluster
-from ..common.connection import Boto3Connection
+from ..common.connection import Boto3Connection, run_concurrently
 
+# Resource classes are given by path and imported only when a resource
+# type is discovered.
 TYPES_MATRIX = {
-    'AWS::EKS::CLUSTER': (cluster.EKSCluster, 'eks', 'cluster', 'name')
+    'AWS::EKS::CLUSTER': (
+        'cloudify_aws.eks.resources.cluster.EKSCluster',
+        'eks', 'cluster', 'name')
 }
 
 
+def get_class_declaration(path):
+    module_name, class_name = path.rsplit('.', 1)
+    return getattr(import_module(module_name), class_name)
+
+
 @operation
 def initialize(resource_config=None, regions=None, ctx=None, **_):
     """ Initialize an cloudify.nodes.resources.AmazonWebServices node.
@@ -62,34 +72,32 @@ def get_resources(node, regions, resource_types, logger):
     logger.info('Checking for these regions: {r}.'.format(r=regions))
     logger.info('Checking for these resource types: {t}.'.format(
         t=resource_types))
-    resources = {}
     regions = regions or get_regions(node)
-    # The structure goes resources.region.resource_type.resource, so we start
-    # with region.
-    for region in regions:
+    # Region-specific clients are pooled, so a single connection serves
+    # every region and the regions are checked concurrently.
+    connection = Boto3Connection(node)
+
+    def get_region_resources(region):
         logger.info('Checking for this region: {r}.'.format(
             r=region))
-        # then resource type.
+        region_resources = {}
         for resource_type in resource_types:
             logger.info(
                 'Checking for this resource type: {t}.'.format(
                     t=resource_type))
-            if region not in resources:
-                resources[region] = {resource_type: {}}
-            elif resource_type not in resources[region]:
-                resources[region][resource_type] = {}
+            region_resources[resource_type] = {}
             # Get the class callable, the service name, and resource_id key.
-            class_decl, service_name, type_key, resource_key = \
-                TYPES_MATRIX.get(resource_type)
+            class_path, service_name, type_key, resource_key = \
+                TYPES_MATRIX.get(resource_type, (None, None, None, None))
             # Note that the service_name needs to be updated in the Cloudify
             # AWS plugin resource module class for supporting new types.
-            if not class_decl:
+            if not class_path:
                 # It means that we don't support whatever they provided.
                 raise NonRecoverableError(
                     'Unsupported resource type: {t}.'.format(t=resource_type))
-            iface = class_decl(
+            iface = get_class_declaration(class_path)(
                 **class_declaration_attributes(
-                    node, service_name, region, logger))
+                    node, service_name, region, logger, connection))
             # Get the resource response from the API.
             # Clean it up for context serialization.
             result = utils.JsonCleanuper(iface.describe_all()).to_dict()
@@ -97,24 +105,29 @@ def get_resources(node, regions, resource_types, logger):
             for resource in result:
                 logger.debug('Checking this resource: {}'.format(resource))
                 resource_id = resource[type_key][resource_key]
-                resources[region][resource_type][resource_id] = resource
-    return resources
+                region_resources[resource_type][resource_id] = resource
+        return region_resources
+
+    # The structure goes resources.region.resource_type.resource.
+    return dict(zip(regions, run_concurrently(
+        get_region_resources, [(region,) for region in regions])))
 
 
-def class_declaration_attributes(node, service, region=None, logger=None):
+def class_declaration_attributes(node, service, region=None, logger=None,
+                                 connection=None):
     """Create the arguments for initializing the resource class.
 
     :param node: ctx node
     :param service: service name for boto3 client
     :param region: region name
     :param logger: ctx logger
+    :param connection: a Boto3Connection of the node to reuse
     :return:
     """
     logger = logger or _ctx.logger
     if region:
-        connection = Boto3Connection(node)
-        connection.aws_config['region_name'] = region
-        client = connection.client(service)
+        connection = connection or Boto3Connection(node)
+        client = connection.client_with_region(service, region)
     else:
         client = None
     attributes = {
@@ -38,7 +38,7 @@ class AWSCheckStatus(TestCase):
         with check_status.node_interface(ctx) as foo:
             self.assertIsNone(foo)
 
-    @patch('cloudify_aws.eks.Boto3Connection')
+    @patch('cloudify_aws.common.connection.Boto3Connection')
     def test_node_interface(self, *_):
         ctx = MockCloudifyContext(
             "test_node_interface",